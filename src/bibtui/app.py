@@ -4,6 +4,8 @@ import re
 import shutil
 import subprocess
 import webbrowser
+from collections import Counter
+from dataclasses import replace
 from pathlib import Path
 from string import ascii_lowercase
 from typing import cast
@@ -25,8 +27,8 @@ from bibtui.bib.citekeys import (
 )
 from bibtui.bib.models import BibEntry
 from bibtui.pdf.fetcher import pdf_filename
-from bibtui.pdf.paths import find_pdf_for_entry, format_jabref_path, parse_jabref_path
-from bibtui.utils import update_check
+from bibtui.pdf.paths import find_pdf_for_entry, format_jabref_path
+from bibtui.utils import bibcache, update_check
 from bibtui.utils.config import (
     CONFIG_PATH,
     Config,
@@ -185,11 +187,42 @@ class BibTuiApp(App):
     def __init__(self, bib_path: str | None, **kwargs):
         super().__init__(**kwargs)
         self._bib_path = bib_path
-        self._entries: list[BibEntry] = []
+        self._index: dict[str, int] = {}
+        self._entries = []
         self._dirty = False
+        self._loading = False
+        self._saving = False
+        # Bib-wide keyword frequencies, built lazily by _all_keywords().
+        self._kw_counter: Counter[str] | None = None
+        # id(entry) -> entry whose row is redrawn by the next _flush_refresh().
+        # Keyed by identity, since a .bib file may repeat a citekey.
+        self._pending_refresh: dict[int, BibEntry] = {}
+        self._refresh_scheduled = False
+        # Installed on first use and re-filled for every later edit, so the
+        # form's widgets are composed once per session.
+        self._edit_modal: EditModal | None = None
         self._first_run = is_first_run()
         self._config: Config = load_config()
 
+    @property
+    def _entries(self) -> list[BibEntry]:
+        return self._entry_list
+
+    @_entries.setter
+    def _entries(self, entries: list[BibEntry]) -> None:
+        self._entry_list = entries
+        self._reindex()
+
+    def _reindex(self) -> None:
+        """Rebuild the citekey → position index over the master list.
+
+        Duplicate keys map to their first occurrence, matching a linear scan.
+        """
+        index: dict[str, int] = {}
+        for i, e in enumerate(self._entry_list):
+            index.setdefault(e.key, i)
+        self._index = index
+
     def compose(self) -> ComposeResult:
         yield Header()
         with Horizontal(id="main-content"):
@@ -343,29 +376,50 @@ class BibTuiApp(App):
         # No text widget focused — intercept BibTeX-shaped pastes
         if event.text.strip().startswith("@"):
             event.stop()
+            if self._refuse_while_loading():
+                return
             self.push_screen(PasteModal(event.text.strip()), self._on_paste_done)
 
     def _load_entries(self) -> None:
         self.notify("Loading bibliography...", timeout=2)
-        try:
-            import shutil as _shutil
+        self._loading = True
+        self._parse_entries(self._bib_path)
 
-            bak = self._bib_path + ".bak"
+    @work(thread=True, exclusive=True, group="load")
+    def _parse_entries(self, path: str) -> None:
+        """Back up and parse *path* off the UI thread, then install the result."""
+        try:
+            bak = path + ".bak"
             if not os.path.exists(bak):
-                _shutil.copy2(self._bib_path, bak)
+                shutil.copy2(path, bak)
         except Exception:
             pass  # Missing file or permission error — silently skip backup
-        try:
-            self._entries = parser.load(self._bib_path)
-            entry_list = self.query_one(EntryList)
-            entry_list.set_pdf_base_dir(self._config.pdf_base_dir)
-            detail = self.query_one(EntryDetail)
-            detail.set_pdf_base_dir(self._config.pdf_base_dir)
-            detail.set_default_csl_style(self._config.default_citation_style)
-            entry_list.refresh_entries(self._entries)
-            self.notify(f"Loaded {len(self._entries)} entries.", timeout=3)
-        except Exception as e:
-            self.notify(f"Error loading file: {e}", severity="error")
+        entries = bibcache.load_cached(path)
+        if entries is None:
+            try:
+                entries = parser.load(path)
+            except Exception as e:
+                self.app.call_from_thread(self._on_load_error, str(e))
+                return
+            bibcache.save_cache(path, entries)
+        self.app.call_from_thread(self._install_entries, entries)
+
+    def _install_entries(self, entries: list[BibEntry]) -> None:
+        self._loading = False
+        self._entries = entries
+        self._kw_counter = None
+        entry_list = self.query_one(EntryList)
+        entry_list.set_pdf_base_dir(self._config.pdf_base_dir)
+        detail = self.query_one(EntryDetail)
+        detail.set_pdf_base_dir(self._config.pdf_base_dir)
+        detail.set_default_csl_style(self._config.default_citation_style)
+        entry_list.refresh_entries(self._entries)
+        self.notify(f"Loaded {len(self._entries)} entries.", timeout=3)
+        self.query_one(DataTable).focus()
+
+    def _on_load_error(self, message: str) -> None:
+        self._loading = False
+        self.notify(f"Error loading file: {message}", severity="error")
         self.query_one(DataTable).focus()
 
     # ── Entry selection ────────────────────────────────────────────────────
@@ -383,6 +437,9 @@ class BibTuiApp(App):
     # ── Actions ───────────────────────────────────────────────────────────
 
     async def action_quit(self) -> None:
+        if self._saving:
+            self.notify("Still writing the bibliography…", severity="warning")
+            return
         if not self._dirty:
             self.exit()
             return
@@ -402,39 +459,84 @@ class BibTuiApp(App):
         else:
             search.blur()
 
+    def _refuse_while_loading(self) -> bool:
+        """Warn and return True while the bibliography is still loading.
+
+        The load replaces the whole entry list once it finishes, so a change
+        made before then would be lost, and writing the still-empty list
+        would drop every entry from the file.
+        """
+        if self._loading:
+            self.notify("Still loading the bibliography…", severity="warning")
+        return self._loading
+
     def action_save(self) -> None:
+        if self._refuse_while_loading():
+            return
+        if self._saving:
+            self.notify("Still writing the bibliography…", severity="warning")
+            return
+        if not self._dirty:
+            self.notify("No changes to write.", timeout=2)
+            return
+        self._saving = True
+        # Edits made while the worker runs mark the library dirty again.
+        self._dirty = False
+        snapshot = [replace(e, raw_fields=dict(e.raw_fields)) for e in self._entries]
+        self._write_entries(snapshot, self._bib_path)
+
+    @work(thread=True, exclusive=True, group="save")
+    def _write_entries(self, entries: list[BibEntry], path: str) -> None:
+        """Write *entries* to *path* off the UI thread."""
         try:
-            parser.save(self._entries, self._bib_path)
-            self._dirty = False
-            self.notify("Written.", timeout=3)
+            parser.save(entries, path)
         except Exception as e:
-            self.notify(f"Write failed: {e}", severity="error")
+            self.app.call_from_thread(self._on_save_done, str(e))
+            return
+        bibcache.save_cache(path, entries)
+        self.app.call_from_thread(self._on_save_done, None)
+
+    def _on_save_done(self, error: str | None) -> None:
+        self._saving = False
+        if error is not None:
+            self._dirty = True
+            self.notify(f"Write failed: {error}", severity="error")
+            return
+        self.notify("Written.", timeout=3)
 
     def action_edit_entry(self) -> None:
+        if self._refuse_while_loading():
+            return
         entry = self.query_one(EntryList).selected_entry
         if entry is None:
             self.notify("No entry selected.", severity="warning")
             return
         if self.query_one(EntryDetail).raw_mode:
             self.push_screen(RawEditModal(entry), self._on_edit_done)
+        elif self._edit_modal is None:
+            self._edit_modal = EditModal(entry)
+            self.install_screen(self._edit_modal, "edit-entry")
+            self.push_screen(self._edit_modal, self._on_edit_done)
         else:
-            self.push_screen(EditModal(entry), self._on_edit_done)
+            self._edit_modal.load(entry)
+            self.push_screen(self._edit_modal, self._on_edit_done)
 
     def _on_edit_done(self, result: BibEntry | None) -> None:
         if result is None:
             return
         # Update in master list
-        for i, e in enumerate(self._entries):
-            if e.key == result.key:
-                self._entries[i] = result
-                break
+        i = self._index.get(result.key)
+        if i is not None:
+            self._entries[i] = result
+            self.query_one(EntryList).refresh_row(result)
+        self._kw_counter = None
         self._dirty = True
-        entry_list = self.query_one(EntryList)
-        entry_list.refresh_entries(self._entries)
         self.query_one(EntryDetail).show_entry(result)
         self.notify("Entry updated. Press [w] to write.", timeout=3)
 
     def action_paste_import(self) -> None:
+        if self._refuse_while_loading():
+            return
         self.push_screen(PasteModal(), self._on_paste_done)
 
     def _on_paste_done(self, result: BibEntry | None) -> None:
@@ -443,9 +545,13 @@ class BibTuiApp(App):
         self._finalize_imported_entry(result)
 
     def action_doi_import(self) -> None:
+        if self._refuse_while_loading():
+            return
         self.push_screen(DOIModal(), self._on_doi_done)
 
     def action_delete_entry(self) -> None:
+        if self._refuse_while_loading():
+            return
         entry = self.query_one(EntryList).selected_entry
         if entry is None:
             self.notify("No entry selected.", severity="warning")
@@ -459,9 +565,10 @@ class BibTuiApp(App):
 
     def _do_delete_entry(self, key: str) -> None:
         self._entries = [e for e in self._entries if e.key != key]
+        self._kw_counter = None
         self._dirty = True
         el = self.query_one(EntryList)
-        el.refresh_entries(self._entries)
+        el.remove_row(key, self._entries)
         self.query_one(EntryDetail).show_entry(el.selected_entry)
         self.notify(f"Deleted: {key}", timeout=3)
 
@@ -479,9 +586,9 @@ class BibTuiApp(App):
         if not base_key:
             return None, "Imported entry has no BibTeX key."
 
-        key_collisions = [entry for entry in self._entries if entry.key == base_key]
-        if not key_collisions:
+        if base_key not in self._index:
             return base_key, None
+        key_collisions = [entry for entry in self._entries if entry.key == base_key]
 
         incoming_title = self._normalized_title(incoming.title)
         for existing in key_collisions:
@@ -491,10 +598,9 @@ class BibTuiApp(App):
                     f"BibTeX key '{base_key}' already exists for the same title.",
                 )
 
-        used_keys = {entry.key for entry in self._entries}
         for suffix in ascii_lowercase:
             candidate = f"{base_key}{suffix}"
-            if candidate not in used_keys:
+            if candidate not in self._index:
                 return candidate, None
 
         return (
@@ -510,11 +616,13 @@ class BibTuiApp(App):
             return
 
         entry.key = resolved_key or entry.key
+        self._index.setdefault(entry.key, len(self._entries))
         self._entries.append(entry)
+        self._kw_counter = None
         self._dirty = True
-        el = self.query_one(EntryList)
-        el.refresh_entries(self._entries)
-        self.call_after_refresh(self._jump_to_entry, entry)
+        row = self.query_one(EntryList).append_row(entry)
+        if row is not None:
+            self.call_after_refresh(self._jump_to_entry, entry, row)
 
         if entry.key != old_key:
             self.notify(
@@ -526,15 +634,10 @@ class BibTuiApp(App):
 
         self._maybe_auto_fetch(entry)
 
-    def _jump_to_entry(self, result: BibEntry) -> None:
-        """Move cursor to the given entry after the table has been rendered."""
-        el = self.query_one(EntryList)
-        try:
-            idx = next(i for i, e in enumerate(el._filtered) if e.key == result.key)
-            self.query_one(DataTable).move_cursor(row=idx)
-            self.query_one(EntryDetail).show_entry(result)
-        except StopIteration:
-            pass
+    def _jump_to_entry(self, result: BibEntry, row: int) -> None:
+        """Move cursor to *result*'s *row* after the table has been rendered."""
+        self.query_one(DataTable).move_cursor(row=row)
+        self.query_one(EntryDetail).show_entry(result)
 
     def _maybe_auto_fetch(self, entry: BibEntry) -> None:
         """Trigger PDF fetch after import if the setting is enabled and prerequisites are met."""
@@ -584,6 +687,8 @@ class BibTuiApp(App):
             self.notify("Opening OpenAlex (DOI search)", timeout=3)
 
     def action_fetch_pdf(self) -> None:
+        if self._refuse_while_loading():
+            return
         entry = self.query_one(EntryList).selected_entry
         if entry is None:
             self.notify("No entry selected.", severity="warning")
@@ -603,7 +708,7 @@ class BibTuiApp(App):
             return
         dest_path = os.path.join(dest_dir, pdf_filename(entry))
         has_valid_link = bool(
-            entry.file and os.path.exists(parse_jabref_path(entry.file, dest_dir))
+            entry.file and os.path.exists(entry.resolved_file(dest_dir))
         )
         if os.path.exists(dest_path):
             if not has_valid_link:
@@ -648,6 +753,8 @@ class BibTuiApp(App):
         )
 
     def action_add_pdf(self) -> None:
+        if self._refuse_while_loading():
+            return
         entry = self.query_one(EntryList).selected_entry
         if entry is None:
             self.notify("No entry selected.", severity="warning")
@@ -687,9 +794,14 @@ class BibTuiApp(App):
         if not entry.file:
             self.notify("No PDF linked for this entry.", severity="warning")
             return
-        path = find_pdf_for_entry(entry.file, entry.key, self._config.pdf_base_dir)
+        base_dir = self._config.pdf_base_dir
+        stored = entry.resolved_file(base_dir)
+        path = (
+            stored
+            if os.path.exists(stored)
+            else find_pdf_for_entry("", entry.key, base_dir)
+        )
         if not path:
-            stored = parse_jabref_path(entry.file, self._config.pdf_base_dir)
             self.notify(f"PDF not found: {stored}", severity="error", timeout=5)
             return
         try:
@@ -718,6 +830,8 @@ class BibTuiApp(App):
         self.notify("Copied PDF path.", timeout=3)
 
     def action_pdf_delete(self) -> None:
+        if self._refuse_while_loading():
+            return
         entry, path = self._selected_entry_pdf_path()
         if entry is None or path is None:
             return
@@ -805,7 +919,8 @@ class BibTuiApp(App):
                 self.notify(f"Could not delete PDF: {e}", severity="error", timeout=5)
                 return
 
-        entry = next((e for e in self._entries if e.key == entry_key), None)
+        i = self._index.get(entry_key)
+        entry = self._entries[i] if i is not None else None
         if entry is not None:
             entry.file = ""
             self._dirty = True
@@ -820,6 +935,8 @@ class BibTuiApp(App):
             self.notify(f"PDF already missing; link removed: {entry_key}", timeout=4)
 
     def action_set_rating(self, value: str) -> None:
+        if self._refuse_while_loading():
+            return
         entry = self.query_one(EntryList).selected_entry
         if entry is None:
             return
@@ -827,28 +944,53 @@ class BibTuiApp(App):
             rating = max(0, min(5, int(value)))
         except ValueError:
             return
+        if entry.rating == rating:
+            return
         entry.rating = rating
         self._dirty = True
-        self.query_one(EntryList).refresh_row(entry)
-        self.query_one(EntryDetail).show_entry(entry)
+        self._schedule_row_refresh(entry)
 
     def action_cycle_read_state(self) -> None:
+        if self._refuse_while_loading():
+            return
         entry = self.query_one(EntryList).selected_entry
         if entry is None:
             return
         entry.cycle_read_state()
         self._dirty = True
-        self.query_one(EntryList).refresh_row(entry)
-        self.query_one(EntryDetail).show_entry(entry)
+        self._schedule_row_refresh(entry)
 
     def action_cycle_priority(self) -> None:
+        if self._refuse_while_loading():
+            return
         entry = self.query_one(EntryList).selected_entry
         if entry is None:
             return
         entry.cycle_priority()
         self._dirty = True
-        self.query_one(EntryList).refresh_row(entry)
-        self.query_one(EntryDetail).show_entry(entry)
+        self._schedule_row_refresh(entry)
+
+    def _schedule_row_refresh(self, entry: BibEntry) -> None:
+        """Redraw *entry*'s row (and the detail pane) once the queue drains.
+
+        Rapid keypresses then cost one redraw per touched row instead of one
+        per key.
+        """
+        self._pending_refresh[id(entry)] = entry
+        if not self._refresh_scheduled:
+            self._refresh_scheduled = True
+            self.call_later(self._flush_refresh)
+
+    def _flush_refresh(self) -> None:
+        pending = self._pending_refresh
+        self._pending_refresh = {}
+        self._refresh_scheduled = False
+        entry_list = self.query_one(EntryList)
+        for entry in pending.values():
+            entry_list.refresh_row(entry)
+        selected = entry_list.selected_entry
+        if selected is not None and id(selected) in pending:
+            self.query_one(EntryDetail).show_entry(selected)
 
     def action_settings(self) -> None:
         self.push_screen(SettingsModal(self._config), self._on_settings_done)
@@ -863,9 +1005,13 @@ class BibTuiApp(App):
         self.notify("Theme reset to auto (Omarchy/OS).", timeout=2)
 
     def action_fetch_missing_pdfs(self) -> None:
+        if self._refuse_while_loading():
+            return
         self._start_library_fetch_missing_pdfs()
 
     def action_unify_citekeys(self) -> None:
+        if self._refuse_while_loading():
+            return
         self._start_library_unify_citekeys()
 
     def _start_library_fetch_missing_pdfs(self) -> None:
@@ -918,7 +1064,7 @@ class BibTuiApp(App):
         linked = 0
         for entry in self._entries:
             stored_valid = bool(
-                entry.file and os.path.exists(parse_jabref_path(entry.file, base_dir))
+                entry.file and os.path.exists(entry.resolved_file(base_dir))
             )
             if stored_valid:
                 continue
@@ -1101,6 +1247,7 @@ class BibTuiApp(App):
 
             entry.key = new_key
 
+        self._reindex()
         self._dirty = True
         self.query_one(EntryList).refresh_entries(self._entries)
         selected = self.query_one(EntryList).selected_entry
@@ -1229,6 +1376,8 @@ class BibTuiApp(App):
         self.notify(f"Copied citation: {entry.key}", timeout=2)
 
     def action_edit_keywords(self) -> None:
+        if self._refuse_while_loading():
+            return
         entry = self.query_one(EntryList).selected_entry
         if entry is None:
             self.notify("No entry selected.", severity="warning")
@@ -1240,12 +1389,10 @@ class BibTuiApp(App):
 
     def _all_keywords(self) -> tuple[list[str], dict[str, int]]:
         """All unique keywords across the bib file, sorted by frequency descending."""
-        from collections import Counter
-
-        counter: Counter[str] = Counter()
-        for e in self._entries:
-            for kw in e.keywords_list:
-                counter[kw] += 1
+        counter = self._kw_counter
+        if counter is None:
+            counter = Counter(kw for e in self._entries for kw in e.keywords_list)
+            self._kw_counter = counter
         return [kw for kw, _ in counter.most_common()], dict(counter)
 
     def _on_keywords_done(self, result: tuple[str, set[str]] | None) -> None:
@@ -1255,13 +1402,27 @@ class BibTuiApp(App):
         entry = self.query_one(EntryList).selected_entry
         if entry is None:
             return
+        counter = self._kw_counter
+        if counter is not None:
+            counter.subtract(entry.keywords_list)
         entry.keywords = keywords_str
+        if counter is not None:
+            counter.update(entry.keywords_list)
         if delete_everywhere:
             for e in self._entries:
                 if e is not entry:
                     kept = [k for k in e.keywords_list if k not in delete_everywhere]
                     e.keywords = ", ".join(kept)
+            if counter is not None:
+                for kw in delete_everywhere:
+                    counter.pop(kw, None)
+        if counter is not None:
+            for kw in [kw for kw, n in counter.items() if n <= 0]:
+                del counter[kw]
         self._dirty = True
-        self.query_one(EntryList).refresh_entries(self._entries)
-        self.query_one(EntryDetail).show_entry(entry)
+        if delete_everywhere:
+            self.query_one(EntryList).refresh_entries(self._entries)
+            self.query_one(EntryDetail).show_entry(entry)
+        else:
+            self._schedule_row_refresh(entry)
         self.notify("Keywords updated. Press [w] to write.", timeout=3)
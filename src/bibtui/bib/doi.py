@@ -1,14 +1,49 @@
+import dataclasses
 import re
-
-from habanero import Crossref
+import threading
+import time
+from typing import TYPE_CHECKING
 
 from bibtui.utils.dates import now_date_added_value
 
 from .citekeys import author_year_base
 from .models import BibEntry
 
-
-def _journal_for_preprint(msg: dict, doi: str, cr: Crossref) -> str:
+if TYPE_CHECKING:
+    from habanero import Crossref
+
+
+# Crossref work type → BibTeX entry type; anything else becomes "misc".
+_CROSSREF_TYPE_MAP: dict[str, str] = {
+    "journal-article": "article",
+    "proceedings-article": "inproceedings",
+    "book": "book",
+    "book-chapter": "incollection",
+    "dissertation": "phdthesis",
+    "report": "techreport",
+    "dataset": "misc",
+    "posted-content": "misc",
+}
+
+# Crossref message key → BibTeX field, copied into raw_fields when present.
+_RAW_FIELD_MAP: tuple[tuple[str, str], ...] = (
+    ("volume", "volume"),
+    ("issue", "number"),
+    ("page", "pages"),
+    ("publisher", "publisher"),
+)
+
+
+def _format_author(author: dict) -> str:
+    """Return ``Family, Given`` (or just ``Family``); empty without a family name."""
+    family = author.get("family", "")
+    given = author.get("given", "")
+    if family and given:
+        return f"{family}, {given}"
+    return family
+
+
+def _journal_for_preprint(msg: dict, doi: str, cr: "Crossref") -> str:
     """Derive the journal name for a posted-content preprint with no container-title.
 
     Strategy:
@@ -67,6 +102,9 @@ def _journal_for_preprint(msg: dict, doi: str, cr: Crossref) -> str:
 
 
 def fetch_by_doi(doi: str) -> BibEntry:
+    # habanero pulls in requests; keep it off the startup path.
+    from habanero import Crossref
+
     cr = Crossref()
     result = cr.works(ids=doi)
     msg = result["message"]
@@ -78,16 +116,7 @@ def fetch_by_doi(doi: str) -> BibEntry:
         return str(val) if val else ""
 
     # Authors
-    authors = msg.get("author", [])
-    author_parts = []
-    for a in authors:
-        family = a.get("family", "")
-        given = a.get("given", "")
-        if family and given:
-            author_parts.append(f"{family}, {given}")
-        elif family:
-            author_parts.append(family)
-    author_str = " and ".join(author_parts)
+    author_str = " and ".join(filter(None, map(_format_author, msg.get("author", []))))
 
     # Year
     year = ""
@@ -114,34 +143,15 @@ def fetch_by_doi(doi: str) -> BibEntry:
 
     # Entry type
     crossref_type = msg.get("type", "journal-article")
-    type_map = {
-        "journal-article": "article",
-        "proceedings-article": "inproceedings",
-        "book": "book",
-        "book-chapter": "incollection",
-        "dissertation": "phdthesis",
-        "report": "techreport",
-        "dataset": "misc",
-        "posted-content": "misc",
-    }
-    entry_type = type_map.get(crossref_type, "misc")
+    entry_type = _CROSSREF_TYPE_MAP.get(crossref_type, "misc")
 
     # Build citation key: AuthorYear (normalized)
     key = author_year_base(author_str, year)
 
     raw: dict[str, str] = {
         "date-added": now_date_added_value(),
+        **{dst: str(msg[src]) for src, dst in _RAW_FIELD_MAP if msg.get(src)},
     }
-    if msg.get("volume"):
-        raw["volume"] = str(msg["volume"])
-    if msg.get("issue"):
-        raw["number"] = str(msg["issue"])
-    page = msg.get("page", "")
-    if page:
-        raw["pages"] = str(page)
-    publisher = msg.get("publisher", "")
-    if publisher:
-        raw["publisher"] = publisher
 
     return BibEntry(
         key=key,
@@ -153,3 +163,36 @@ def fetch_by_doi(doi: str) -> BibEntry:
         doi=doi,
         raw_fields=raw,
     )
+
+
+# How long a Crossref answer is reused by fetch_by_doi_cached, in seconds.
+LOOKUP_TTL = 24 * 3600
+
+_lookup_lock = threading.Lock()
+# Normalised DOI -> (fetched at, entry).  Kept in memory only; re-entering a
+# DOI within a session is the case worth saving a round-trip for.
+_lookups: dict[str, tuple[float, BibEntry]] = {}
+
+
+def fetch_by_doi_cached(doi: str) -> BibEntry:
+    """Like :func:`fetch_by_doi`, but reuse a lookup of the same DOI.
+
+    DOIs are matched case-insensitively.  Each call returns a fresh entry
+    with a current date-added stamp, so callers may edit it freely.  Failed
+    lookups are not cached.
+    """
+    doi = doi.strip()
+    key = doi.lower()
+    now = time.time()
+    with _lookup_lock:
+        hit = _lookups.get(key)
+    if hit is None or now - hit[0] > LOOKUP_TTL:
+        entry = fetch_by_doi(doi)
+        with _lookup_lock:
+            _lookups[key] = (now, entry)
+    else:
+        entry = hit[1]
+    return dataclasses.replace(
+        entry,
+        raw_fields={**entry.raw_fields, "date-added": now_date_added_value()},
+    )
@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from dataclasses import dataclass, field
 
 READ_STATES: list[str] = ["", "to-read", "skimmed", "read"]
@@ -87,7 +88,7 @@ ENTRY_TYPES: dict[str, dict[str, list[str]]] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class BibEntry:
     key: str
     entry_type: str
@@ -105,6 +106,30 @@ class BibEntry:
     priority: int = 0  # 0=unset, 1=high, 2=medium, 3=low (JabRef prio1/prio2/prio3)
     file: str = ""
     raw_fields: dict[str, str] = field(default_factory=dict)
+    # (source, result) memos for the list columns; stale once the source
+    # field is reassigned, so direct attribute writes invalidate them too.
+    _authors_short_cache: tuple[str, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _title_short_cache: tuple[str, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _resolved_file_cache: tuple[str, str, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _keywords_list_cache: tuple[str, list[str]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _search_blob_cache: tuple[str, str, str, str, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _year_number_cache: tuple[str, int] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # field name -> (source, lowercased source), for the search filters.
+    _lowered_cache: dict[str, tuple[str, str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     @property
     def url_icon(self) -> str:
@@ -113,20 +138,36 @@ class BibEntry:
     @property
     def authors_short(self) -> str:
         """Return first author surname or 'Unknown'."""
-        if not self.author:
-            return "Unknown"
-        parts = self.author.split(" and ")
-        first = parts[0].strip()
-        if "," in first:
-            return first.split(",")[0].strip()
-        words = first.split()
-        return words[-1] if words else first
+        cache = self._authors_short_cache
+        if cache is not None and cache[0] is self.author:
+            return cache[1]
+        result = _first_surname(self.author)
+        self._authors_short_cache = (self.author, result)
+        return result
 
     @property
     def title_short(self) -> str:
-        if len(self.title) <= 60:
-            return self.title
-        return self.title[:57] + "..."
+        cache = self._title_short_cache
+        if cache is not None and cache[0] is self.title:
+            return cache[1]
+        title = self.title
+        result = title if len(title) <= 60 else title[:57] + "..."
+        self._title_short_cache = (title, result)
+        return result
+
+    def resolved_file(self, base_dir: str = "") -> str:
+        """Return the ``file`` field as a path, resolved against *base_dir*.
+
+        Only the parsing is cached; whether the file exists is not.
+        """
+        cache = self._resolved_file_cache
+        if cache is not None and cache[0] is self.file and cache[1] == base_dir:
+            return cache[2]
+        from bibtui.pdf.paths import parse_jabref_path
+
+        path = parse_jabref_path(self.file, base_dir) if self.file else ""
+        self._resolved_file_cache = (self.file, base_dir, path)
+        return path
 
     @property
     def read_state_icon(self) -> str:
@@ -151,7 +192,61 @@ class BibEntry:
 
     @property
     def keywords_list(self) -> list[str]:
-        return [k.strip() for k in self.keywords.split(",") if k.strip()]
+        """Return the parsed keywords; shared between calls, do not mutate."""
+        cache = self._keywords_list_cache
+        if cache is not None and cache[0] is self.keywords:
+            return cache[1]
+        keywords = self.keywords
+        result = [k.strip() for k in keywords.split(",") if k.strip()]
+        self._keywords_list_cache = (keywords, result)
+        return result
+
+    @property
+    def search_blob(self) -> str:
+        """Lowercased title, author, keywords and key for free-text search.
+
+        Fields are newline-separated, so a whitespace-free term cannot match
+        across two of them.
+        """
+        c = self._search_blob_cache
+        if (
+            c is not None
+            and c[0] is self.title
+            and c[1] is self.author
+            and c[2] is self.keywords
+            and c[3] is self.key
+        ):
+            return c[4]
+        blob = f"{self.title}\n{self.author}\n{self.keywords}\n{self.key}".lower()
+        self._search_blob_cache = (
+            self.title,
+            self.author,
+            self.keywords,
+            self.key,
+            blob,
+        )
+        return blob
+
+    @property
+    def year_number(self) -> int:
+        """Return the year as an int, or 0 if it is not a plain number."""
+        cache = self._year_number_cache
+        if cache is not None and cache[0] is self.year:
+            return cache[1]
+        year = self.year
+        result = int(year) if year.isdigit() else 0
+        self._year_number_cache = (year, result)
+        return result
+
+    def lowered(self, name: str) -> str:
+        """Return the string field *name* lowercased, cached per value."""
+        value = getattr(self, name)
+        cache = self._lowered_cache.get(name)
+        if cache is not None and cache[0] is value:
+            return cache[1]
+        result = value.lower()
+        self._lowered_cache[name] = (value, result)
+        return result
 
     @property
     def rating_stars(self) -> str:
@@ -160,51 +255,59 @@ class BibEntry:
         return "★" * self.rating
 
     def get_field(self, name: str) -> str:
-        if name == "title":
-            return self.title
-        if name == "author":
-            return self.author
-        if name == "year":
-            return self.year
-        if name == "journal":
-            return self.journal
-        if name == "doi":
-            return self.doi
-        if name == "url":
-            return self.url
-        if name == "abstract":
-            return self.abstract
-        if name == "keywords":
-            return self.keywords
-        if name == "rating":
-            return str(self.rating)
-        if name == "file":
-            return self.file
+        getter = _FIELD_GETTERS.get(name)
+        if getter is not None:
+            return getter(self)
         return self.raw_fields.get(name, "")
 
     def set_field(self, name: str, value: str) -> None:
-        if name == "title":
-            self.title = value
-        elif name == "author":
-            self.author = value
-        elif name == "year":
-            self.year = value
-        elif name == "journal":
-            self.journal = value
-        elif name == "doi":
-            self.doi = value
-        elif name == "url":
-            self.url = value
-        elif name == "abstract":
-            self.abstract = value
-        elif name == "keywords":
-            self.keywords = value
-        elif name == "rating":
-            try:
-                self.rating = max(0, min(5, int(value)))
-            except ValueError:
-                pass
-        elif name == "file":
-            self.file = value
+        setter = _FIELD_SETTERS.get(name)
+        if setter is not None:
+            setter(self, value)
         else:
             self.raw_fields[name] = value
+
+
+def _first_surname(author: str) -> str:
+    if not author:
+        return "Unknown"
+    first = author.split(" and ")[0].strip()
+    if "," in first:
+        return first.split(",")[0].strip()
+    words = first.split()
+    return words[-1] if words else first
+
+
+def _set_rating(entry: BibEntry, value: str) -> None:
+    try:
+        entry.rating = max(0, min(5, int(value)))
+    except ValueError:
+        pass
+
+
+# Named-field dispatch for get_field/set_field; other names use raw_fields.
+_FIELD_GETTERS: dict[str, Callable[[BibEntry], str]] = {
+    "title": lambda e: e.title,
+    "author": lambda e: e.author,
+    "year": lambda e: e.year,
+    "journal": lambda e: e.journal,
+    "doi": lambda e: e.doi,
+    "url": lambda e: e.url,
+    "abstract": lambda e: e.abstract,
+    "keywords": lambda e: e.keywords,
+    "rating": lambda e: str(e.rating),
+    "file": lambda e: e.file,
+}
+
+_FIELD_SETTERS: dict[str, Callable[[BibEntry, str], None]] = {
+    "title": lambda e, v: setattr(e, "title", v),
+    "author": lambda e, v: setattr(e, "author", v),
+    "year": lambda e, v: setattr(e, "year", v),
+    "journal": lambda e, v: setattr(e, "journal", v),
+    "doi": lambda e, v: setattr(e, "doi", v),
+    "url": lambda e, v: setattr(e, "url", v),
+    "abstract": lambda e, v: setattr(e, "abstract", v),
+    "keywords": lambda e, v: setattr(e, "keywords", v),
+    "rating": _set_rating,
+    "file": lambda e, v: setattr(e, "file", v),
+}
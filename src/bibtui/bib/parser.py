@@ -1,3 +1,14 @@
+import dataclasses
+import functools
+import itertools
+import multiprocessing
+import os
+import re
+import stat
+import tempfile
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 
 import bibtexparser
@@ -21,6 +32,10 @@ class _SourceBlock:
         self.bp_entry: bpmodel.Entry | None = None
 
 
+_BRACES_RE = re.compile(r"[{}]")
+_PARENS_RE = re.compile(r"[()]")
+
+
 def _find_block_end(text: str, open_idx: int, open_char: str, close_char: str) -> int:
     """Find the closing delimiter of a BibTeX block, tracking brace/paren depth.
 
@@ -28,14 +43,14 @@ def _find_block_end(text: str, open_idx: int, open_char: str, close_char: str) -
     preceding backslash, so no escape-skipping is performed here.
     """
     depth = 0
-    for i in range(open_idx, len(text)):
-        ch = text[i]
-        if ch == open_char:
+    delimiters = _BRACES_RE if open_char == "{" else _PARENS_RE
+    for m in delimiters.finditer(text, open_idx):
+        if m.group() == open_char:
             depth += 1
-        elif ch == close_char:
+        else:
             depth -= 1
             if depth == 0:
-                return i + 1
+                return m.end()
     return -1
 
 
@@ -278,41 +293,75 @@ def _validate_entry_text(entry_text: str, expected_key: str) -> bool:
     return lib.entries[0].key == expected_key
 
 
+_WRITE_BUFFER = 4 * 1024 * 1024
+
+
+def _current_umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# Mode for a library that does not exist yet, as open() would create it.  The
+# umask can only be read by changing it, so do that once, at import, rather
+# than while other threads may be creating files.
+_NEW_FILE_MODE = 0o666 & ~_current_umask()
+
+
+def _write_atomic(path: str, text: str) -> None:
+    """Replace the contents of *path* with *text* in one buffered write.
+
+    The text goes to a temporary file next to the target, which is then
+    renamed over it, so a crash mid-write never leaves a truncated library.
+    Symlinks are followed and the original file mode is kept; a new file
+    gets the usual mode for the umask instead of the temporary file's 0600.
+    """
+    target = os.path.realpath(path)
+    try:
+        mode = stat.S_IMODE(os.stat(target).st_mode)
+    except OSError:
+        mode = _NEW_FILE_MODE
+    directory, name = os.path.split(target)
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{name}.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", buffering=_WRITE_BUFFER) as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, target)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def _full_rewrite(entries: list[BibEntry], path: str) -> None:
     lib = bibtexparser.Library()
     for entry in entries:
         lib.add(_to_bp_entry(entry))
-    bibtexparser.write_file(path, lib)
-
+    _write_atomic(path, bibtexparser.write_string(lib))
 
-def _field_str(entry: bpmodel.Entry, key: str) -> str:
-    """Extract string value from a bibtexparser Entry field, stripping outer braces.
 
-    Field name lookup is case-insensitive: ``AUTHOR`` and ``author`` both work.
-    """
-    # bibtexparser v2 preserves original casing — search case-insensitively
-    f = entry.fields_dict.get(key) or entry.fields_dict.get(key.upper())
-    if f is None:
-        # Full case-insensitive scan as final fallback
-        key_lower = key.lower()
-        for k, v in entry.fields_dict.items():
-            if k.lower() == key_lower:
-                f = v
-                break
-    if f is None:
+def _field_value(field: bpmodel.Field) -> str:
+    """Return the string value of *field*, stripping outer braces."""
+    val = field.value
+    if not isinstance(val, str):
+        return str(val).strip()
+    if not val:
         return ""
-    val = f.value
-    if isinstance(val, str):
-        val = val.strip()
-        # Strip outer curly braces that BibTeX uses for case protection
-        if val.startswith("{") and val.endswith("}"):
-            val = val[1:-1]
-        return val
-    return str(val).strip()
+    val = val.strip()
+    # Strip outer curly braces that BibTeX uses for case protection.  Indexing
+    # avoids two method calls per field on this hot path.
+    if len(val) >= 2 and val[0] == "{" and val[-1] == "}":
+        return val[1:-1]
+    return val
 
 
-def _to_bib_entry(entry: bpmodel.Entry) -> BibEntry:
-    known = {
+_KNOWN_FIELDS = frozenset(
+    {
         "title",
         "author",
         "year",
@@ -327,15 +376,26 @@ def _to_bib_entry(entry: bpmodel.Entry) -> BibEntry:
         "priority",
         "file",
     }
+)
+
+
+def _to_bib_entry(entry: bpmodel.Entry) -> BibEntry:
+    # bibtexparser v2 rebuilds fields_dict on every access and preserves the
+    # original casing, so snapshot it once and match names case-insensitively.
+    known: dict[str, str] = {}
     raw = {}
     for k, f in entry.fields_dict.items():
         # Normalise to lowercase so raw_fields are always consistent
         k_norm = k.lower()
-        if k_norm not in known:
+        if k_norm not in _KNOWN_FIELDS:
             val = f.value
             raw[k_norm] = val if isinstance(val, str) else str(val)
+        elif k == k_norm or k_norm not in known:
+            # An exact lowercase name wins over other casings.
+            known[k_norm] = _field_value(f)
+    get = known.get
 
-    ranking_str = _field_str(entry, "ranking")  # JabRef format: rank1..rank5
+    ranking_str = get("ranking", "")  # JabRef format: rank1..rank5
     try:
         rating = (
             max(0, min(5, int(ranking_str.removeprefix("rank")))) if ranking_str else 0
@@ -343,7 +403,7 @@ def _to_bib_entry(entry: bpmodel.Entry) -> BibEntry:
     except ValueError:
         rating = 0
 
-    priority_str = _field_str(entry, "priority")  # JabRef format: prio1..prio3
+    priority_str = get("priority", "")  # JabRef format: prio1..prio3
     try:
         priority = (
             max(0, min(3, int(priority_str.removeprefix("prio"))))
@@ -353,26 +413,26 @@ def _to_bib_entry(entry: bpmodel.Entry) -> BibEntry:
     except ValueError:
         priority = 0
 
-    read_state = _field_str(entry, "readstatus")  # JabRef field name
+    read_state = get("readstatus", "")  # JabRef field name
     if read_state not in READ_STATES:
         read_state = ""
 
     return BibEntry(
         key=entry.key,
         entry_type=entry.entry_type,
-        title=_field_str(entry, "title"),
-        author=_field_str(entry, "author"),
-        year=_field_str(entry, "year"),
-        journal=_field_str(entry, "journal"),
-        doi=_field_str(entry, "doi"),
-        url=_field_str(entry, "url"),
-        abstract=_field_str(entry, "abstract"),
-        keywords=_field_str(entry, "keywords"),
-        comment=_field_str(entry, "comment"),
+        title=get("title", ""),
+        author=get("author", ""),
+        year=get("year", ""),
+        journal=get("journal", ""),
+        doi=get("doi", ""),
+        url=get("url", ""),
+        abstract=get("abstract", ""),
+        keywords=get("keywords", ""),
+        comment=get("comment", ""),
         rating=rating,
         read_state=read_state,
         priority=priority,
-        file=_field_str(entry, "file"),
+        file=get("file", ""),
         raw_fields=raw,
     )
 
@@ -410,8 +470,27 @@ def _to_bp_entry(entry: BibEntry) -> bpmodel.Entry:
     return bpmodel.Entry(key=entry.key, entry_type=entry.entry_type, fields=fields)
 
 
+# BibEntry's constructor fields other than raw_fields, in declaration order.
+_SNAPSHOT_FIELDS = tuple(
+    f.name for f in dataclasses.fields(BibEntry) if f.init and f.name != "raw_fields"
+)
+
+
 def entry_to_bibtex_str(entry: BibEntry) -> str:
-    """Serialize a single BibEntry to a BibTeX string."""
+    """Serialize a single BibEntry to a BibTeX string.
+
+    Memoized on the entry's field values: the raw view, the raw editor and
+    the clipboard copy serialize the same unchanged entry again and again.
+    """
+    values = tuple(getattr(entry, name) for name in _SNAPSHOT_FIELDS)
+    return _bibtex_str(values, tuple(entry.raw_fields.items()))
+
+
+@functools.lru_cache(maxsize=64)
+def _bibtex_str(values: tuple, raw_items: tuple[tuple[str, str], ...]) -> str:
+    entry = BibEntry(
+        **dict(zip(_SNAPSHOT_FIELDS, values, strict=True)), raw_fields=dict(raw_items)
+    )
     lib = bibtexparser.Library()
     lib.add(_to_bp_entry(entry))
     return bibtexparser.write_string(lib)
@@ -428,9 +507,103 @@ def bibtex_str_to_entry(text: str) -> BibEntry:
     return _to_bib_entry(lib.entries[0])
 
 
+_BLOCK_START_RE = re.compile(r"@\s*([A-Za-z]+)\s*([{(])")
+_LOAD_BATCH_CHARS = 1024 * 1024
+_PARALLEL_MIN_BATCHES = 8
+
+
+def _iter_load_batches(text: str) -> Iterator[tuple[str, str]]:
+    """Split *text* into ``(batch, strings)`` pairs of roughly 1 MiB each.
+
+    Batches are contiguous slices of *text* cut only after a complete
+    ``@TYPE{...}`` block.  *strings* holds the source of every ``@string``
+    block seen before the batch, so macros defined earlier still resolve.
+    """
+    strings: list[str] = []
+    batch_strings = ""
+    batch_start = 0
+    pos = 0
+    n = len(text)
+    while True:
+        m = _BLOCK_START_RE.search(text, pos)
+        if m is None:
+            break
+        open_char = m.group(2)
+        close_char = "}" if open_char == "{" else ")"
+        end = _find_block_end(text, m.start(2), open_char, close_char)
+        if end < 0:
+            break
+        if m.group(1).lower() == "string":
+            strings.append(text[m.start() : end] + "\n")
+        pos = end
+        if end - batch_start >= _LOAD_BATCH_CHARS:
+            yield text[batch_start:end], batch_strings
+            batch_start = end
+            batch_strings = "".join(strings)
+    if batch_start < n:
+        yield text[batch_start:], batch_strings
+
+
+def _parse_batch(text: str) -> list[BibEntry]:
+    return [_to_bib_entry(e) for e in bibtexparser.parse_string(text).entries]
+
+
+def _parsed_batches(texts: Iterator[str]) -> Iterator[list[BibEntry]]:
+    """Parse each batch in *texts*, in order.
+
+    Libraries of :data:`_PARALLEL_MIN_BATCHES` batches or more are spread over
+    worker processes; smaller ones are parsed here, since starting the pool
+    would cost more than it saves.
+    """
+    cpus = os.cpu_count() or 1
+    if cpus < 2:
+        yield from map(_parse_batch, texts)
+        return
+    head = list(itertools.islice(texts, _PARALLEL_MIN_BATCHES))
+    if len(head) < _PARALLEL_MIN_BATCHES:
+        yield from map(_parse_batch, head)
+        return
+    batches = head + list(texts)
+    try:
+        # "spawn" because loading runs in a worker thread, where fork is unsafe.
+        with ProcessPoolExecutor(
+            max_workers=min(cpus, len(batches)),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+            results = list(pool.map(_parse_batch, batches))
+    except (OSError, BrokenProcessPool):
+        results = map(_parse_batch, batches)
+    yield from results
+
+
+def iload(path: str) -> Iterator[BibEntry]:
+    """Yield the entries of the ``.bib`` file at *path* in file order.
+
+    Files of :data:`_PARALLEL_MIN_BATCHES` batches or more are parsed in
+    batches of about 1 MiB, so only one batch's bibtexparser model is alive
+    at a time instead of the whole library's.  Smaller files are parsed in
+    one go, which saves splitting them.  As with a whole-file parse,
+    ``@string`` macros apply to later entries and only the first entry with
+    a given key is kept.
+    """
+    text = Path(path).read_text(encoding="utf-8")
+    batches: Iterable[list[BibEntry]]
+    if len(text) < _LOAD_BATCH_CHARS * _PARALLEL_MIN_BATCHES:
+        batches = (_parse_batch(text),)
+    else:
+        texts = (strings + batch for batch, strings in _iter_load_batches(text))
+        batches = _parsed_batches(texts)
+    seen: set[str] = set()
+    for batch in batches:
+        for entry in batch:
+            if entry.key in seen:
+                continue
+            seen.add(entry.key)
+            yield entry
+
+
 def load(path: str) -> list[BibEntry]:
-    lib = bibtexparser.parse_file(path)
-    return [_to_bib_entry(e) for e in lib.entries]
+    return list(iload(path))
 
 
 def save(entries: list[BibEntry], path: str) -> None:
@@ -511,4 +684,4 @@ def save(entries: list[BibEntry], path: str) -> None:
 
     rewritten = "".join(output)
     if rewritten != original_text:
-        path_obj.write_text(rewritten, encoding="utf-8")
+        _write_atomic(path, rewritten)
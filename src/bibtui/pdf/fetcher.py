@@ -10,20 +10,25 @@ Tries strategies in order:
 Raises FetchError if none of the strategies succeed.
 """
 
-import json
+import glob
+import hashlib
 import os
 import re
 import shutil
 import tempfile
-import urllib.request
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 from urllib.parse import urlparse
 
-import pyalex  # type: ignore[import-untyped]
-
 from bibtui.bib.models import BibEntry
+from bibtui.utils import fetch_cache
+
+if TYPE_CHECKING:
+    import httpx
 
 
 class FetchError(Exception):
@@ -42,8 +47,7 @@ class FetchResult:
 # Filename helpers
 # ---------------------------------------------------------------------------
 
-_UNSAFE_RE = re.compile(r'[\\/:*?"<>|{}]')
-_WHITESPACE_RE = re.compile(r"\s+")
+_UNSAFE_TABLE = str.maketrans("", "", '\\/:*?"<>|{}')
 _MAX_TITLE_LEN = 80
 
 
@@ -57,8 +61,7 @@ def pdf_filename(entry: BibEntry) -> str:
     key = entry.key or "unknown"
     title = entry.title.strip() if entry.title else ""
     # Remove LaTeX commands and unsafe chars, then normalise whitespace
-    title = _UNSAFE_RE.sub("", title)
-    title = _WHITESPACE_RE.sub(" ", title).strip()
+    title = " ".join(title.translate(_UNSAFE_TABLE).split())
     if title:
         if len(title) > _MAX_TITLE_LEN:
             title = title[:_MAX_TITLE_LEN].rstrip()
@@ -112,77 +115,254 @@ def add_pdf(src: Path, entry: BibEntry, base_dir: str) -> Path:
 # arXiv helpers
 # ---------------------------------------------------------------------------
 
+_DOI_ARXIV_RE = re.compile(r"10\.48550/arxiv\.(.+)$", re.IGNORECASE)
+_URL_ARXIV_RE = re.compile(
+    r"arxiv\.org/(?:abs|pdf)/([^?#]+?)(?:v\d+)?(?:\.pdf)?(?:[?#].*)?$",
+    re.IGNORECASE,
+)
+
 
 def _arxiv_id(entry: BibEntry) -> str | None:
     """Extract an arXiv ID from the entry's DOI or URL, or None."""
     # DOI: 10.48550/arXiv.2301.12345  or  10.48550/arxiv.hep-th/9711200
-    if entry.doi:
-        m = re.search(r"10\.48550/[aA]r[xX]iv\.(.+)$", entry.doi)
+    if entry.doi and "10.48550" in entry.doi:
+        m = _DOI_ARXIV_RE.search(entry.doi)
         if m:
             return m.group(1)
 
     # URL: https://arxiv.org/abs/2301.12345  or  /pdf/2301.12345
     if entry.url:
-        m = re.search(
-            r"arxiv\.org/(?:abs|pdf)/(.+?)(?:v\d+)?(?:\.pdf)?$",
-            entry.url,
-            re.IGNORECASE,
-        )
+        m = _URL_ARXIV_RE.search(entry.url)
         if m:
             return m.group(1)
 
     return None
 
 
+def _resolve_ids(entry: BibEntry) -> tuple[str | None, str]:
+    """Return ``(arxiv_id, doi)`` for *entry*, each filled in from the other.
+
+    arXiv IDs and arXiv DOIs map onto each other (``10.48550/arXiv.<id>``),
+    so an entry that only links to arxiv.org still gets a DOI for the
+    DOI-based lookups, and vice versa.
+    """
+    arxiv_id = _arxiv_id(entry)
+    doi = _normalized_doi(entry.doi) if entry.doi else ""
+    if not doi and arxiv_id:
+        doi = f"10.48550/arXiv.{arxiv_id}"
+    return arxiv_id, doi
+
+
+# ---------------------------------------------------------------------------
+# HTTP client
+# ---------------------------------------------------------------------------
+
+_USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64; rv:124.0) Gecko/20100101 Firefox/124.0"
+
+_client: "httpx.Client | None" = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def _http() -> "httpx.Client":
+    """Return the shared HTTP client, creating it on first use.
+
+    A single pooled client keeps TCP/TLS connections alive across requests,
+    so an Unpaywall lookup followed by downloads from the same host, or the
+    parts of a ranged download, skip repeated handshakes.  The client is safe
+    to share between the fetch threads.
+    """
+    global _client
+    with _CLIENT_LOCK:
+        if _client is None:
+            import httpx
+
+            _client = httpx.Client(
+                headers={"User-Agent": _USER_AGENT},
+                follow_redirects=True,
+                transport=httpx.HTTPTransport(
+                    retries=3,
+                    limits=httpx.Limits(
+                        max_connections=20, max_keepalive_connections=10
+                    ),
+                ),
+            )
+        return _client
+
+
 # ---------------------------------------------------------------------------
 # Download helper
 # ---------------------------------------------------------------------------
 
+_PDF_MAGIC = b"%PDF-"
+_MAX_PDF_BYTES = 500 * 1024 * 1024
+_COPY_CHUNK = 1024 * 1024
+
+
+def _partial_path(url: str, dest_path: str) -> str:
+    """Return where an interrupted download of *url* is kept for resuming.
+
+    The name includes a hash of *url* so that a different candidate URL for
+    the same destination never appends to another server's bytes.
+    """
+    dest = Path(dest_path)
+    digest = hashlib.sha1(url.encode("utf-8")).hexdigest()[:12]
+    return str(dest.with_name(f".{dest.name}.{digest}.part"))
+
+
+# Race target path -> event set once another strategy has won the race.  The
+# downloads into that path stop at their next chunk and keep no resume file.
+_race_cancels: dict[str, threading.Event] = {}
 
-def _download(url: str, dest_path: str, timeout: int = 30) -> None:
+
+def _check_cancelled(cancel: threading.Event | None, url: str) -> None:
+    if cancel is not None and cancel.is_set():
+        raise FetchError(f"Download cancelled, another source won: {url}")
+
+
+def _remove_partials(dest_path: str) -> None:
+    """Remove the resume files left next to *dest_path* by dropped downloads.
+
+    Called once a PDF has been saved: the file will not be fetched again, so
+    nothing would ever resume them.
+    """
+    dest = Path(dest_path)
+    for part in dest.parent.glob(f".{glob.escape(dest.name)}.*.part"):
+        _remove_quietly(str(part))
+
+
+def _resumable_size(part: str) -> int:
+    """Return the size of a usable partial download at *part*, else 0."""
+    try:
+        with open(part, "rb") as f:
+            if f.read(len(_PDF_MAGIC)) == _PDF_MAGIC:
+                return os.fstat(f.fileno()).st_size
+    except OSError:
+        return 0
+    _remove_quietly(part)
+    return 0
+
+
+def _download(
+    url: str, dest_path: str, timeout: int = 30, max_bytes: int = _MAX_PDF_BYTES
+) -> None:
     """Stream *url* to *dest_path*.
 
-    Raises FetchError if the response Content-Type is not PDF or the request
-    fails.
+    The body must start with the ``%PDF-`` magic bytes — the Content-Type
+    header is not trusted, since publishers both mislabel PDFs and serve HTML
+    error pages as ``application/pdf``.  Raises FetchError if the body is not
+    a PDF, exceeds *max_bytes*, or the request fails.
+
+    If the connection drops mid-download, the bytes received so far are
+    kept and the next download of the same URL asks only for the rest
+    (``Range: bytes=N-``), starting over if the server ignores the range.
+    :func:`fetch_pdf` removes what is left once the PDF has been saved.
+    Downloads into a race target are never resumed, and stop once the race
+    is decided.
     """
-    req = urllib.request.Request(
-        url,
-        headers={
-            "User-Agent": (
-                "Mozilla/5.0 (X11; Linux x86_64; rv:124.0) Gecko/20100101 Firefox/124.0"
-            ),
-            "Accept": "application/pdf,*/*",
-        },
-    )
+    cancel = _race_cancels.get(dest_path)
+    _check_cancelled(cancel, url)
     dest = Path(dest_path)
     dest.parent.mkdir(parents=True, exist_ok=True)
-    tmp_path: str | None = None
+    part = _partial_path(url, dest_path)
+    offset = _resumable_size(part) if cancel is None else 0
+    headers = {"Accept": "application/pdf,*/*"}
+    if offset:
+        # Ranges address the encoded body, so ask for it uncompressed.
+        headers["Range"] = f"bytes={offset}-"
+        headers["Accept-Encoding"] = "identity"
+    keep_part = False
     try:
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
+        with _http().stream("GET", url, headers=headers, timeout=timeout) as resp:
+            if resp.status_code >= 400:
+                raise FetchError(f"Download failed from {url}: HTTP {resp.status_code}")
             content_type = resp.headers.get("Content-Type", "")
-            first_chunk = resp.read(65536)
-            if not first_chunk:
+            resumed = offset > 0 and resp.status_code == 206
+            if not resumed:
+                offset = 0
+            chunks = resp.iter_bytes(_COPY_CHUNK)
+            first_chunk = next(chunks, b"")
+            if not resumed and not first_chunk:
                 raise FetchError(f"URL returned empty response: {url}")
-
-            is_pdf_type = "pdf" in content_type.lower()
-            is_pdf_magic = first_chunk.startswith(b"%PDF")
-            if not is_pdf_type and not is_pdf_magic:
+            if not resumed and not first_chunk.startswith(_PDF_MAGIC):
                 raise FetchError(
                     f"URL did not return a PDF (Content-Type: {content_type}): {url}"
                 )
 
-            fd, tmp_path = tempfile.mkstemp(
-                prefix=f".{dest.name}.", suffix=".tmp", dir=str(dest.parent)
-            )
-            with os.fdopen(fd, "wb") as f:
+            total = offset + len(first_chunk)
+            with open(part, "ab" if resumed else "wb", buffering=_COPY_CHUNK) as f:
+                # From here on, a dropped connection leaves a resumable prefix.
+                keep_part = cancel is None
                 f.write(first_chunk)
-                while chunk := resp.read(65536):
+                for chunk in chunks:
+                    _check_cancelled(cancel, url)
+                    total += len(chunk)
+                    if total > max_bytes:
+                        raise FetchError(
+                            f"PDF exceeds {max_bytes // (1024 * 1024)} MB: {url}"
+                        )
                     f.write(chunk)
                 f.flush()
                 os.fsync(f.fileno())
 
-            os.replace(tmp_path, dest_path)
-            tmp_path = None
+            os.replace(part, dest_path)
+    except FetchError:
+        keep_part = False
+        raise
+    except Exception as exc:
+        raise FetchError(f"Download failed from {url}: {exc}") from exc
+    finally:
+        if not keep_part:
+            _remove_quietly(part)
+
+
+_RANGED_MIN_BYTES = 4 * 1024 * 1024
+
+
+def _download_ranged(
+    url: str,
+    dest_path: str,
+    n_parts: int = 4,
+    timeout: int = 30,
+    max_bytes: int = _MAX_PDF_BYTES,
+) -> None:
+    """Download *url* to *dest_path* over *n_parts* parallel Range requests.
+
+    Servers such as arXiv cap the rate per connection, so large PDFs arrive
+    faster in parallel parts.  Falls back to :func:`_download` when the server
+    does not advertise byte ranges or the file is smaller than 4 MiB.
+    Raises FetchError like :func:`_download`.
+    """
+    cancel = _race_cancels.get(dest_path)
+    _check_cancelled(cancel, url)
+    size = _ranged_size(url, timeout)
+    if size is None or size < _RANGED_MIN_BYTES or size > max_bytes:
+        _download(url, dest_path, timeout=timeout, max_bytes=max_bytes)
+        return
+
+    dest = Path(dest_path)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    step = -(-size // n_parts)
+    parts = [(start, min(start + step, size) - 1) for start in range(0, size, step)]
+    tmp_path: str | None = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=f".{dest.name}.", suffix=".tmp", dir=str(dest.parent)
+        )
+        with os.fdopen(fd, "wb") as f:
+            f.truncate(size)
+        with ThreadPoolExecutor(max_workers=len(parts)) as pool:
+            futures = [
+                pool.submit(_download_range, url, tmp_path, start, end, timeout, cancel)
+                for start, end in parts
+            ]
+            for future in futures:
+                future.result()
+        with open(tmp_path, "rb") as f:
+            if f.read(len(_PDF_MAGIC)) != _PDF_MAGIC:
+                raise FetchError(f"URL did not return a PDF: {url}")
+
+        os.replace(tmp_path, dest_path)
+        tmp_path = None
     except FetchError:
         raise
     except Exception as exc:
@@ -195,11 +375,65 @@ def _download(url: str, dest_path: str, timeout: int = 30) -> None:
                 pass
 
 
+def _ranged_size(url: str, timeout: int) -> int | None:
+    """Return the size of *url* if the server accepts byte ranges, else None."""
+    try:
+        # Ranges address the encoded body, so ask for it uncompressed.
+        resp = _http().head(
+            url, headers={"Accept-Encoding": "identity"}, timeout=timeout
+        )
+    except Exception:
+        return None
+    accept_ranges = resp.headers.get("Accept-Ranges", "")
+    length = resp.headers.get("Content-Length", "")
+    if resp.status_code >= 400 or accept_ranges.strip().lower() != "bytes":
+        return None
+    return int(length) if length.isdigit() else None
+
+
+def _download_range(
+    url: str,
+    path: str,
+    start: int,
+    end: int,
+    timeout: int,
+    cancel: threading.Event | None = None,
+) -> None:
+    """Write bytes *start*..*end* (inclusive) of *url* into *path* in place.
+
+    Stops with FetchError once *cancel* is set.
+    """
+    headers = {
+        "Accept": "application/pdf,*/*",
+        "Accept-Encoding": "identity",
+        "Range": f"bytes={start}-{end}",
+    }
+    expected = end - start + 1
+    written = 0
+    with (
+        _http().stream("GET", url, headers=headers, timeout=timeout) as resp,
+        open(path, "r+b") as f,
+    ):
+        if resp.status_code != 206:
+            raise FetchError(f"Server ignored the byte range request: {url}")
+        f.seek(start)
+        for chunk in resp.iter_bytes(_COPY_CHUNK):
+            _check_cancelled(cancel, url)
+            written += len(chunk)
+            if written > expected:
+                break
+            f.write(chunk)
+        f.flush()
+        os.fsync(f.fileno())
+    if written != expected:
+        raise FetchError(f"Incomplete download from {url}")
+
+
 def _write_pdf_bytes(pdf_bytes: bytes, dest_path: str) -> None:
     """Write raw PDF bytes to *dest_path* atomically after basic validation."""
     if not pdf_bytes:
         raise FetchError("OpenAlex returned empty PDF content")
-    if not pdf_bytes.startswith(b"%PDF"):
+    if not pdf_bytes.startswith(_PDF_MAGIC):
         raise FetchError("OpenAlex did not return PDF content")
 
     dest = Path(dest_path)
@@ -228,16 +462,20 @@ def _write_pdf_bytes(pdf_bytes: bytes, dest_path: str) -> None:
 # ---------------------------------------------------------------------------
 
 
-def _try_arxiv(entry: BibEntry, dest_path: str) -> str | None:
+def _try_arxiv(
+    entry: BibEntry, dest_path: str, arxiv_id: str | None = None
+) -> str | None:
     """Try to fetch the PDF from arXiv.
     Returns None on success, or an error reason string on failure.
+    *arxiv_id* defaults to the ID found in the entry's DOI or URL.
     """
-    arxiv_id = _arxiv_id(entry)
+    if arxiv_id is None:
+        arxiv_id = _arxiv_id(entry)
     if not arxiv_id:
         return "no arXiv ID found"
     pdf_url = f"https://arxiv.org/pdf/{arxiv_id}"
     try:
-        _download(pdf_url, dest_path)
+        _download_ranged(pdf_url, dest_path)
         return None
     except FetchError as exc:
         return str(exc)
@@ -306,24 +544,44 @@ def _normalized_doi(doi: str) -> str:
     return norm
 
 
-def _try_openalex(entry: BibEntry, dest_path: str, api_key: str) -> str | None:
+# pyalex keeps the API key in a module-global config; bulk fetches run
+# _try_openalex from several threads at once.
+_OPENALEX_LOCK = threading.Lock()
+
+
+def _try_openalex(
+    entry: BibEntry, dest_path: str, api_key: str, doi: str | None = None
+) -> str | None:
     """Try OpenAlex lookup and download a direct PDF URL.
 
+    *doi* defaults to the entry's DOI.
     Returns None on success, or an error reason string on failure.
     """
-    if not entry.doi and not entry.title:
+    if doi is None:
+        doi = entry.doi
+    if not doi and not entry.title:
         return "entry has no DOI or title"
     if not api_key:
         return "no API key configured in Settings"
 
+    with _OPENALEX_LOCK:
+        return _openalex_lookup(entry, dest_path, api_key, doi)
+
+
+def _openalex_lookup(
+    entry: BibEntry, dest_path: str, api_key: str, doi: str
+) -> str | None:
+    # pyalex pulls in requests; keep it off the startup path.
+    import pyalex  # type: ignore[import-untyped]
+
     previous_api_key = pyalex.config.get("api_key")
     pyalex.config["api_key"] = api_key
 
     try:
         works: list[dict[str, Any]] = []
 
-        if entry.doi:
-            lookup_doi = _normalized_doi(entry.doi)
+        if doi:
+            lookup_doi = _normalized_doi(doi)
             works = cast(
                 list[dict[str, Any]],
                 pyalex.Works()
@@ -334,14 +592,14 @@ def _try_openalex(entry: BibEntry, dest_path: str, api_key: str) -> str | None:
         # Fallback for older references only when DOI is missing.
         # If a DOI is present but unresolved, do not title-match because that can
         # return a different work and fetch the wrong PDF.
-        if not works and not entry.doi and entry.title:
+        if not works and not doi and entry.title:
             works = cast(
                 list[dict[str, Any]],
                 pyalex.Works().search(entry.title).get(per_page=1),
             )
 
         if not works:
-            if entry.doi:
+            if doi:
                 return "no OpenAlex work found for DOI"
             return "no OpenAlex work found"
 
@@ -356,28 +614,24 @@ def _try_openalex(entry: BibEntry, dest_path: str, api_key: str) -> str | None:
             except Exception:
                 pass
 
-        pdf_candidates: list[str] = []
-
         content_urls = work.get("content_urls") or {}
-        if content_urls.get("pdf"):
-            pdf_candidates.append(content_urls["pdf"])
-
         best = work.get("best_oa_location") or {}
-        if best.get("pdf_url"):
-            pdf_candidates.append(best["pdf_url"])
-
         primary = work.get("primary_location") or {}
-        if primary.get("pdf_url") and primary["pdf_url"] not in pdf_candidates:
-            pdf_candidates.append(primary["pdf_url"])
-
         open_access = work.get("open_access") or {}
-        if open_access.get("oa_url") and open_access["oa_url"] not in pdf_candidates:
-            pdf_candidates.append(open_access["oa_url"])
-
-        for location in work.get("locations", []):
-            url = location.get("pdf_url")
-            if url and url not in pdf_candidates:
-                pdf_candidates.append(url)
+        # dict.fromkeys dedups while keeping the best-first order.
+        pdf_candidates = list(
+            dict.fromkeys(
+                url
+                for url in (
+                    content_urls.get("pdf"),
+                    best.get("pdf_url"),
+                    primary.get("pdf_url"),
+                    open_access.get("oa_url"),
+                    *(loc.get("pdf_url") for loc in work.get("locations", [])),
+                )
+                if url
+            )
+        )
 
         if not pdf_candidates:
             return "no direct PDF available"
@@ -401,6 +655,40 @@ def _try_openalex(entry: BibEntry, dest_path: str, api_key: str) -> str | None:
 # ---------------------------------------------------------------------------
 
 
+def _unpaywall_pdf_urls(doi: str, email: str) -> list[str] | None:
+    """Return the direct PDF URLs Unpaywall knows for *doi*.
+
+    Answers (including empty ones) are kept in :mod:`bibtui.utils.fetch_cache`
+    so repeated fetches skip the API.  Returns None if the lookup failed.
+    """
+    cached = fetch_cache.get_unpaywall_urls(doi)
+    if cached is not None:
+        return cached
+    api_url = f"https://api.unpaywall.org/v2/{doi}?email={email}"
+    try:
+        resp = _http().get(api_url, timeout=15)
+        resp.raise_for_status()
+        data = resp.json()
+    except Exception:
+        return None
+
+    # Collect all direct PDF URLs Unpaywall knows about, best first
+    best = data.get("best_oa_location") or {}
+    pdf_candidates = list(
+        dict.fromkeys(
+            url
+            for url in (
+                best.get("url_for_pdf"),
+                *(loc.get("url_for_pdf") for loc in data.get("oa_locations", [])),
+            )
+            if url
+        )
+    )
+
+    fetch_cache.store_unpaywall_urls(doi, pdf_candidates)
+    return pdf_candidates
+
+
 def _try_unpaywall(entry: BibEntry, dest_path: str, email: str) -> str | None:
     """Try Unpaywall open-access lookup using only direct ``url_for_pdf`` links.
 
@@ -412,31 +700,9 @@ def _try_unpaywall(entry: BibEntry, dest_path: str, email: str) -> str | None:
         return "entry has no DOI"
     if not email:
         return "no email configured in Settings"
-    api_url = f"https://api.unpaywall.org/v2/{entry.doi}?email={email}"
-    req = urllib.request.Request(
-        api_url,
-        headers={
-            "User-Agent": (
-                "Mozilla/5.0 (X11; Linux x86_64; rv:124.0) Gecko/20100101 Firefox/124.0"
-            )
-        },
-    )
-    try:
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
-    except Exception:
+    pdf_candidates = _unpaywall_pdf_urls(entry.doi, email)
+    if pdf_candidates is None:
         return "Unpaywall lookup failed"
-
-    # Collect all direct PDF URLs Unpaywall knows about
-    pdf_candidates: list[str] = []
-    best = data.get("best_oa_location") or {}
-    if best.get("url_for_pdf"):
-        pdf_candidates.append(best["url_for_pdf"])
-    for loc in data.get("oa_locations", []):
-        u = loc.get("url_for_pdf")
-        if u and u not in pdf_candidates:
-            pdf_candidates.append(u)
-
     if not pdf_candidates:
         return "no direct PDF available"
 
@@ -456,7 +722,7 @@ def _try_unpaywall(entry: BibEntry, dest_path: str, email: str) -> str | None:
 
 
 def _try_direct_url(entry: BibEntry, dest_path: str) -> str | None:
-    """Try to download the entry's URL directly if it looks like a PDF.
+    """Try to download the entry's URL directly if it serves a PDF.
     Returns None on success, or an error reason string on failure.
     """
     if not entry.url:
@@ -464,27 +730,6 @@ def _try_direct_url(entry: BibEntry, dest_path: str) -> str | None:
     parsed = urlparse(entry.url)
     if parsed.scheme not in ("http", "https"):
         return "URL scheme is not http/https"
-    # Quick HEAD request to check Content-Type before consuming bandwidth
-    head_req = urllib.request.Request(
-        entry.url,
-        method="HEAD",
-        headers={
-            "User-Agent": (
-                "Mozilla/5.0 (X11; Linux x86_64; rv:124.0) Gecko/20100101 Firefox/124.0"
-            )
-        },
-    )
-    content_type = ""
-    try:
-        with urllib.request.urlopen(head_req, timeout=10) as resp:
-            content_type = resp.headers.get("Content-Type", "")
-    except Exception:
-        # Some servers reject HEAD; try GET download as fallback.
-        content_type = ""
-
-    if content_type and "pdf" not in content_type.lower():
-        return f"URL does not serve a PDF (Content-Type: {content_type})"
-
     try:
         _download(entry.url, dest_path)
         return None
@@ -503,10 +748,13 @@ def fetch_pdf(
     unpaywall_email: str = "",
     openalex_api_key: str = "",
     overwrite: bool = False,
+    race: bool = False,
 ) -> FetchResult:
     """Fetch a PDF for *entry* and save it under *dest_dir*.
 
     Tries arXiv → Copernicus → OpenAlex (optional) → Unpaywall → direct URL.
+    With *race*, all strategies start at once; the result is the same, but a
+    failing fetch takes as long as the slowest strategy, not all of them.
 
     Returns the saved file path and provider on success.
     Raises FetchError (with a human-readable message) if all strategies fail.
@@ -527,32 +775,123 @@ def fetch_pdf(
     if os.path.exists(dest_path) and not overwrite:
         raise FetchError(f"File already exists: {dest_path}")
 
+    # Unpaywall only covers Crossref DOIs, so it keeps the entry's own DOI
+    # rather than a synthesised arXiv (DataCite) one.
+    arxiv_id, doi = _resolve_ids(entry)
+    strategies: list[tuple[str, Callable[[str], str | None]]] = [
+        ("arXiv", lambda path: _try_arxiv(entry, path, arxiv_id or "")),
+        ("Copernicus", lambda path: _try_copernicus(entry, path)),
+    ]
+    if openalex_api_key:
+        strategies.append(
+            (
+                "OpenAlex",
+                lambda path: _try_openalex(entry, path, openalex_api_key, doi),
+            )
+        )
+    strategies.append(
+        ("Unpaywall", lambda path: _try_unpaywall(entry, path, unpaywall_email))
+    )
+    strategies.append(("Direct URL", lambda path: _try_direct_url(entry, path)))
+
+    if race:
+        return _race_strategies(strategies, dest_path)
+
     reasons: list[str] = []
+    for provider, attempt in strategies:
+        reason = attempt(dest_path)
+        if reason is None:
+            _remove_partials(dest_path)
+            return FetchResult(dest_path, provider)
+        reasons.append(f"{provider}: {reason}")
+    raise _all_failed(reasons)
 
-    reason = _try_arxiv(entry, dest_path)
-    if reason is None:
-        return FetchResult(dest_path, "arXiv")
-    reasons.append(f"arXiv: {reason}")
 
-    reason = _try_copernicus(entry, dest_path)
-    if reason is None:
-        return FetchResult(dest_path, "Copernicus")
-    reasons.append(f"Copernicus: {reason}")
+def _all_failed(reasons: list[str]) -> FetchError:
+    return FetchError("Could not fetch PDF:\n" + "\n".join(f"  • {r}" for r in reasons))
 
-    if openalex_api_key:
-        reason = _try_openalex(entry, dest_path, openalex_api_key)
-        if reason is None:
-            return FetchResult(dest_path, "OpenAlex")
-        reasons.append(f"OpenAlex: {reason}")
 
-    reason = _try_unpaywall(entry, dest_path, unpaywall_email)
-    if reason is None:
-        return FetchResult(dest_path, "Unpaywall")
-    reasons.append(f"Unpaywall: {reason}")
+def _race_strategies(
+    strategies: list[tuple[str, Callable[[str], str | None]]], dest_path: str
+) -> FetchResult:
+    """Run every strategy at once, each into its own ``.part`` file.
+
+    Results are taken in priority order, so the winner is the strategy the
+    sequential cascade would have picked.  Once the race is decided, the
+    other strategies' downloads stop at their next chunk.  Their part files
+    are removed as soon as they finish.
+    """
+    cancel = threading.Event()
+    pool = ThreadPoolExecutor(max_workers=len(strategies))
+    attempts = []
+    for provider, attempt in strategies:
+        part = f"{dest_path}.{provider.lower().replace(' ', '-')}.part"
+        _race_cancels[part] = cancel
+        attempts.append((provider, part, pool.submit(attempt, part)))
+    pool.shutdown(wait=False)
+
+    reasons: list[str] = []
+    try:
+        for provider, part, future in attempts:
+            reason = future.result()
+            if reason is None:
+                os.replace(part, dest_path)
+                _remove_partials(dest_path)
+                return FetchResult(dest_path, provider)
+            reasons.append(f"{provider}: {reason}")
+    finally:
+        cancel.set()
+        for _provider, part, future in attempts:
+            future.add_done_callback(lambda _f, part=part: _end_race_target(part))
+    raise _all_failed(reasons)
+
+
+def _end_race_target(part: str) -> None:
+    _race_cancels.pop(part, None)
+    _remove_quietly(part)
 
-    reason = _try_direct_url(entry, dest_path)
-    if reason is None:
-        return FetchResult(dest_path, "Direct URL")
-    reasons.append(f"Direct URL: {reason}")
 
-    raise FetchError("Could not fetch PDF:\n" + "\n".join(f"  • {r}" for r in reasons))
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def fetch_pdfs_bulk(
+    entries: list[BibEntry],
+    dest_dir: str,
+    unpaywall_email: str = "",
+    openalex_api_key: str = "",
+    max_workers: int = 4,
+) -> Iterator[tuple[BibEntry, FetchResult | Exception]]:
+    """Fetch PDFs for several entries concurrently.
+
+    Each entry runs the same strategy cascade as :func:`fetch_pdf`; only
+    different entries overlap.  Yields ``(entry, result)`` pairs in completion
+    order, where *result* is the :class:`FetchResult` or the exception raised.
+    Closing the iterator early cancels entries that have not started yet and
+    waits for the running ones to finish.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(
+                fetch_pdf,
+                entry,
+                dest_dir,
+                unpaywall_email,
+                openalex_api_key=openalex_api_key,
+                overwrite=False,
+            ): entry
+            for entry in entries
+        }
+        try:
+            for future in as_completed(futures):
+                entry = futures[future]
+                try:
+                    yield entry, future.result()
+                except Exception as exc:  # noqa: BLE001
+                    yield entry, exc
+        finally:
+            for future in futures:
+                future.cancel()
@@ -1,18 +1,28 @@
 import os
+import re
+
+# One link of a JabRef file field: ``description:path:type``.  Only the outer
+# colons separate parts, so Windows paths (``C:\...`` or JabRef's escaped
+# ``C\:\...``) stay intact.
+_JABREF_LINK_RE = re.compile(r"^[^:]*:(?P<path>.*):[^:]*$")
+# Links are ``;``-separated; JabRef escapes literal semicolons as ``\;``.
+_JABREF_LINK_SEP_RE = re.compile(r"(?<!\\);")
 
 
 def parse_jabref_path(file_field: str, base_dir: str = "") -> str:
     """Resolve a JabRef-style file field to an absolute path.
 
     JabRef format: ``description:path:type``  (e.g. ``:Smith2023.pdf:PDF``)
-    The description and type parts are optional.
+    The description and type parts are optional.  Only the first linked
+    file is used.
     """
-    path = file_field.strip()
-    if ":" in path:
-        parts = path.split(":")
-        # ':path:type' → parts = ['', 'path', 'type']
-        # 'desc:path:type' → parts = ['desc', 'path', 'type']
-        path = parts[1] if len(parts) >= 2 else parts[0]
+    path = _JABREF_LINK_SEP_RE.split(file_field.strip(), maxsplit=1)[0]
+    m = _JABREF_LINK_RE.match(path)
+    if m:
+        path = m.group("path").replace("\\:", ":")
+    elif ":" in path:
+        # 'desc:path' → ['desc', 'path']
+        path = path.split(":")[1]
     path = path.strip()
     if base_dir and not os.path.isabs(path):
         path = os.path.join(base_dir, path)
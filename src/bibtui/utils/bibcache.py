@@ -0,0 +1,87 @@
+"""On-disk cache of parsed bibliographies.
+
+Parsing a large ``.bib`` file dominates startup time.  The parsed entries are
+pickled under ``~/.cache/bibtui/parsed`` together with the file's mtime and
+size, and reused on the next start as long as the file is unchanged.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+from bibtui import __version__
+from bibtui.bib.models import BibEntry
+
+CACHE_DIR = Path.home() / ".cache" / "bibtui" / "parsed"
+
+logger = logging.getLogger(__name__)
+
+# Bump when BibEntry or the parser output changes in a way old pickles miss.
+_SCHEMA_VERSION = 8
+
+
+def _cache_file(path: str) -> Path:
+    digest = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()
+    return CACHE_DIR / f"{digest}.pkl"
+
+
+def _signature(path: str) -> tuple[int, int, int, str] | None:
+    """Return the (mtime_ns, size, schema, version) tuple a cache must match."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, _SCHEMA_VERSION, __version__)
+
+
+def load_cached(path: str) -> list[BibEntry] | None:
+    """Return the cached entries for *path*, or None if missing or stale."""
+    signature = _signature(path)
+    if signature is None:
+        return None
+    try:
+        with open(_cache_file(path), "rb") as f:
+            if pickle.load(f) != signature:
+                return None
+            entries = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+        # Unreadable, truncated or otherwise corrupt; it is rewritten after
+        # the next parse.
+        logger.debug("Ignoring unreadable parse cache for %s", path, exc_info=True)
+        return None
+    return entries if isinstance(entries, list) else None
+
+
+def save_cache(path: str, entries: list[BibEntry]) -> None:
+    """Store *entries* as the parsed form of the current contents of *path*.
+
+    Failures are ignored — the cache is only an optimisation.
+    """
+    signature = _signature(path)
+    if signature is None:
+        return
+    target = _cache_file(path)
+    tmp_path: str | None = None
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=f".{target.name}.", suffix=".tmp", dir=str(target.parent)
+        )
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(signature, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, target)
+        tmp_path = None
+    except (OSError, pickle.PicklingError):
+        logger.debug("Could not write parse cache for %s", path, exc_info=True)
+    finally:
+        if tmp_path and os.path.exists(tmp_path):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
@@ -1,4 +1,7 @@
+import functools
+import os
 import shutil
+import tempfile
 import tomllib
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -97,13 +100,21 @@ def _backup_corrupt_config() -> None:
         pass
 
 
+@functools.lru_cache(maxsize=1)
+def _read_config(path: Path, signature: tuple[int, int, int]) -> dict:
+    """Parse the TOML at *path*; memoised on its ``stat`` *signature*."""
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
 def load_config() -> Config:
     ensure_csl_styles()
-    if not CONFIG_PATH.exists():
+    try:
+        st = CONFIG_PATH.stat()
+    except OSError:
         return default_config()
     try:
-        with open(CONFIG_PATH, "rb") as f:
-            data = tomllib.load(f)
+        data = _read_config(CONFIG_PATH, (st.st_ino, st.st_mtime_ns, st.st_size))
     except OSError:
         return default_config()
     except tomllib.TOMLDecodeError:
@@ -162,6 +173,18 @@ def save_config(config: Config) -> None:
             "default_citation_style": config.default_citation_style,
         },
     }
-    with open(CONFIG_PATH, "wb") as f:
-        tomli_w.dump(data, f)
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f".{CONFIG_PATH.name}.", suffix=".tmp", dir=str(CONFIG_PATH.parent)
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            tomli_w.dump(data, f)
+        os.replace(tmp_path, CONFIG_PATH)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    _read_config.cache_clear()
     ensure_csl_styles()
@@ -0,0 +1,134 @@
+"""On-disk cache of Unpaywall lookups.
+
+Maps a normalised DOI to the direct PDF URLs Unpaywall reported for it,
+including "none" answers, so re-running a fetch over the same library skips
+the API round-trip.  Entries expire after :data:`MAX_AGE` seconds and only
+the :data:`MAX_ENTRIES` most recently used are kept.  Failed lookups (network
+errors) are never cached.
+
+Lookups live in memory; the file is rewritten once, at interpreter exit, by
+:func:`flush`.
+"""
+
+import atexit
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+CACHE_FILE = Path.home() / ".cache" / "bibtui" / "unpaywall.json"
+
+MAX_AGE = 30 * 24 * 3600
+MAX_ENTRIES = 10_000
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+# In-memory copy of CACHE_FILE, loaded on first use, least recently used first.
+_memory: dict[str, dict] | None = None
+# Whether _memory has changes CACHE_FILE does not have yet.
+_dirty = False
+
+
+def _key(doi: str) -> str:
+    return doi.strip().lower()
+
+
+def _expired(record: object) -> bool:
+    if not isinstance(record, dict):
+        return True
+    return time.time() - record.get("fetched", 0) > MAX_AGE
+
+
+def _load() -> dict[str, dict]:
+    global _memory, _dirty
+    if _memory is None:
+        try:
+            data = json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            data = {}
+        except (OSError, ValueError):
+            # Unreadable or not JSON (json.JSONDecodeError and
+            # UnicodeDecodeError are ValueErrors); start afresh.
+            logger.debug("Ignoring unreadable %s", CACHE_FILE, exc_info=True)
+            data = {}
+        if not isinstance(data, dict):
+            data = {}
+        _memory = {k: v for k, v in data.items() if not _expired(v)}
+        if len(_memory) != len(data):
+            _dirty = True
+    return _memory
+
+
+def get_unpaywall_urls(doi: str) -> list[str] | None:
+    """Return the cached PDF URLs for *doi*, or None if unknown or expired.
+
+    An empty list means Unpaywall had no direct PDF for the DOI.
+    """
+    with _lock:
+        data = _load()
+        record = data.pop(_key(doi), None)
+        if record is None:
+            return None
+        # Re-insert to mark it most recently used.
+        data[_key(doi)] = record
+    if _expired(record):
+        return None
+    urls = record.get("urls")
+    return list(urls) if isinstance(urls, list) else None
+
+
+def store_unpaywall_urls(doi: str, urls: list[str]) -> None:
+    """Remember *urls* as Unpaywall's answer for *doi*.
+
+    Only the in-memory copy changes; :func:`flush` persists it.
+    """
+    global _dirty
+    with _lock:
+        data = _load()
+        data.pop(_key(doi), None)
+        data[_key(doi)] = {"urls": list(urls), "fetched": time.time()}
+        while len(data) > MAX_ENTRIES:
+            del data[next(iter(data))]
+        _dirty = True
+
+
+def flush() -> None:
+    """Write pending lookups to :data:`CACHE_FILE`.
+
+    Failures to write are ignored — the cache is only an optimisation.
+    """
+    global _dirty
+    with _lock:
+        if not _dirty or _memory is None:
+            return
+        payload = json.dumps(_memory)
+        _dirty = False
+    _write(payload)
+
+
+atexit.register(flush)
+
+
+def _write(payload: str) -> None:
+    tmp_path: str | None = None
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=f".{CACHE_FILE.name}.", suffix=".tmp", dir=str(CACHE_FILE.parent)
+        )
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp_path, CACHE_FILE)
+        tmp_path = None
+    except OSError:
+        logger.debug("Could not write %s", CACHE_FILE, exc_info=True)
+    finally:
+        if tmp_path and os.path.exists(tmp_path):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
@@ -1,5 +1,6 @@
 """Detect the OS / Omarchy theme and map it to a Textual theme name."""
 
+import functools
 import tomllib
 from pathlib import Path
 
@@ -75,13 +76,42 @@ def _build_theme(omarchy_name: str, colors: dict) -> Theme:
     )
 
 
+def _omarchy_signature() -> tuple:
+    """Identify the state of the Omarchy theme files with a few ``stat`` calls.
+
+    ``current/theme`` is a symlink that Omarchy repoints on a theme switch, so
+    the inode of the resolved colors.toml changes along with theme.name.
+    """
+    signature = []
+    for path in (
+        _OMARCHY_THEME_NAME,
+        _OMARCHY_COLORS_TOML,
+        _OMARCHY_THEME_DIR / "light.mode",
+    ):
+        try:
+            st = path.stat()
+        except OSError:
+            signature.append(None)
+        else:
+            signature.append((st.st_ino, st.st_mtime_ns, st.st_size))
+    return tuple(signature)
+
+
 def get_omarchy_theme() -> tuple[str, Theme | None]:
     """Return (textual_theme_name, custom_Theme_or_None) for the active Omarchy theme.
 
     The second element is non-None only when no built-in Textual theme covers
     the active Omarchy theme and colors.toml is readable.  Callers must register
     it with the app before setting self.theme.
+
+    The app polls this every few seconds; the files are only re-read when
+    their ``stat`` signature changes.
     """
+    return _omarchy_theme_for(_omarchy_signature())
+
+
+@functools.lru_cache(maxsize=1)
+def _omarchy_theme_for(signature: tuple) -> tuple[str, Theme | None]:
     name = _omarchy_theme_name()
     if name is None:
         return "textual-dark", None
@@ -15,7 +15,6 @@ from bibtui.bib.citation_preview import (
 )
 from bibtui.bib.models import BibEntry
 from bibtui.bib.parser import entry_to_bibtex_str
-from bibtui.pdf.paths import parse_jabref_path
 
 if TYPE_CHECKING:
     from bibtui.app import BibTuiApp
@@ -339,7 +338,7 @@ class EntryDetail(Widget):
     def _file_icon(self, entry: BibEntry) -> str:
         if not entry.file:
             return " "
-        path = parse_jabref_path(entry.file, self._pdf_base_dir)
+        path = entry.resolved_file(self._pdf_base_dir)
         return "■" if os.path.exists(path) else "□"
 
     def _theme_colors(self) -> dict[str, str]:
@@ -1,10 +1,17 @@
+import functools
+import os
+from bisect import bisect_right
+from collections.abc import Callable
+from typing import Any
+
 from rich.text import Text
-from textual import events, on
+from textual import events, on, work
 from textual.app import ComposeResult
 from textual.reactive import reactive
+from textual.timer import Timer
 from textual.widget import Widget
 from textual.widgets import DataTable, Input
-from textual.widgets._data_table import ColumnKey
+from textual.widgets.data_table import ColumnKey, RowKey
 
 from bibtui.bib.models import READ_STATES, BibEntry
 from bibtui.pdf.paths import find_pdf_for_entry
@@ -31,6 +38,33 @@ _COL_OVERHEAD_NO_JOURNAL_WITH_ADDED = 68
 _COL_OVERHEAD_NO_JOURNAL_NO_ADDED = 58
 _JOURNAL_THRESHOLD = 120  # min widget width (chars) to show the Journal column
 _ADDED_THRESHOLD = 140  # min widget width (chars) to show the Date Added column
+_SEARCH_DEBOUNCE = 0.1  # seconds of typing pause before the search runs
+
+
+def _truncate(text: str, width: int) -> str:
+    """Return *text* cut to *width* characters, marking a cut with "…"."""
+    return text if len(text) <= width else f"{text[:width]}…"
+
+
+_READ_STATE_RANK = {state: i for i, state in enumerate(READ_STATES)}
+
+# Sort key for each column, in column order.  None marks the Added column,
+# which sorts by its formatted cell (see EntryList.on_mount).
+_SORT_KEYS: tuple[Callable[[BibEntry], Any] | None, ...] = (
+    lambda e: _READ_STATE_RANK.get(e.read_state, 0),  # ◉ read state
+    lambda e: e.priority if e.priority > 0 else 99,  # ! priority
+    lambda e: 0 if e.file else 1,  # ◫ file
+    lambda e: 0 if e.url else 1,  # 🔗 url
+    lambda e: e.entry_type,
+    lambda e: e.year_number,
+    lambda e: e.authors_short.lower(),
+    lambda e: (
+        e.lowered("journal") if e.journal else e.raw_fields.get("booktitle", "").lower()
+    ),
+    lambda e: e.lowered("title"),
+    None,  # Added
+    lambda e: e.rating,
+)
 
 _FIELD_PREFIXES: dict[str, str] = {
     "t": "title",
@@ -53,13 +87,20 @@ _FIELD_PREFIXES: dict[str, str] = {
 }
 
 
-def _parse_query(query: str) -> tuple[list[tuple[str, str]], list[str]]:
+_Filters = tuple[tuple[str, str], ...]
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_query(query: str) -> tuple[_Filters, tuple[str, ...]]:
     """Split a query into field filters and free-text terms.
 
     Each space-separated token is either ``prefix:value`` (field filter) or a
     plain word (searched across all fields).  Multiple tokens are ANDed.
     The keyword ``AND`` (case-insensitive) is ignored, allowing queries like
     ``j:nature AND y:2025``.
+
+    Values and terms come back lowercased.  Results are memoised, since a
+    single search parses its query (and the previous one) several times.
     """
     filters: list[tuple[str, str]] = []
     free_terms: list[str] = []
@@ -73,56 +114,178 @@ def _parse_query(query: str) -> tuple[list[tuple[str, str]], list[str]]:
                 filters.append((field, value.lower()))
                 continue
         free_terms.append(token.lower())
-    return filters, free_terms
+    return tuple(filters), tuple(free_terms)
+
+
+def _filter_check(field: str, value: str) -> Callable[[BibEntry], bool]:
+    """Return a predicate for one ``prefix:value`` filter."""
+    if field == "year":
+        if "-" in value:
+            # Range: y:2010-2020
+            parts = value.split("-", 1)
+            try:
+                y_min, y_max = int(parts[0]), int(parts[1])
+            except ValueError:
+                pass
+            else:
+                return lambda e: y_min <= e.year_number <= y_max
+        return lambda e: value in e.year
+    if field == "journal":
+        return lambda e: (
+            value
+            in (
+                e.lowered("journal")
+                if e.journal
+                else e.raw_fields.get("booktitle", "").lower()
+            )
+        )
+    name = "key" if field == "citekey" else field
+    return lambda e: value in e.lowered(name)
 
 
-def _entry_matches(
-    entry, filters: list[tuple[str, str]], free_terms: list[str]
-) -> bool:
-    for field, value in filters:
-        if field == "title":
-            if value not in entry.title.lower():
-                return False
-        elif field == "author":
-            if value not in entry.author.lower():
-                return False
-        elif field == "keywords":
-            if value not in entry.keywords.lower():
-                return False
-        elif field == "year":
-            if "-" in value:
-                # Range: y:2010-2020
-                parts = value.split("-", 1)
-                try:
-                    y_min, y_max = int(parts[0]), int(parts[1])
-                    y = int(entry.year) if entry.year.isdigit() else 0
-                    if not (y_min <= y <= y_max):
-                        return False
-                except ValueError:
-                    if value not in entry.year:
-                        return False
-            else:
-                if value not in entry.year:
+def _essential_terms(free_terms: tuple[str, ...]) -> tuple[str, ...]:
+    """Return *free_terms* longest first, without terms another one implies.
+
+    A term contained in a longer term (``ice`` in ``iceberg``) can never
+    reject an entry the longer one accepts, so it is not scanned for.
+    Longer terms also match fewer entries, so trying them first fails sooner.
+    """
+    kept: list[str] = []
+    for term in sorted(dict.fromkeys(free_terms), key=len, reverse=True):
+        if not any(term in longer for longer in kept):
+            kept.append(term)
+    return tuple(kept)
+
+
+def _compile_query(
+    filters: _Filters, free_terms: tuple[str, ...]
+) -> Callable[[BibEntry], bool]:
+    """Turn a parsed query into a single entry predicate.
+
+    Field dispatch and year-range parsing happen once per query here rather
+    than once per entry.
+    """
+    checks = [_filter_check(field, value) for field, value in filters]
+    terms = _essential_terms(free_terms)
+    if len(terms) == 1:
+        term = terms[0]
+        checks.append(lambda e: term in e.search_blob)
+    elif terms:
+
+        def free_text(entry: BibEntry) -> bool:
+            blob = entry.search_blob
+            for term in terms:
+                if term not in blob:
                     return False
-        elif field == "journal":
-            journal = (entry.journal or entry.raw_fields.get("booktitle", "")).lower()
-            if value not in journal:
-                return False
-        elif field == "url":
-            if value not in entry.url.lower():
-                return False
-        elif field == "citekey":
-            if value not in entry.key.lower():
+            return True
+
+        checks.append(free_text)
+
+    def matches(entry: BibEntry) -> bool:
+        for check in checks:
+            if not check(entry):
                 return False
-    for term in free_terms:
-        if not (
-            term in entry.title.lower()
-            or term in entry.author.lower()
-            or term in entry.keywords.lower()
-            or term in entry.key.lower()
-        ):
-            return False
-    return True
+        return True
+
+    return matches
+
+
+def _entry_matches(
+    entry: BibEntry, filters: _Filters, free_terms: tuple[str, ...]
+) -> bool:
+    return _compile_query(filters, free_terms)(entry)
+
+
+class _SearchIndex:
+    """Every entry's search blob joined into one string.
+
+    Finding the entries that contain a free-text term is then a run of
+    ``str.find`` calls over contiguous memory, one per matching entry,
+    instead of an ``in`` test per entry.  The index only proposes
+    candidates; they are checked against the full query afterwards, so a
+    stale index can at worst miss an entry edited since it was built.
+    """
+
+    __slots__ = ("_blobs", "_positions", "_starts", "_text", "entries")
+
+    def __init__(self, entries: list[BibEntry]) -> None:
+        self.entries = entries
+        blobs = [e.search_blob for e in entries]
+        self._blobs = blobs
+        # NUL never occurs in a search term, so matches cannot span entries.
+        self._text = "\0".join(blobs)
+        starts: list[int] = []
+        pos = 0
+        for blob in blobs:
+            starts.append(pos)
+            pos += len(blob) + 1
+        self._starts = starts
+        self._positions: dict[int, int] | None = None
+
+    def is_current(self, entry: BibEntry) -> bool:
+        """Return True if the index holds *entry* with its current blob."""
+        positions = self._positions
+        if positions is None:
+            positions = {id(e): i for i, e in enumerate(self.entries)}
+            self._positions = positions
+        i = positions.get(id(entry))
+        return i is not None and self._blobs[i] == entry.search_blob
+
+    def candidates(self, term: str) -> list[BibEntry]:
+        """Return the entries whose search blob may contain *term*, in order.
+
+        For a term so common that most entries contain it, per-hit lookups
+        cost more than they save, so every entry is returned.
+        """
+        text, starts, entries = self._text, self._starts, self.entries
+        if text.count(term) > len(entries) // 4:
+            return entries
+        found: list[BibEntry] = []
+        pos = text.find(term)
+        while pos != -1:
+            i = bisect_right(starts, pos) - 1
+            found.append(entries[i])
+            if i + 1 == len(starts):
+                break
+            pos = text.find(term, starts[i + 1])
+        return found
+
+
+def _run_query(query: str, base: list[BibEntry] | _SearchIndex) -> list[BibEntry]:
+    """Return the entries of *base* that match *query*."""
+    filters, free_terms = _parse_query(query)
+    match = _compile_query(filters, free_terms)
+    if isinstance(base, _SearchIndex):
+        # The longest term is usually the most selective.
+        base = base.candidates(max(free_terms, key=len)) if free_terms else base.entries
+    return [e for e in base if match(e)]
+
+
+def _term_narrows(old: str, new: str) -> bool:
+    """Return True if every entry matching *new* also matches *old*."""
+    return old in new
+
+
+def _filter_narrows(old: tuple[str, str], new: tuple[str, str]) -> bool:
+    if old[0] != new[0]:
+        return False
+    if old[0] == "year" and ("-" in old[1] or "-" in new[1]):
+        return old == new  # ranges are not substring matches
+    return _term_narrows(old[1], new[1])
+
+
+def _query_narrows(old: str, new: str) -> bool:
+    """Return True if *new* can only match a subset of what *old* matched.
+
+    Every clause of *old* must be implied by some clause of *new* — e.g.
+    ``glac`` by ``glacier``.  When it is, a search for *new* only needs to
+    look at the results for *old*.
+    """
+    old_filters, old_terms = _parse_query(old)
+    new_filters, new_terms = _parse_query(new)
+    return all(
+        any(_filter_narrows(f, g) for g in new_filters) for f in old_filters
+    ) and all(any(_term_narrows(t, u) for u in new_terms) for t in old_terms)
 
 
 class EntryList(Widget):
@@ -149,8 +312,18 @@ class EntryList(Widget):
 
     def __init__(self, entries: list[BibEntry], **kwargs):
         super().__init__(**kwargs)
+        # Built here rather than in compose() so the hot paths (search, row
+        # refresh, key handling) need no DOM query to reach them.
+        self._search_input = Input(
+            placeholder="Search… (a:smith j:nature y:2025 k:ice c:smith2020)",
+            id="search-input",
+        )
+        self._table = DataTable(id="entry-table", cursor_type="row")
         self._all_entries: list[BibEntry] = entries
         self._filtered: list[BibEntry] = list(entries)
+        # id(entry) -> key of the row showing it.  Rows get generated keys,
+        # since a .bib file may hold the same citekey more than once.
+        self._row_keys: dict[int, RowKey] = {}
         self._col_keys: tuple[ColumnKey, ...] = ()
         self._col_state: ColumnKey | None = None
         self._col_priority: ColumnKey | None = None
@@ -165,29 +338,43 @@ class EntryList(Widget):
         self._added_visible: bool = True
         self._sort_key: ColumnKey | None = None
         self._sort_reverse: bool = False
+        self._sort_fns: dict[ColumnKey, Callable[[BibEntry], Any]] = {}
         self._pdf_base_dir: str = ""
+        # key -> (entry, cells).  Searching and sorting rebuild the rows
+        # often; this saves re-formatting them, including a stat (and maybe a
+        # glob) for the PDF icon.  Dropped by refresh_row/refresh_entries,
+        # which the app calls after every edit.
+        self._row_cache: dict[str, tuple[BibEntry, tuple[str, ...]]] = {}
+        self._search_timer: Timer | None = None
+        # Bumped whenever the filtered rows are rebuilt, so results from an
+        # older background search are dropped.
+        self._filter_generation: int = 0
+        self._filter_running: bool = False
+        # (query, matches) of the last completed search.  A query that only
+        # narrows it filters those matches instead of the whole library.
+        self._last_search: tuple[str, list[BibEntry]] | None = None
+        self._search_index: _SearchIndex | None = None
 
     def set_pdf_base_dir(self, base_dir: str) -> None:
+        if base_dir != self._pdf_base_dir:
+            self._row_cache.clear()
         self._pdf_base_dir = base_dir
 
     def _file_icon(self, entry: BibEntry) -> str:
         if not entry.file:
             return " "
-        return (
-            "■"
-            if find_pdf_for_entry(entry.file, entry.key, self._pdf_base_dir)
-            else "□"
+        base_dir = self._pdf_base_dir
+        found = os.path.exists(entry.resolved_file(base_dir)) or find_pdf_for_entry(
+            "", entry.key, base_dir
         )
+        return "■" if found else "□"
 
     def compose(self) -> ComposeResult:
-        yield Input(
-            placeholder="Search… (a:smith j:nature y:2025 k:ice c:smith2020)",
-            id="search-input",
-        )
-        yield DataTable(id="entry-table", cursor_type="row")
+        yield self._search_input
+        yield self._table
 
     def on_mount(self) -> None:
-        table = self.query_one(DataTable)
+        table = self._table
         col_state = table.add_column("◉", width=1)
         col_priority = table.add_column("!", width=1)
         col_file = table.add_column("◫", width=1)
@@ -220,7 +407,13 @@ class EntryList(Widget):
         self._col_title = col_title
         self._col_added = col_added
         self._col_rating = col_rating
-        self._populate_table(self._all_entries)
+        self._sort_fns = {
+            key: fn for key, fn in zip(self._col_keys, _SORT_KEYS) if fn is not None
+        }
+        # Parsing date-added values is slow; the memoised row cells hold the
+        # formatted date already.
+        self._sort_fns[col_added] = lambda e: self._row_cells(e)[9]
+        self._show_entries(self._all_entries)
         self._update_title_width()
 
     def on_resize(self, event) -> None:
@@ -235,7 +428,7 @@ class EntryList(Widget):
             return
         show_journal = self.size.width >= _JOURNAL_THRESHOLD
         show_added = self.size.width >= _ADDED_THRESHOLD
-        table = self.query_one(DataTable)
+        table = self._table
         if self._col_journal is not None and show_journal != self._journal_visible:
             self._journal_visible = show_journal
             table.columns[self._col_journal].width = 17 if show_journal else 0
@@ -261,28 +454,52 @@ class EntryList(Widget):
     def _date_added_text(entry: BibEntry) -> str:
         return format_bib_date(extract_date_added(entry.raw_fields))
 
-    def _populate_table(self, entries: list[BibEntry]) -> None:
-        table = self.query_one(DataTable)
-        table.clear()
-        self._filtered = entries
-        for e in entries:
-            journal = e.journal or e.raw_fields.get("booktitle", "")
-            table.add_row(
-                e.read_state_icon,
-                e.priority_icon,
-                self._file_icon(e),
-                e.url_icon,
-                e.entry_type[:7],
-                e.year[:4] if e.year else "",
-                e.authors_short[:12] + "…"
-                if len(e.authors_short) > 12
-                else e.authors_short,
-                journal[:16] + "…" if len(journal) > 16 else journal,
-                e.title,
-                self._date_added_text(e),
-                e.rating_stars,
-                key=e.key,
-            )
+    def _row_cells(self, e: BibEntry) -> tuple[str, ...]:
+        """Return the cell values for *e* in column order."""
+        cached = self._row_cache.get(e.key)
+        if cached is not None and cached[0] is e:
+            return cached[1]
+        cells = self._format_row(e)
+        self._row_cache[e.key] = (e, cells)
+        return cells
+
+    def _format_row(self, e: BibEntry) -> tuple[str, ...]:
+        journal = e.journal or e.raw_fields.get("booktitle", "")
+        return (
+            e.read_state_icon,
+            e.priority_icon,
+            self._file_icon(e),
+            e.url_icon,
+            e.entry_type[:7],
+            e.year[:4],
+            _truncate(e.authors_short, 12),
+            _truncate(journal, 16),
+            e.title,
+            self._date_added_text(e),
+            e.rating_stars,
+        )
+
+    def _show_entries(self, entries: list[BibEntry]) -> None:
+        """Show *entries* in the active sort order, rebuilding the rows once."""
+        # Own copy, so appending a row never mutates the caller's master list.
+        self._filtered = list(entries)
+        self._sort_filtered()
+        self._show_filtered()
+
+    def _show_filtered(self) -> None:
+        """Make the table rows match ``self._filtered``."""
+        table = self._table
+        row_keys: dict[int, RowKey] = {}
+        with self.app.batch_update():
+            table.clear()
+            for e in self._filtered:
+                row_keys[id(e)] = table.add_row(*self._row_cells(e))
+        self._row_keys = row_keys
+
+    def _row_index(self, entry: BibEntry) -> int | None:
+        """Return the index of the row showing *entry* itself, if any."""
+        row_key = self._row_keys.get(id(entry))
+        return None if row_key is None else self._table.get_row_index(row_key)
 
     # ── Sorting ───────────────────────────────────────────────────────────
 
@@ -297,68 +514,21 @@ class EntryList(Widget):
         self._apply_sort()
         self._update_header_labels()
 
-    def _sort_fn(self, col_key: ColumnKey):
-        """Return a key function for sorting BibEntry by the given column."""
-        idx = list(self._col_keys).index(col_key)
-        if idx == 0:  # ◉ read state
-            return lambda e: (
-                READ_STATES.index(e.read_state) if e.read_state in READ_STATES else 0
+    def _sort_filtered(self) -> None:
+        if self._sort_key is not None:
+            self._filtered.sort(
+                key=self._sort_fns[self._sort_key], reverse=self._sort_reverse
             )
-        if idx == 1:  # ! priority
-            return lambda e: e.priority if e.priority > 0 else 99
-        if idx == 2:  # ◫ file
-            return lambda e: 0 if e.file else 1
-        if idx == 3:  # ⊕ url
-            return lambda e: 0 if e.url else 1
-        if idx == 4:  # Type
-            return lambda e: e.entry_type
-        if idx == 5:  # Year
-            return lambda e: int(e.year) if e.year.isdigit() else 0
-        if idx == 6:  # Author
-            return lambda e: e.authors_short.lower()
-        if idx == 7:  # Journal
-            return lambda e: (e.journal or e.raw_fields.get("booktitle", "")).lower()
-        if idx == 8:  # Title
-            return lambda e: e.title.lower()
-        if idx == 9:  # Added
-            return lambda e: self._date_added_text(e)
-        if idx == 10:  # ★ rating
-            return lambda e: e.rating
-        return lambda e: ""
 
     def _apply_sort(self) -> None:
         if self._sort_key is None:
             return
-        self._filtered = sorted(
-            self._filtered,
-            key=self._sort_fn(self._sort_key),
-            reverse=self._sort_reverse,
-        )
-        # Rebuild the table rows in new order without re-fetching data
-        table = self.query_one(DataTable)
-        table.clear()
-        for e in self._filtered:
-            journal = e.journal or e.raw_fields.get("booktitle", "")
-            table.add_row(
-                e.read_state_icon,
-                e.priority_icon,
-                self._file_icon(e),
-                e.url_icon,
-                e.entry_type[:7],
-                e.year[:4] if e.year else "",
-                e.authors_short[:12] + "…"
-                if len(e.authors_short) > 12
-                else e.authors_short,
-                journal[:16] + "…" if len(journal) > 16 else journal,
-                e.title,
-                self._date_added_text(e),
-                e.rating_stars,
-                key=e.key,
-            )
+        self._sort_filtered()
+        self._show_filtered()
 
     def _update_header_labels(self) -> None:
         """Put ▲/▼ on the active sort column, restore others."""
-        table = self.query_one(DataTable)
+        table = self._table
         for key, label in zip(self._col_keys, _COL_LABELS):
             if key == self._sort_key:
                 indicator = "▼" if self._sort_reverse else "▲"
@@ -371,27 +541,73 @@ class EntryList(Widget):
 
     @on(Input.Changed, "#search-input")
     def on_search_changed(self, event: Input.Changed) -> None:
-        query = event.value.strip()
+        if self._search_timer is not None:
+            self._search_timer.stop()
+        self._search_timer = self.set_timer(_SEARCH_DEBOUNCE, self._start_filter)
+
+    def _start_filter(self) -> None:
+        """Filter the entries for the current query off the UI thread."""
+        self._search_timer = None
+        self._filter_generation += 1
+        query = self._search_input.value.strip()
+        if not query:
+            self._filter_running = False
+            self._show_entries(self._all_entries)
+            return
+        self._filter_running = True
+        self._filter_entries(self._filter_generation, query, self._search_base(query))
+
+    def _search_base(self, query: str) -> list[BibEntry] | _SearchIndex:
+        """Return the entries a search for *query* has to look at."""
+        last = self._last_search
+        if last is not None and _query_narrows(last[0], query):
+            return last[1]
+        index = self._search_index
+        if (
+            index is None
+            or index.entries is not self._all_entries
+            or len(index.entries) != len(self._all_entries)
+        ):
+            index = self._search_index = _SearchIndex(self._all_entries)
+        return index
+
+    @work(thread=True, exclusive=True, group="filter")
+    def _filter_entries(
+        self, generation: int, query: str, entries: list[BibEntry] | _SearchIndex
+    ) -> None:
+        matched = _run_query(query, entries)
+        self.app.call_from_thread(self._apply_filter, generation, query, matched)
+
+    def _apply_filter(
+        self, generation: int, query: str, matched: list[BibEntry]
+    ) -> None:
+        if generation != self._filter_generation:
+            return  # superseded by a newer search or a reload
+        self._filter_running = False
+        self._last_search = (query, matched)
+        self._show_entries(matched)
+
+    def _filter_now(self) -> None:
+        """Filter the entries for the current query synchronously."""
+        self._filter_generation += 1
+        self._filter_running = False
+        query = self._search_input.value.strip()
         if not query:
             base = self._all_entries
         else:
-            filters, free_terms = _parse_query(query)
-            base = [
-                e for e in self._all_entries if _entry_matches(e, filters, free_terms)
-            ]
-        self._populate_table(base)
-        if self._sort_key is not None:
-            self._apply_sort()
+            base = _run_query(query, self._search_base(query))
+            self._last_search = (query, base)
+        self._show_entries(base)
 
     @on(Input.Submitted, "#search-input")
     def on_search_submitted(self, event: Input.Submitted) -> None:
         """Enter in search bar moves focus to the table."""
-        self.query_one(DataTable).focus()
+        self._table.focus()
 
     def on_key(self, event: events.Key) -> None:
         """Allow arrow keys to move the table cursor while search is focused."""
-        table = self.query_one(DataTable)
-        search = self.query_one(Input)
+        table = self._table
+        search = self._search_input
         if self.app.focused is search:
             if event.key == "down":
                 table.action_cursor_down()
@@ -404,48 +620,107 @@ class EntryList(Widget):
 
     def refresh_entries(self, entries: list[BibEntry]) -> None:
         """Reload all entries (e.g. after add/edit)."""
-        table = self.query_one(DataTable)
         selected_before = self.selected_entry
-        selected_key = selected_before.key if selected_before is not None else None
         self._all_entries = entries
-        search = self.query_one(Input).value
-        if search:
-            self.on_search_changed(Input.Changed(self.query_one(Input), search))
-        else:
-            self._populate_table(entries)
-            if self._sort_key is not None:
-                self._apply_sort()
-
-        if selected_key is None:
-            return
-        try:
-            row_idx = next(
-                i for i, e in enumerate(self._filtered) if e.key == selected_key
-            )
-        except StopIteration:
-            return
-        table.move_cursor(row=row_idx)
+        self._last_search = None
+        self._search_index = None
+        self._row_cache.clear()
+        # One repaint for the rebuilt rows and the restored cursor.
+        with self.app.batch_update():
+            self._filter_now()
+            if selected_before is None:
+                return
+            row_idx = self._row_index(selected_before)
+            if row_idx is None:
+                row_idx = next(
+                    (
+                        i
+                        for i, e in enumerate(self._filtered)
+                        if e.key == selected_before.key
+                    ),
+                    None,
+                )
+            if row_idx is not None:
+                self._table.move_cursor(row=row_idx)
 
     def refresh_row(self, entry: BibEntry) -> None:
-        """Update the read-state, priority, file, and rating cells for a single row."""
-        table = self.query_one(DataTable)
-        table.update_cell(
-            entry.key, self._col_state, entry.read_state_icon, update_width=False
-        )
-        table.update_cell(
-            entry.key, self._col_priority, entry.priority_icon, update_width=False
-        )
-        table.update_cell(
-            entry.key, self._col_file, self._file_icon(entry), update_width=False
-        )
-        table.update_cell(entry.key, self._col_url, entry.url_icon, update_width=False)
-        table.update_cell(
-            entry.key, self._col_rating, entry.rating_stars, update_width=False
-        )
+        """Re-render the cells of the row showing *entry*, in place.
+
+        *entry* may be a new object for an existing key (e.g. from the raw
+        editor); it replaces the first entry shown with that key.  Rows hidden by
+        the current search are left alone.  The row keeps its position even if
+        the edit would change the active sort order or search match.
+        """
+        # The edit may change which searches the entry matches.  The index
+        # only needs rebuilding if it changed a searchable field.
+        self._last_search = None
+        index = self._search_index
+        if index is not None and not index.is_current(entry):
+            self._search_index = None
+        self._row_cache.pop(entry.key, None)
+        table = self._table
+        row_key = self._row_keys.get(id(entry))
+        if row_key is None:
+            old = next((e for e in self._filtered if e.key == entry.key), None)
+            if old is None:
+                return
+            row_key = self._row_keys.pop(id(old))
+            self._row_keys[id(entry)] = row_key
+        self._filtered[table.get_row_index(row_key)] = entry
+        for col_key, value in zip(self._col_keys, self._row_cells(entry)):
+            table.update_cell(row_key, col_key, value, update_width=False)
+
+    def append_row(self, entry: BibEntry) -> int | None:
+        """Show a row for *entry*, which was just appended to the master list.
+
+        Returns the row index, or None when the active search hides the entry
+        or is still running.
+        """
+        self._last_search = None
+        self._search_index = None
+        if self._filter_running:
+            # The search in flight may have missed the entry; run it again.
+            self._start_filter()
+            return None
+        query = self._search_input.value.strip()
+        if query:
+            filters, free_terms = _parse_query(query)
+            if not _entry_matches(entry, filters, free_terms):
+                return None
+        self._filtered.append(entry)
+        if self._sort_key is not None:
+            # DataTable can only append; re-sort to place the new row.
+            self._apply_sort()
+            return self._row_index(entry)
+        self._row_keys[id(entry)] = self._table.add_row(*self._row_cells(entry))
+        return len(self._filtered) - 1
+
+    def remove_row(self, key: str, entries: list[BibEntry]) -> None:
+        """Drop the rows for *key*, which was just removed from the master list.
+
+        *entries* is the new master list.  Unlike :meth:`refresh_entries`,
+        the search is not re-run and the other rows are left as they are.
+        """
+        self._all_entries = entries
+        self._search_index = None
+        self._row_cache.pop(key, None)
+        if self._last_search is not None:
+            query, matches = self._last_search
+            self._last_search = (query, [e for e in matches if e.key != key])
+        if self._filter_running:
+            # The search in flight still sees the old list; run it again.
+            self._start_filter()
+            return
+        filtered = self._filtered
+        for index in range(len(filtered) - 1, -1, -1):
+            entry = filtered[index]
+            if entry.key == key:
+                del filtered[index]
+                self._table.remove_row(self._row_keys.pop(id(entry)))
 
     @property
     def selected_entry(self) -> BibEntry | None:
-        table = self.query_one(DataTable)
+        table = self._table
         if table.cursor_row < 0 or not self._filtered:
             return None
         if table.cursor_row >= len(self._filtered):
@@ -1,4 +1,7 @@
+import functools
+from bisect import bisect_left, bisect_right, insort
 from collections.abc import Iterable
+from contextlib import closing
 from pathlib import Path
 from typing import TypeVar
 
@@ -6,7 +9,9 @@ from textual import events, on, work
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical, VerticalScroll
+from textual.content import Content
 from textual.screen import ModalScreen
+from textual.timer import Timer
 from textual.widgets import (
     Button,
     DirectoryTree,
@@ -26,6 +31,7 @@ from textual.widgets._selection_list import Selection
 from bibtui.bib.citation_preview import available_csl_styles, default_csl_style_key
 from bibtui.bib.models import BibEntry
 from bibtui.bib.parser import bibtex_str_to_entry, entry_to_bibtex_str
+from bibtui.pdf.fetcher import FetchError, add_pdf, fetch_pdf, fetch_pdfs_bulk
 from bibtui.utils.config import Config
 
 _ModalResult = TypeVar("_ModalResult")
@@ -144,10 +150,12 @@ class LibraryFetchConfirmModal(_BaseModal[tuple[bool, bool] | None]):
                 yield Button("Start", variant="primary", id="btn-start")
                 yield Button("Cancel", id="btn-cancel")
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "btn-cancel":
-            self.dismiss(None)
-            return
+    @on(Button.Pressed, "#btn-cancel")
+    def _cancel_pressed(self) -> None:
+        self.dismiss(None)
+
+    @on(Button.Pressed, "#btn-start")
+    def _start_pressed(self) -> None:
         overwrite = self.query_one("#overwrite-switch", Switch).value
         self.dismiss((True, overwrite))
 
@@ -171,58 +179,79 @@ class DOIModal(_BaseModal[BibEntry | None]):
     #doi-status.error    { color: $error; }
     """
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._input = Input(
+            placeholder="Enter DOI (e.g. 10.1038/nature12345)", id="doi-input"
+        )
+        self._status = Static("", id="doi-status")
+        self._btn_fetch = Button("Fetch", variant="primary", id="btn-fetch")
+
     def compose(self) -> ComposeResult:
         with Vertical():
             yield Label("[bold]Entry from DOI[/bold]", classes="modal-title")
-            yield Input(
-                placeholder="Enter DOI (e.g. 10.1038/nature12345)", id="doi-input"
-            )
-            yield Static("", id="doi-status")
+            yield self._input
+            yield self._status
             with Horizontal(classes="modal-buttons"):
-                yield Button("Fetch", variant="primary", id="btn-fetch")
+                yield self._btn_fetch
                 yield Button("Cancel", id="btn-cancel")
 
     def on_mount(self) -> None:
-        self.call_after_refresh(self.query_one("#doi-input", Input).focus)
+        self.call_after_refresh(self._input.focus)
+        self._preload_crossref()
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "btn-cancel":
-            self.dismiss(None)
-        elif event.button.id == "btn-fetch":
-            self._do_fetch()
+    @work(thread=True, group="doi-preload")
+    def _preload_crossref(self) -> None:
+        """Import the Crossref client while the user is still typing a DOI.
+
+        fetch_by_doi defers the import to keep it off the startup path; doing
+        it here means the first lookup no longer waits for it.
+        """
+        import habanero  # noqa: F401
+
+    @on(Button.Pressed, "#btn-cancel")
+    def _cancel_pressed(self) -> None:
+        self.dismiss(None)
+
+    @on(Button.Pressed, "#btn-fetch")
+    def _fetch_pressed(self) -> None:
+        self._do_fetch()
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         self._do_fetch()
 
     def _do_fetch(self) -> None:
-        doi = self.query_one("#doi-input", Input).value.strip()
-        if not doi:
-            return
-        status = self.query_one("#doi-status", Static)
+        doi = self._input.value.strip()
+        if not doi or self._btn_fetch.disabled:
+            return  # nothing to look up, or a lookup is already running
+        self._btn_fetch.disabled = True
+        status = self._status
         status.set_classes("fetching")
         status.update("Fetching…")
         self._fetch_doi(doi)
 
-    @work(thread=True)
+    @work(thread=True, exclusive=True, group="doi-fetch")
     def _fetch_doi(self, doi: str) -> None:
         try:
-            from bibtui.bib.doi import fetch_by_doi
+            from bibtui.bib.doi import fetch_by_doi_cached
 
-            entry = fetch_by_doi(doi)
-            self.app.call_from_thread(self._on_fetch_success, entry)
+            entry = fetch_by_doi_cached(doi)
+            message = f"Found: {entry.title[:60]}"
+            self.app.call_from_thread(self._on_fetch_success, entry, message)
         except Exception as e:  # noqa: BLE001
             self.app.call_from_thread(self._on_fetch_error, str(e))
 
-    def _on_fetch_success(self, entry: BibEntry) -> None:
-        status = self.query_one("#doi-status", Static)
+    def _on_fetch_success(self, entry: BibEntry, message: str) -> None:
+        status = self._status
         status.set_classes("success")
-        status.update(f"Found: {entry.title[:60]}")
+        status.update(message)
         self.app.call_later(self._confirm, entry)
 
     def _on_fetch_error(self, message: str) -> None:
-        status = self.query_one("#doi-status", Static)
+        status = self._status
         status.set_classes("error")
         status.update(f"Error: {message}")
+        self._btn_fetch.disabled = False
 
     def _confirm(self, entry: BibEntry) -> None:
         self.dismiss(entry)
@@ -266,9 +295,7 @@ class EditModal(_BaseModal[BibEntry | None]):
     def compose(self) -> ComposeResult:
         e = self._entry
         with Vertical():
-            yield Label(
-                f"[bold]Edit Entry[/bold]  [dim]{e.key}[/dim]", classes="modal-title"
-            )
+            yield Label(self._heading(e), classes="modal-title", id="edit-heading")
             with VerticalScroll(id="edit-fields"):
                 yield Label("Title")
                 yield Input(value=e.title, id="edit-title")
@@ -292,30 +319,48 @@ class EditModal(_BaseModal[BibEntry | None]):
                 yield Button("Write", variant="primary", id="btn-save")
                 yield Button("Cancel", id="btn-cancel")
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "btn-cancel":
-            self.dismiss(None)
-        elif event.button.id == "btn-save":
-            self._save()
+    @staticmethod
+    def _heading(entry: BibEntry) -> str:
+        return f"[bold]Edit Entry[/bold]  [dim]{entry.key}[/dim]"
+
+    def load(self, entry: BibEntry) -> None:
+        """Point the already composed dialog at *entry* before it is re-shown."""
+        self._entry = entry
+        self.query_one("#edit-heading", Label).update(self._heading(entry))
+        for name, widget in self._fields().items():
+            value = getattr(entry, name)
+            if isinstance(widget, TextArea):
+                widget.text = value
+            else:
+                widget.value = value
+        self.query_one("#edit-fields", VerticalScroll).scroll_home(animate=False)
+        self.set_focus(self.query_one("#edit-title", Input))
+
+    @on(Button.Pressed, "#btn-cancel")
+    def _cancel_pressed(self) -> None:
+        self.dismiss(None)
+
+    @on(Button.Pressed, "#btn-save")
+    def _save_pressed(self) -> None:
+        self._save()
 
     def on_input_submitted(self, _: Input.Submitted) -> None:
         self._save()
 
+    def _fields(self) -> dict[str, Input | TextArea]:
+        """Map each edited BibEntry attribute to its widget in one DOM walk."""
+        return {
+            widget.id.removeprefix("edit-"): widget
+            for widget in self.query("#edit-fields Input, #edit-fields TextArea")
+            if isinstance(widget, (Input, TextArea)) and widget.id
+        }
+
     def _save(self) -> None:
         e = self._entry
-
-        def v(widget_id: str) -> str:
-            return self.query_one(widget_id, Input).value
-
-        e.title = v("#edit-title")
-        e.author = v("#edit-author")
-        e.year = v("#edit-year")
-        e.journal = v("#edit-journal")
-        e.doi = v("#edit-doi")
-        e.keywords = v("#edit-keywords")
-        e.file = v("#edit-file")
-        e.abstract = self.query_one("#edit-abstract", TextArea).text
-        e.comment = self.query_one("#edit-comment", TextArea).text
+        for name, widget in self._fields().items():
+            setattr(
+                e, name, widget.text if isinstance(widget, TextArea) else widget.value
+            )
         self.dismiss(e)
 
     def action_save_and_close(self) -> None:
@@ -325,6 +370,17 @@ class EditModal(_BaseModal[BibEntry | None]):
         self.dismiss(None)
 
 
+_KW_FILTER_DEBOUNCE = 0.05  # seconds of typing pause before the list is filtered
+# Narrowing the keyword list removes options one by one up to this many;
+# each removal re-indexes the list, so larger changes rebuild it instead.
+_KW_MAX_REMOVALS = 32
+# Keywords the filter scan covers before judging whether a filter is common.
+_KW_SCAN_SAMPLE = 64
+# A rebuilt keyword list is filled this many options per frame, so a large
+# keyword set does not hold back the modal's first paint.
+_KW_BATCH = 200
+
+
 class KeywordsModal(_BaseModal["tuple[str, set[str]] | None"]):
     """Keyword picker: select from all bib-wide keywords, add new ones."""
 
@@ -361,10 +417,32 @@ class KeywordsModal(_BaseModal["tuple[str, set[str]] | None"]):
     ):
         super().__init__(**kwargs)
         self._all_keywords = list(all_keywords)
+        # Case-folded form of every keyword in _all_keywords, for filtering on
+        # each keystroke; also serves as the O(1) membership test for it.
+        self._folded: dict[str, str] = {kw: kw.casefold() for kw in self._all_keywords}
+        # Position of every keyword in _all_keywords, so saving can order the
+        # selection without scanning the whole list.  Keywords added here go
+        # to the front, so they count down from _front_rank.
+        self._rank: dict[str, int] = {kw: i for i, kw in enumerate(self._all_keywords)}
+        self._front_rank = 0
         self._selected: set[str] = set(entry.keywords_list)
+        # _selected in sorted order, kept in step by _select/_deselect so the
+        # list does not have to re-sort it on every keystroke.
+        self._selected_sorted: list[str] = sorted(self._selected)
         self._shown: list[str] = []
         self._keyword_counts = keyword_counts
         self._delete_everywhere: set[str] = set()
+        self._filter_timer: Timer | None = None
+        # Case-folded keywords joined on NUL plus each one's start offset,
+        # built on first use and dropped whenever _all_keywords changes.
+        self._haystack: tuple[str, list[int]] | None = None
+        # The last non-empty filter and its matches; a filter containing it
+        # only needs to re-check those.  Dropped together with _haystack.
+        self._last_match: tuple[str, list[str]] | None = None
+        # Bumped on every full rebuild; stale batches check it and stop.
+        self._populate_generation = 0
+        # Filter text the list was last built for.
+        self._list_filter: str | None = None
 
     def compose(self) -> ComposeResult:
         with Vertical():
@@ -416,9 +494,12 @@ class KeywordsModal(_BaseModal["tuple[str, set[str]] | None"]):
         if not confirmed:
             return
         self._delete_everywhere.add(kw)
-        self._selected.discard(kw)
-        if kw in self._all_keywords:
+        self._deselect(kw)
+        if self._folded.pop(kw, None) is not None:
             self._all_keywords.remove(kw)
+            del self._rank[kw]
+            self._haystack = None
+            self._last_match = None
         filter_val = self.query_one("#kw-filter", Input).value
         self._rebuild_list(filter_val)
 
@@ -426,31 +507,144 @@ class KeywordsModal(_BaseModal["tuple[str, set[str]] | None"]):
         """Pull current checkbox state into self._selected."""
         sl = self.query_one(SelectionList)
         selected_now = set(sl.selected)
-        for kw in self._shown:
+        # Options still waiting to be added cannot have been toggled.
+        for kw in self._shown[: sl.option_count]:
             if kw in selected_now:
-                self._selected.add(kw)
+                self._select(kw)
             else:
-                self._selected.discard(kw)
+                self._deselect(kw)
+
+    def _select(self, kw: str) -> None:
+        if kw not in self._selected:
+            self._selected.add(kw)
+            insort(self._selected_sorted, kw)
+
+    def _deselect(self, kw: str) -> None:
+        if kw in self._selected:
+            self._selected.remove(kw)
+            del self._selected_sorted[bisect_left(self._selected_sorted, kw)]
+
+    def _fold(self, kw: str) -> str:
+        folded = self._folded.get(kw)
+        return kw.casefold() if folded is None else folded
+
+    def _matching(self, f: str) -> list[str]:
+        """Return the keywords containing the case-folded *f*, in list order.
+
+        Scans one joined string with ``str.find`` rather than testing every
+        keyword, so a selective filter only visits the keywords it hits.
+        Once a filter proves common, the rest are tested one by one.
+        A filter containing the previous one only re-checks its matches.
+        """
+        keywords = self._all_keywords
+        if not f:
+            return list(keywords)
+        last = self._last_match
+        if last is not None and last[0] in f:
+            folded = self._folded
+            found = [kw for kw in last[1] if f in folded[kw]]
+            self._last_match = (f, found)
+            return found
+        if self._haystack is None:
+            starts: list[int] = []
+            pos = 0
+            for kw in keywords:
+                starts.append(pos)
+                pos += len(self._folded[kw]) + 1
+            # NUL cannot be typed into the filter, so hits never span keywords.
+            text = "\0".join(self._folded[kw] for kw in keywords)
+            self._haystack = (text, starts)
+        text, starts = self._haystack
+        found: list[str] = []
+        pos = text.find(f)
+        while pos != -1:
+            i = bisect_right(starts, pos) - 1
+            found.append(keywords[i])
+            if i >= _KW_SCAN_SAMPLE and len(found) * 4 > i:
+                # More than a quarter of the keywords so far matched, as a
+                # one-letter filter does: testing the rest directly beats a
+                # find and a bisect per hit.
+                folded = self._folded
+                found.extend(kw for kw in keywords[i + 1 :] if f in folded[kw])
+                break
+            if i + 1 == len(starts):
+                break
+            pos = text.find(f, starts[i + 1])
+        self._last_match = (f, found)
+        return found
 
     def _rebuild_list(self, filter_text: str) -> None:
-        f = filter_text.lower()
+        self._list_filter = filter_text
+        f = filter_text.casefold()
+        selected = self._selected
         # Always show selected keywords first, then filtered rest
-        selected_shown = sorted(kw for kw in self._selected if not f or f in kw.lower())
-        rest = [
-            kw
-            for kw in self._all_keywords
-            if kw not in self._selected and (not f or f in kw.lower())
-        ]
-        self._shown = selected_shown + rest
+        selected_shown = [kw for kw in self._selected_sorted if f in self._fold(kw)]
+        rest = [kw for kw in self._matching(f) if kw not in selected]
+        shown = selected_shown + rest
+        previous = self._shown
+        sl = self.query_one(SelectionList)
+        if shown == previous:
+            self._tick_selected(sl, selected_shown)
+            return
+        self._shown = shown
+        removed = len(previous) - len(shown)
+        remaining = iter(previous)
+        if (
+            0 < removed <= _KW_MAX_REMOVALS
+            and sl.option_count == len(previous)
+            and all(kw in remaining for kw in shown)
+        ):
+            # Narrowed: drop the options that no longer match, keep the rest.
+            keep = set(shown)
+            for index in range(len(previous) - 1, -1, -1):
+                if previous[index] not in keep:
+                    sl.remove_option_at_index(index)
+            self._tick_selected(sl, selected_shown)
+        else:
+            sl.clear_options()
+            self._populate_generation += 1
+            self._populate(self._populate_generation)
+
+    def _tick_selected(self, sl: SelectionList, selected_shown: list[str]) -> None:
+        """Tick the kept options of *selected_shown* that are still clear.
+
+        A keyword submitted before the filter debounce fires can become
+        selected without moving, so its existing option is reused as is.
+        """
+        for kw in selected_shown[: sl.option_count]:
+            sl.select(kw)
+
+    def _populate(self, generation: int) -> None:
+        """Add the next batch of ``_shown`` to the list, then yield a frame."""
+        if generation != self._populate_generation:
+            return
         sl = self.query_one(SelectionList)
-        sl.clear_options()
-        for kw in self._shown:
-            sl.add_option(Selection(kw, kw, kw in self._selected))
+        start = sl.option_count
+        selected = self._selected
+        # Plain Content prompts: keywords are not markup, so a "[" in one is
+        # shown as typed and no option pays for a markup parse.
+        sl.add_options(
+            [
+                Selection(Content(kw), kw, kw in selected)
+                for kw in self._shown[start : start + _KW_BATCH]
+            ]
+        )
+        if start + _KW_BATCH < len(self._shown):
+            self.call_after_refresh(self._populate, generation)
 
     @on(Input.Changed, "#kw-filter")
     def on_filter_changed(self, event: Input.Changed) -> None:
+        if self._filter_timer is not None:
+            self._filter_timer.stop()
+        self._filter_timer = self.set_timer(_KW_FILTER_DEBOUNCE, self._apply_filter)
+
+    def _apply_filter(self) -> None:
+        self._filter_timer = None
+        value = self.query_one("#kw-filter", Input).value
+        if value == self._list_filter:
+            return  # e.g. typed and erased within the debounce window
         self._sync_from_list()
-        self._rebuild_list(event.value)
+        self._rebuild_list(value)
 
     @on(Input.Submitted, "#kw-filter")
     def on_filter_submitted(self, event: Input.Submitted) -> None:
@@ -459,22 +653,32 @@ class KeywordsModal(_BaseModal["tuple[str, set[str]] | None"]):
             self.query_one(SelectionList).focus()
             return
         self._sync_from_list()
-        if kw not in self._all_keywords:
+        if kw not in self._folded:
             self._all_keywords.insert(0, kw)
-        self._selected.add(kw)
+            self._folded[kw] = kw.casefold()
+            self._front_rank -= 1
+            self._rank[kw] = self._front_rank
+            self._haystack = None
+            self._last_match = None
+        self._select(kw)
         self.query_one("#kw-filter", Input).clear()
         self._rebuild_list("")
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "btn-cancel":
-            self.dismiss(None)
-        elif event.button.id == "btn-save":
-            self._save()
+    @on(Button.Pressed, "#btn-cancel")
+    def _cancel_pressed(self) -> None:
+        self.dismiss(None)
+
+    @on(Button.Pressed, "#btn-save")
+    def _save_pressed(self) -> None:
+        self._save()
 
     def _save(self) -> None:
         self._sync_from_list()
-        # Preserve original order from all_keywords, then any extras
-        ordered = [kw for kw in self._all_keywords if kw in self._selected]
+        # Preserve the order of _all_keywords
+        rank = self._rank
+        ordered = sorted(
+            (kw for kw in self._selected if kw in rank), key=rank.__getitem__
+        )
         self.dismiss((", ".join(ordered), self._delete_everywhere))
 
     def action_save(self) -> None:
@@ -627,12 +831,14 @@ class SettingsModal(_BaseModal["Config | None"]):
         if isinstance(selected_style, str):
             self._config.default_citation_style = selected_style
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "btn-cancel":
-            self.dismiss(None)
-        elif event.button.id == "btn-save":
-            self._collect()
-            self.dismiss(self._config)
+    @on(Button.Pressed, "#btn-cancel")
+    def _cancel_pressed(self) -> None:
+        self.dismiss(None)
+
+    @on(Button.Pressed, "#btn-save")
+    def _save_pressed(self) -> None:
+        self._collect()
+        self.dismiss(self._config)
 
     def on_input_submitted(self, _: Input.Submitted) -> None:
         self._collect()
@@ -811,7 +1017,8 @@ class HelpModal(_BaseModal[None]):
     HelpModal #help-about { margin-bottom: 1; color: $text-muted; }
     """
 
-    def _make_about(self) -> str:
+    @staticmethod
+    def _make_about() -> str:
         try:
             from bibtui import __version__
 
@@ -847,15 +1054,29 @@ class HelpModal(_BaseModal[None]):
   [dim]k:ice a:jones[/dim]              keyword + author
   [dim]c:smith2020[/dim]                exact cite key search"""
 
+    @staticmethod
+    @functools.cache
+    def _help_content() -> tuple[Content, Content, Content]:
+        """The about text and the keybinding and search references.
+
+        Their markup is parsed on the first open and reused afterwards.
+        """
+        return (
+            Content.from_markup(HelpModal._make_about()),
+            Content.from_markup(_build_help_keys()),
+            Content.from_markup(HelpModal._SEARCH),
+        )
+
     def compose(self) -> ComposeResult:
         with Vertical():
             yield Label("[bold]Help[/bold]", classes="modal-title")
+            about, keys, search = self._help_content()
             with VerticalScroll():
-                yield Static(self._make_about(), id="help-about")
+                yield Static(about, id="help-about")
                 yield Label("[bold]Keybindings[/bold]", classes="modal-title")
-                yield Static(_build_help_keys())
+                yield Static(keys)
                 yield Label("[bold]Search syntax[/bold]", classes="modal-title")
-                yield Static(self._SEARCH)
+                yield Static(search)
             with Horizontal(classes="modal-buttons"):
                 yield Button("Close", variant="primary", id="btn-close")
 
@@ -866,7 +1087,52 @@ class HelpModal(_BaseModal[None]):
         self.dismiss()
 
 
-class RawEditModal(_BaseModal[BibEntry | None]):
+class _BibTeXTextModal(_BaseModal[BibEntry | None]):
+    """Base for dialogs that dismiss with the entry parsed from a TextArea.
+
+    Subclasses create ``_area``, ``_error`` and ``_btn_submit``.  Parsing
+    runs in a worker so a long entry does not stall the UI; the submit
+    button stays disabled meanwhile.
+    """
+
+    _area: TextArea
+    _error: Static
+    _btn_submit: Button
+
+    @on(Button.Pressed, "#btn-cancel")
+    def _cancel_pressed(self) -> None:
+        self.dismiss(None)
+
+    @on(Button.Pressed, "#btn-save")
+    def _save_pressed(self) -> None:
+        self._submit()
+
+    def _submit(self) -> None:
+        if self._btn_submit.disabled:
+            return  # already parsing
+        self._btn_submit.disabled = True
+        self._error.update("")
+        self._parse(self._area.text)
+
+    @work(thread=True, exclusive=True, group="bibtex-parse")
+    def _parse(self, text: str) -> None:
+        try:
+            entry = bibtex_str_to_entry(text)
+        except Exception as e:  # noqa: BLE001
+            self.app.call_from_thread(self._on_parse_error, f"Parse error: {e}")
+            return
+        self.app.call_from_thread(self._on_parsed, entry)
+
+    def _on_parsed(self, entry: BibEntry) -> None:
+        if self.is_current:  # not cancelled while parsing
+            self.dismiss(entry)
+
+    def _on_parse_error(self, message: str) -> None:
+        self._error.update(message)
+        self._btn_submit.disabled = False
+
+
+class RawEditModal(_BibTeXTextModal):
     """Edit a BibTeX entry as raw text."""
 
     BINDINGS = [
@@ -890,6 +1156,10 @@ class RawEditModal(_BaseModal[BibEntry | None]):
     def __init__(self, entry: BibEntry, **kwargs):
         super().__init__(**kwargs)
         self._entry = entry
+        self._original_text = entry_to_bibtex_str(entry)
+        self._area = TextArea(self._original_text, id="raw-edit-area")
+        self._error = Static("", id="raw-edit-error")
+        self._btn_submit = Button("Write", variant="primary", id="btn-save")
 
     def compose(self) -> ComposeResult:
         with Vertical():
@@ -897,38 +1167,26 @@ class RawEditModal(_BaseModal[BibEntry | None]):
                 f"[bold]Edit Raw BibTeX[/bold]  [dim]{self._entry.key}[/dim]",
                 classes="modal-title",
             )
-            yield TextArea(
-                entry_to_bibtex_str(self._entry),
-                id="raw-edit-area",
-            )
-            yield Static("", id="raw-edit-error")
+            yield self._area
+            yield self._error
             with Horizontal(classes="modal-buttons"):
-                yield Button("Write", variant="primary", id="btn-save")
+                yield self._btn_submit
                 yield Button("Cancel", id="btn-cancel")
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "btn-cancel":
-            self.dismiss(None)
-        elif event.button.id == "btn-save":
-            self._save()
-
-    def _save(self) -> None:
-        text = self.query_one("#raw-edit-area", TextArea).text
-        error = self.query_one("#raw-edit-error", Static)
-        try:
-            entry = bibtex_str_to_entry(text)
-            self.dismiss(entry)
-        except Exception as e:
-            error.update(f"Parse error: {e}")
+    def _submit(self) -> None:
+        if self._area.text == self._original_text:
+            self.dismiss(self._entry)  # nothing edited, nothing to parse
+            return
+        super()._submit()
 
     def action_save(self) -> None:
-        self._save()
+        self._submit()
 
     def action_cancel(self) -> None:
         self.dismiss(None)
 
 
-class PasteModal(_BaseModal["BibEntry | None"]):
+class PasteModal(_BibTeXTextModal):
     """Modal to import a BibTeX entry from pasted clipboard text."""
 
     BINDINGS = [
@@ -951,41 +1209,24 @@ class PasteModal(_BaseModal["BibEntry | None"]):
 
     def __init__(self, text: str = "", **kwargs):
         super().__init__(**kwargs)
-        self._text = text
+        self._area = TextArea(text, id="paste-area")
+        self._error = Static("", id="paste-error")
+        self._btn_submit = Button("Import", variant="primary", id="btn-save")
 
     def compose(self) -> ComposeResult:
         with Vertical():
             yield Label("[bold]Paste BibTeX Entry[/bold]", classes="modal-title")
-            yield TextArea(
-                self._text,
-                id="paste-area",
-            )
-            yield Static("", id="paste-error")
+            yield self._area
+            yield self._error
             with Horizontal(classes="modal-buttons"):
-                yield Button("Import", variant="primary", id="btn-save")
+                yield self._btn_submit
                 yield Button("Cancel", id="btn-cancel")
 
     def on_mount(self) -> None:
-        self.call_after_refresh(self.query_one("#paste-area", TextArea).focus)
-
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "btn-cancel":
-            self.dismiss(None)
-        elif event.button.id == "btn-save":
-            self._do_import()
-
-    def _do_import(self) -> None:
-        text = self.query_one("#paste-area", TextArea).text
-        error = self.query_one("#paste-error", Static)
-        error.update("")
-        try:
-            entry = bibtex_str_to_entry(text)
-            self.dismiss(entry)
-        except Exception as e:
-            error.update(f"Parse error: {e}")
+        self.call_after_refresh(self._area.focus)
 
     def action_do_import(self) -> None:
-        self._do_import()
+        self._submit()
 
     def action_cancel(self) -> None:
         self.dismiss(None)
@@ -1150,11 +1391,13 @@ class AddPDFModal(_BaseModal["str | None"]):
         if idx is not None and idx < len(self._filtered):
             self._add_path(self._filtered[idx])
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "btn-cancel":
-            self.dismiss(None)
-        elif event.button.id == "btn-add":
-            self._confirm()
+    @on(Button.Pressed, "#btn-cancel")
+    def _cancel_pressed(self) -> None:
+        self.dismiss(None)
+
+    @on(Button.Pressed, "#btn-add")
+    def _add_pressed(self) -> None:
+        self._confirm()
 
     def _confirm(self) -> None:
         from pathlib import Path
@@ -1176,8 +1419,6 @@ class AddPDFModal(_BaseModal["str | None"]):
     def _add_path(self, src) -> None:
         from pathlib import Path
 
-        from bibtui.pdf.fetcher import FetchError, add_pdf
-
         error = self.query_one("#add-error", Static)
         error.update("")
         try:
@@ -1234,6 +1475,12 @@ class FetchPDFModal(_BaseModal["tuple[str, str] | None"]):
         self._openalex_api_key = openalex_api_key
         self._overwrite = overwrite
         self._saved_result: tuple[str, str] | None = None
+        self._indicator = LoadingIndicator(id="fetch-loading")
+        self._status = Static("", id="fetch-status")
+        self._btn_close = Button(
+            "Close", variant="primary", id="btn-close", disabled=True
+        )
+        self._btn_cancel = Button("Cancel", id="btn-cancel")
 
     def compose(self) -> ComposeResult:
         with Vertical():
@@ -1241,19 +1488,17 @@ class FetchPDFModal(_BaseModal["tuple[str, str] | None"]):
                 f"[bold]Fetch PDF[/bold]  [dim]{self._entry.key}[/dim]",
                 classes="modal-title",
             )
-            yield LoadingIndicator(id="fetch-loading")
-            yield Static("", id="fetch-status")
+            yield self._indicator
+            yield self._status
             with Horizontal(classes="modal-buttons"):
-                yield Button("Close", variant="primary", id="btn-close", disabled=True)
-                yield Button("Cancel", id="btn-cancel")
+                yield self._btn_close
+                yield self._btn_cancel
 
     def on_mount(self) -> None:
         self._do_fetch()
 
     @work(thread=True)
     def _do_fetch(self) -> None:
-        from bibtui.pdf.fetcher import FetchError, fetch_pdf
-
         try:
             result = fetch_pdf(
                 self._entry,
@@ -1261,6 +1506,7 @@ class FetchPDFModal(_BaseModal["tuple[str, str] | None"]):
                 self._email,
                 openalex_api_key=self._openalex_api_key,
                 overwrite=self._overwrite,
+                race=True,
             )  # type: ignore[call-arg]
             self.app.call_from_thread(self._on_success, result.path, result.provider)
         except FetchError as exc:
@@ -1269,22 +1515,22 @@ class FetchPDFModal(_BaseModal["tuple[str, str] | None"]):
             self.app.call_from_thread(self._on_error, f"Unexpected error: {exc}")
 
     def _on_success(self, path: str, provider: str) -> None:
-        self.query_one("#fetch-loading", LoadingIndicator).display = False
-        status = self.query_one("#fetch-status", Static)
+        self._indicator.display = False
+        status = self._status
         status.set_class(True, "success")
         status.set_class(False, "error")
         status.update(f"Saved PDF via {provider}:\n{path}")
-        self.query_one("#btn-close", Button).disabled = False
-        self.query_one("#btn-cancel", Button).disabled = True
+        self._btn_close.disabled = False
+        self._btn_cancel.disabled = True
         self._saved_result = (path, provider)
 
     def _on_error(self, message: str) -> None:
-        self.query_one("#fetch-loading", LoadingIndicator).display = False
-        status = self.query_one("#fetch-status", Static)
+        self._indicator.display = False
+        status = self._status
         status.set_class(False, "success")
         status.set_class(True, "error")
         status.update(self._format_fetch_error(message))
-        self.query_one("#btn-close", Button).disabled = False
+        self._btn_close.disabled = False
 
     def _format_fetch_error(self, message: str) -> str:
         title = "Could not fetch PDF for this entry."
@@ -1310,11 +1556,13 @@ class FetchPDFModal(_BaseModal["tuple[str, str] | None"]):
         formatted_reasons = "\n".join(f"• {reason}" for reason in reasons)
         return f"{title}\n\n{formatted_reasons}"
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "btn-cancel":
-            self.dismiss(None)
-        elif event.button.id == "btn-close":
-            self.dismiss(self._saved_result)
+    @on(Button.Pressed, "#btn-cancel")
+    def _cancel_pressed(self) -> None:
+        self.dismiss(None)
+
+    @on(Button.Pressed, "#btn-close")
+    def _close_pressed(self) -> None:
+        self.dismiss(self._saved_result)
 
     def action_cancel(self) -> None:
         self.dismiss(None)
@@ -1363,24 +1611,29 @@ class BatchFetchPDFModal(_BaseModal["dict | None"]):
         self._cancel_requested = False
         self._done = False
         self._result: dict | None = None
+        self._indicator = LoadingIndicator(id="batch-fetch-loading")
+        self._progress = Static("Preparing…", id="batch-fetch-progress")
+        self._status = Static("", id="batch-fetch-status")
+        self._btn_close = Button(
+            "Close", variant="primary", id="btn-close", disabled=True
+        )
+        self._btn_cancel = Button("Cancel", id="btn-cancel")
 
     def compose(self) -> ComposeResult:
         with Vertical():
             yield Label("[bold]Fetch Missing PDFs[/bold]", classes="modal-title")
-            yield LoadingIndicator(id="batch-fetch-loading")
-            yield Static("Preparing…", id="batch-fetch-progress")
-            yield Static("", id="batch-fetch-status")
+            yield self._indicator
+            yield self._progress
+            yield self._status
             with Horizontal(classes="modal-buttons"):
-                yield Button("Close", variant="primary", id="btn-close", disabled=True)
-                yield Button("Cancel", id="btn-cancel")
+                yield self._btn_close
+                yield self._btn_cancel
 
     def on_mount(self) -> None:
         self._do_fetch()
 
     @work(thread=True)
     def _do_fetch(self) -> None:
-        from bibtui.pdf.fetcher import FetchError, fetch_pdf
-
         total = len(self._entries)
         success = 0
         failed = 0
@@ -1389,37 +1642,43 @@ class BatchFetchPDFModal(_BaseModal["dict | None"]):
         paths_by_key: dict[str, str] = {}
         failures: list[str] = []
 
-        for index, entry in enumerate(self._entries, start=1):
-            if self._cancel_requested:
-                canceled = True
-                break
-
-            self.app.call_from_thread(
-                self._on_progress,
-                f"[{index}/{total}] {entry.key}",
-            )
-
+        fetchable: list[BibEntry] = []
+        for entry in self._entries:
             if not entry.doi and not entry.url and not entry.title:
                 skipped += 1
                 failures.append(f"{entry.key}: no DOI, URL, or title")
-                continue
-
-            try:
-                result = fetch_pdf(
-                    entry,
-                    self._dest_dir,
-                    self._email,
-                    openalex_api_key=self._openalex_api_key,
-                    overwrite=False,
-                )  # type: ignore[call-arg]
-                paths_by_key[entry.key] = result.path
-                success += 1
-            except FetchError as exc:
-                failed += 1
-                failures.append(f"{entry.key}: {exc}")
-            except Exception as exc:  # noqa: BLE001
-                failed += 1
-                failures.append(f"{entry.key}: unexpected error: {exc}")
+            else:
+                fetchable.append(entry)
+
+        self.app.call_from_thread(
+            self._on_progress, f"Fetching {len(fetchable)} of {total} entries…"
+        )
+        results = fetch_pdfs_bulk(
+            fetchable,
+            self._dest_dir,
+            self._email,
+            openalex_api_key=self._openalex_api_key,
+        )
+        # Leaving the loop cancels entries that have not started yet.
+        with closing(results):
+            for entry, result in results:
+                if isinstance(result, FetchError):
+                    failed += 1
+                    failures.append(f"{entry.key}: {result}")
+                elif isinstance(result, Exception):
+                    failed += 1
+                    failures.append(f"{entry.key}: unexpected error: {result}")
+                else:
+                    paths_by_key[entry.key] = result.path
+                    success += 1
+
+                self.app.call_from_thread(
+                    self._on_progress,
+                    f"[{success + failed + skipped}/{total}] {entry.key}",
+                )
+                if self._cancel_requested:
+                    canceled = True
+                    break
 
         processed = success + failed + skipped
         self.app.call_from_thread(
@@ -1437,13 +1696,13 @@ class BatchFetchPDFModal(_BaseModal["dict | None"]):
         )
 
     def _on_progress(self, message: str) -> None:
-        self.query_one("#batch-fetch-progress", Static).update(message)
+        self._progress.update(message)
 
     def _on_done(self, result: dict) -> None:
         self._done = True
         self._result = result
-        self.query_one("#batch-fetch-loading", LoadingIndicator).display = False
-        status = self.query_one("#batch-fetch-status", Static)
+        self._indicator.display = False
+        status = self._status
         if result["success"] > 0:
             status.set_class(True, "success")
             status.set_class(False, "error")
@@ -1457,27 +1716,27 @@ class BatchFetchPDFModal(_BaseModal["dict | None"]):
             f"{canceled_text}: {result['success']} fetched, {result['failed']} failed, "
             f"{result['skipped']} skipped."
         )
-        self.query_one("#batch-fetch-progress", Static).update(
+        self._progress.update(
             f"Processed {result['processed']} of {result['total']} entries."
         )
-        self.query_one("#btn-close", Button).disabled = False
-        self.query_one("#btn-cancel", Button).disabled = True
+        self._btn_close.disabled = False
+        self._btn_cancel.disabled = True
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "btn-cancel":
-            self.action_cancel()
-        elif event.button.id == "btn-close":
-            self.dismiss(self._result)
+    @on(Button.Pressed, "#btn-cancel")
+    def _cancel_pressed(self) -> None:
+        self.action_cancel()
+
+    @on(Button.Pressed, "#btn-close")
+    def _close_pressed(self) -> None:
+        self.dismiss(self._result)
 
     def action_cancel(self) -> None:
         if self._done:
             self.dismiss(self._result)
             return
         self._cancel_requested = True
-        self.query_one("#batch-fetch-status", Static).update(
-            "Stopping after current entry…"
-        )
-        self.query_one("#btn-cancel", Button).disabled = True
+        self._status.update("Stopping after current entries…")
+        self._btn_cancel.disabled = True
 
 
 class FirstRunModal(_BaseModal[bool]):
@@ -1597,9 +1856,9 @@ class FilePickerModal(_BaseModal["str | None"]):
     def on_file_selected(self, event: DirectoryTree.FileSelected) -> None:
         self.dismiss(str(event.path))
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "btn-cancel":
-            self.dismiss(None)
+    @on(Button.Pressed, "#btn-cancel")
+    def _cancel_pressed(self) -> None:
+        self.dismiss(None)
 
     def action_cancel(self) -> None:
         self.dismiss(None)
@@ -0,0 +1,19 @@
+import pytest
+
+from bibtui.utils import bibcache, fetch_cache
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep parsed-library pickles out of the user's cache directory."""
+    monkeypatch.setattr(bibcache, "CACHE_DIR", tmp_path / "cache")
+    return tmp_path / "cache"
+
+
+@pytest.fixture(autouse=True)
+def cache_file(tmp_path, monkeypatch):
+    """Give each test its own, initially empty, Unpaywall lookup cache."""
+    monkeypatch.setattr(fetch_cache, "CACHE_FILE", tmp_path / "unpaywall.json")
+    monkeypatch.setattr(fetch_cache, "_memory", None)
+    monkeypatch.setattr(fetch_cache, "_dirty", False)
+    return tmp_path / "unpaywall.json"
@@ -17,6 +17,8 @@ BIB = Path(__file__).parent / "bib_examples" / "MyCollection.bib"
 async def main() -> None:
     app = BibTuiApp(str(BIB))
     async with app.run_test() as pilot:
+        # Entries are parsed in a background worker.
+        await app.workers.wait_for_complete()
         await pilot.pause()
 
         entry_list = app.query_one(EntryList)
@@ -0,0 +1,45 @@
+import shutil
+from pathlib import Path
+
+from textual.widgets import Input, TextArea
+
+from bibtui.app import BibTuiApp
+from bibtui.widgets.entry_list import EntryList
+from bibtui.widgets.modals import EditModal
+
+BIB = Path(__file__).parent / "bib_examples" / "ex1.bib"
+
+
+async def test_edit_modal_is_reused_across_entries(tmp_path) -> None:
+    bib = tmp_path / "lib.bib"
+    shutil.copy(BIB, bib)
+    app = BibTuiApp(str(bib))
+    async with app.run_test() as pilot:
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+        table = app.query_one(EntryList)._table
+
+        app.action_edit_entry()
+        await pilot.pause()
+        modal = app.screen
+        assert isinstance(modal, EditModal)
+        first = app.query_one(EntryList).selected_entry
+        assert modal.query_one("#edit-title", Input).value == first.title
+        modal.action_cancel()
+        await pilot.pause()
+
+        table.move_cursor(row=1)
+        second = app.query_one(EntryList).selected_entry
+        assert second is not first
+        app.action_edit_entry()
+        await pilot.pause()
+        assert app.screen is modal
+        assert modal.query_one("#edit-title", Input).value == second.title
+        assert modal.query_one("#edit-comment", TextArea).text == second.comment
+
+        modal.query_one("#edit-title", Input).value = "Reused"
+        modal.action_save_and_close()
+        await pilot.pause()
+        assert second.title == "Reused"
+        assert first.title != "Reused"
+        assert app._dirty
@@ -0,0 +1,339 @@
+from bibtui.app import BibTuiApp
+from bibtui.bib.models import BibEntry
+from bibtui.widgets.entry_detail import EntryDetail
+from bibtui.widgets.entry_list import EntryList
+
+
+def _patch_widgets(app: BibTuiApp, monkeypatch, selected: BibEntry) -> None:
+    class DummyList:
+        selected_entry = selected
+
+        def refresh_entries(self, entries: list[BibEntry]) -> None:
+            pass
+
+        def refresh_row(self, entry: BibEntry) -> None:
+            pass
+
+    class DummyDetail:
+        def show_entry(self, entry: BibEntry | None) -> None:
+            pass
+
+    def fake_query_one(selector):
+        if selector is EntryList:
+            return DummyList()
+        if selector is EntryDetail:
+            return DummyDetail()
+        raise AssertionError(f"Unexpected selector: {selector}")
+
+    monkeypatch.setattr(app, "query_one", fake_query_one)
+    monkeypatch.setattr(app, "notify", lambda message, **kwargs: None)
+
+
+def test_all_keywords_sorted_by_frequency() -> None:
+    app = BibTuiApp("tests/bib_examples/MyCollection.bib")
+    app._entries = [
+        BibEntry(key="a", entry_type="article", keywords="ice, snow"),
+        BibEntry(key="b", entry_type="article", keywords="ice"),
+    ]
+
+    keywords, counts = app._all_keywords()
+
+    assert keywords == ["ice", "snow"]
+    assert counts == {"ice": 2, "snow": 1}
+
+
+def test_all_keywords_is_cached_until_invalidated() -> None:
+    app = BibTuiApp("tests/bib_examples/MyCollection.bib")
+    entry = BibEntry(key="a", entry_type="article", keywords="ice")
+    app._entries = [entry]
+
+    app._all_keywords()
+    entry.keywords = "snow"
+    assert app._all_keywords()[1] == {"ice": 1}
+
+    app._kw_counter = None
+    assert app._all_keywords()[1] == {"snow": 1}
+
+
+def test_on_keywords_done_updates_cached_counts(monkeypatch) -> None:
+    app = BibTuiApp("tests/bib_examples/MyCollection.bib")
+    first = BibEntry(key="a", entry_type="article", keywords="ice, snow")
+    second = BibEntry(key="b", entry_type="article", keywords="ice, firn")
+    app._entries = [first, second]
+    _patch_widgets(app, monkeypatch, first)
+
+    app._all_keywords()
+    app._on_keywords_done(("ice, glacier", {"firn"}))
+
+    assert app._all_keywords()[1] == {"ice": 2, "glacier": 1}
+    assert second.keywords == "ice"
+
+
+async def test_keywords_modal_filters_case_insensitively() -> None:
+    from textual.app import App
+    from textual.widgets import SelectionList
+
+    from bibtui.widgets.modals import KeywordsModal
+
+    entry = BibEntry(key="a", entry_type="article", keywords="Snow")
+    modal = KeywordsModal(
+        entry, ["Ice Sheets", "ice", "Firn", "Snow"], {"ice": 3, "Firn": 1}
+    )
+    app = App()
+    async with app.run_test() as pilot:
+        await app.push_screen(modal)
+        await pilot.pause()
+        assert modal._shown == ["Snow", "Ice Sheets", "ice", "Firn"]
+
+        modal._rebuild_list("ICE")
+        assert modal._shown == ["Ice Sheets", "ice"]
+        assert modal.query_one(SelectionList).option_count == 2
+
+
+async def test_keywords_modal_add_and_delete_keep_index_in_sync() -> None:
+    from textual.app import App
+
+    from bibtui.widgets.modals import KeywordsModal
+
+    entry = BibEntry(key="a", entry_type="article", keywords="")
+    modal = KeywordsModal(entry, ["ice", "firn"], {"ice": 1, "firn": 1})
+    app = App()
+    async with app.run_test() as pilot:
+        await app.push_screen(modal)
+        await pilot.pause()
+        modal._on_delete_confirmed(True, "ice")
+        modal._on_delete_confirmed(True, "ice")
+        assert modal._all_keywords == ["firn"]
+        assert set(modal._folded) == {"firn"}
+
+        modal.query_one("#kw-filter").value = "Ice"
+        await modal.query_one("#kw-filter").action_submit()
+        await pilot.pause()
+        assert modal._all_keywords == ["Ice", "firn"]
+        assert modal._shown[0] == "Ice"
+
+
+async def test_keywords_modal_narrowing_keeps_existing_options() -> None:
+    from textual.app import App
+    from textual.widgets import Input, SelectionList
+
+    from bibtui.widgets.modals import KeywordsModal
+
+    entry = BibEntry(key="a", entry_type="article", keywords="")
+    modal = KeywordsModal(entry, ["ice", "ice sheets", "firn"], {})
+    app = App()
+    async with app.run_test() as pilot:
+        await app.push_screen(modal)
+        await pilot.pause()
+        sl = modal.query_one(SelectionList)
+        first = sl.get_option_at_index(0)
+
+        modal.query_one("#kw-filter", Input).value = "ic"
+        await pilot.pause(0.1)
+
+        assert modal._shown == ["ice", "ice sheets"]
+        assert [sl.get_option_at_index(i).value for i in range(2)] == modal._shown
+        assert sl.get_option_at_index(0) is first
+
+        modal.query_one("#kw-filter", Input).value = ""
+        await pilot.pause(0.1)
+        assert sl.option_count == 3
+
+
+def test_keywords_modal_matching_follows_keyword_edits() -> None:
+    from bibtui.widgets.modals import KeywordsModal
+
+    entry = BibEntry(key="a", entry_type="article", keywords="")
+    modal = KeywordsModal(entry, ["Ice", "firn", "sea ice", "ic"], {})
+    assert modal._matching("ic") == ["Ice", "sea ice", "ic"]
+    assert modal._matching("a i") == ["sea ice"]
+    assert modal._matching("cef") == []
+    assert modal._matching("") == ["Ice", "firn", "sea ice", "ic"]
+
+    modal._all_keywords.remove("Ice")
+    del modal._folded["Ice"]
+    modal._haystack = None
+    assert modal._matching("ic") == ["sea ice", "ic"]
+
+
+def test_keywords_modal_refines_previous_matches() -> None:
+    from bibtui.widgets.modals import KeywordsModal
+
+    entry = BibEntry(key="a", entry_type="article", keywords="")
+    modal = KeywordsModal(entry, ["ice", "ice sheets", "firn", "sea ice"], {})
+    assert modal._matching("ic") == ["ice", "ice sheets", "sea ice"]
+    modal._haystack = ("", [])  # a rescan would now find nothing
+    assert modal._matching("ice s") == ["ice sheets"]
+    assert modal._last_match == ("ice s", ["ice sheets"])
+
+
+async def test_keywords_modal_fills_large_lists_in_batches() -> None:
+    from textual.app import App
+    from textual.widgets import SelectionList
+
+    from bibtui.widgets.modals import _KW_BATCH, KeywordsModal
+
+    keywords = [f"kw{i:04d}" for i in range(2 * _KW_BATCH + 50)]
+    entry = BibEntry(key="a", entry_type="article", keywords="kw0003")
+    modal = KeywordsModal(entry, keywords, {})
+    app = App()
+    async with app.run_test() as pilot:
+        await app.push_screen(modal)
+        sl = modal.query_one(SelectionList)
+        modal._rebuild_list("kw01")
+        assert sl.option_count == 100
+        modal._rebuild_list("")
+        assert sl.option_count == _KW_BATCH
+        assert sl.selected == ["kw0003"]
+
+        await pilot.pause()
+        await pilot.pause()
+        await pilot.pause()
+        assert sl.option_count == len(keywords)
+        assert [sl.get_option_at_index(i).value for i in range(5)] == [
+            "kw0003",
+            "kw0000",
+            "kw0001",
+            "kw0002",
+            "kw0004",
+        ]
+
+
+async def test_keywords_modal_save_keeps_keyword_list_order() -> None:
+    from textual.app import App
+    from textual.widgets import Input
+
+    from bibtui.widgets.modals import KeywordsModal
+
+    entry = BibEntry(key="a", entry_type="article", keywords="snow, ice, firn")
+    modal = KeywordsModal(entry, ["ice", "firn", "snow", "sea"], {"firn": 1})
+    results: list = []
+    app = App()
+    async with app.run_test() as pilot:
+        await app.push_screen(modal, results.append)
+        await pilot.pause()
+        modal._on_delete_confirmed(True, "firn")
+        for kw in ("new", "newer"):
+            modal.query_one("#kw-filter", Input).value = kw
+            await modal.query_one("#kw-filter", Input).action_submit()
+            await pilot.pause()
+
+        modal.action_save()
+        await pilot.pause()
+
+    assert results == [("newer, new, ice, snow", {"firn"})]
+
+
+async def test_keywords_modal_keeps_selected_keywords_sorted() -> None:
+    from textual.app import App
+    from textual.widgets import SelectionList
+
+    from bibtui.widgets.modals import KeywordsModal
+
+    entry = BibEntry(key="a", entry_type="article", keywords="snow, ice")
+    modal = KeywordsModal(entry, ["ice", "firn", "snow", "sea"], {})
+    app = App()
+    async with app.run_test() as pilot:
+        await app.push_screen(modal)
+        await pilot.pause()
+        assert modal._shown == ["ice", "snow", "firn", "sea"]
+
+        sl = modal.query_one(SelectionList)
+        sl.select("sea")
+        sl.deselect("snow")
+        modal._sync_from_list()
+        assert modal._selected_sorted == ["ice", "sea"]
+        assert modal._selected == {"ice", "sea"}
+
+        modal._on_delete_confirmed(True, "ice")
+        assert modal._selected_sorted == ["sea"]
+        modal._rebuild_list("s")
+        assert modal._shown == ["sea", "snow"]
+
+
+async def test_keywords_modal_shows_brackets_verbatim() -> None:
+    from textual.app import App
+    from textual.widgets import SelectionList
+
+    from bibtui.widgets.modals import KeywordsModal
+
+    entry = BibEntry(key="a", entry_type="article", keywords="")
+    modal = KeywordsModal(entry, ["ice [review]", "firn"], {})
+    app = App()
+    async with app.run_test() as pilot:
+        await app.push_screen(modal)
+        await pilot.pause()
+        sl = modal.query_one(SelectionList)
+        option = sl.get_option_at_index(0)
+        assert sl._get_visual(option).plain == "ice [review]"
+        assert option.value == "ice [review]"
+
+
+async def test_keywords_modal_skips_unchanged_filter(monkeypatch) -> None:
+    from textual.app import App
+    from textual.widgets import Input
+
+    from bibtui.widgets.modals import KeywordsModal
+
+    entry = BibEntry(key="a", entry_type="article", keywords="")
+    modal = KeywordsModal(entry, ["ice", "firn"], {})
+    app = App()
+    async with app.run_test() as pilot:
+        await app.push_screen(modal)
+        await pilot.pause()
+        rebuilds: list[str] = []
+        monkeypatch.setattr(modal, "_rebuild_list", rebuilds.append)
+        kw_filter = modal.query_one("#kw-filter", Input)
+        kw_filter.value = "f"
+        kw_filter.value = ""
+        await pilot.pause(0.1)
+        assert rebuilds == []
+
+
+def test_keywords_modal_matches_case_folded() -> None:
+    from bibtui.widgets.modals import KeywordsModal
+
+    entry = BibEntry(key="a", entry_type="article", keywords="")
+    modal = KeywordsModal(entry, ["Straße", "Strand", "Maß"], {})
+    assert modal._matching("strasse".casefold()) == ["Straße"]
+    assert modal._matching("STRASSE".casefold()) == ["Straße"]
+    assert modal._matching("ss") == ["Straße", "Maß"]
+
+
+def test_keywords_modal_matching_common_filter() -> None:
+    from bibtui.widgets.modals import _KW_SCAN_SAMPLE, KeywordsModal
+
+    keywords = [f"{'ab'[i % 2]}{i}" for i in range(4 * _KW_SCAN_SAMPLE)]
+    entry = BibEntry(key="a", entry_type="article", keywords="")
+    modal = KeywordsModal(entry, keywords, {})
+    assert modal._matching("a") == [kw for kw in keywords if "a" in kw]
+    modal._last_match = None
+    assert modal._matching("b1") == [kw for kw in keywords if "b1" in kw]
+
+
+async def test_keywords_modal_submit_before_debounce_ticks_keyword() -> None:
+    from textual.app import App
+    from textual.widgets import Input, SelectionList
+
+    from bibtui.widgets.modals import KeywordsModal
+
+    entry = BibEntry(key="a", entry_type="article", keywords="ice")
+    modal = KeywordsModal(entry, ["ice", "sea", "firn"], {})
+    results: list = []
+    app = App()
+    async with app.run_test() as pilot:
+        await app.push_screen(modal, results.append)
+        await pilot.pause()
+        assert modal._shown == ["ice", "sea", "firn"]
+
+        kw_filter = modal.query_one("#kw-filter", Input)
+        kw_filter.value = "sea"
+        await kw_filter.action_submit()
+        await pilot.pause(0.1)
+        assert modal._shown == ["ice", "sea", "firn"]
+        assert "sea" in modal.query_one(SelectionList).selected
+
+        modal.action_save()
+        await pilot.pause()
+
+    assert results == [("ice, sea", set())]
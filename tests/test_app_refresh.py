@@ -0,0 +1,87 @@
+from bibtui.app import BibTuiApp
+from bibtui.bib.models import BibEntry
+from bibtui.widgets.entry_detail import EntryDetail
+from bibtui.widgets.entry_list import EntryList
+
+
+def test_rapid_actions_coalesce_into_one_refresh(monkeypatch) -> None:
+    app = BibTuiApp("tests/bib_examples/MyCollection.bib")
+    entry = BibEntry(key="a", entry_type="article")
+    app._entries = [entry, BibEntry(key="b", entry_type="article")]
+    refreshed: list[str] = []
+    shown: list[str] = []
+    scheduled: list = []
+
+    class DummyList:
+        selected_entry = entry
+
+        def refresh_row(self, e: BibEntry) -> None:
+            refreshed.append(e.key)
+
+    class DummyDetail:
+        def show_entry(self, e: BibEntry | None) -> None:
+            shown.append(e.key if e else "")
+
+    def fake_query_one(selector):
+        if selector is EntryList:
+            return DummyList()
+        if selector is EntryDetail:
+            return DummyDetail()
+        raise AssertionError(f"Unexpected selector: {selector}")
+
+    monkeypatch.setattr(app, "query_one", fake_query_one)
+    monkeypatch.setattr(app, "call_later", lambda callback: scheduled.append(callback))
+
+    app.action_set_rating("3")
+    app.action_set_rating("4")
+    app.action_cycle_read_state()
+    app.action_cycle_priority()
+
+    assert entry.rating == 4
+    assert len(scheduled) == 1
+    assert refreshed == []
+
+    scheduled[0]()
+
+    assert refreshed == ["a"]
+    assert shown == ["a"]
+    assert app._dirty
+
+
+def test_refresh_targets_the_edited_duplicate(monkeypatch) -> None:
+    app = BibTuiApp("tests/bib_examples/MyCollection.bib")
+    first = BibEntry(key="dup", entry_type="article")
+    second = BibEntry(key="dup", entry_type="article")
+    app._entries = [first, second]
+    refreshed: list[BibEntry] = []
+    shown: list[BibEntry | None] = []
+    scheduled: list = []
+
+    class DummyList:
+        selected_entry = second
+
+        def refresh_row(self, e: BibEntry) -> None:
+            refreshed.append(e)
+
+    class DummyDetail:
+        def show_entry(self, e: BibEntry | None) -> None:
+            shown.append(e)
+
+    def fake_query_one(selector):
+        if selector is EntryList:
+            return DummyList()
+        if selector is EntryDetail:
+            return DummyDetail()
+        raise AssertionError(f"Unexpected selector: {selector}")
+
+    monkeypatch.setattr(app, "query_one", fake_query_one)
+    monkeypatch.setattr(app, "call_later", lambda callback: scheduled.append(callback))
+
+    app.action_set_rating("2")
+    scheduled[0]()
+
+    assert second.rating == 2
+    assert first.rating == 0
+    assert len(refreshed) == 1
+    assert refreshed[0] is second
+    assert shown == [second]
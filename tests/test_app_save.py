@@ -0,0 +1,84 @@
+import shutil
+from pathlib import Path
+
+from bibtui.app import BibTuiApp
+from bibtui.bib import parser
+
+BIB = Path(__file__).parent / "bib_examples" / "ex1.bib"
+
+
+async def test_save_runs_in_worker_and_clears_dirty(tmp_path) -> None:
+    bib = tmp_path / "lib.bib"
+    shutil.copy(BIB, bib)
+    app = BibTuiApp(str(bib))
+    async with app.run_test() as pilot:
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+        entry = app._entries[0]
+        entry.title = "Retitled"
+        app._dirty = True
+
+        app.action_save()
+        assert app._saving
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+
+        assert not app._saving
+        assert not app._dirty
+    saved = {e.key: e for e in parser.load(str(bib))}
+    assert saved[entry.key].title == "Retitled"
+
+
+async def test_save_failure_restores_dirty(monkeypatch, tmp_path) -> None:
+    bib = tmp_path / "lib.bib"
+    shutil.copy(BIB, bib)
+    app = BibTuiApp(str(bib))
+    notes: list[str] = []
+
+    def fail(entries, path) -> None:
+        raise OSError("disk full")
+
+    async with app.run_test() as pilot:
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+        monkeypatch.setattr(parser, "save", fail)
+        monkeypatch.setattr(
+            app, "notify", lambda message, **kwargs: notes.append(message)
+        )
+        app._dirty = True
+
+        app.action_save()
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+
+        assert app._dirty
+        assert notes[-1] == "Write failed: disk full"
+
+
+def test_save_without_changes_skips_write(monkeypatch) -> None:
+    app = BibTuiApp("tests/bib_examples/MyCollection.bib")
+    notes: list[str] = []
+    written: list[tuple] = []
+    monkeypatch.setattr(app, "notify", lambda message, **kwargs: notes.append(message))
+    monkeypatch.setattr(app, "_write_entries", lambda *args: written.append(args))
+
+    app.action_save()
+
+    assert written == []
+    assert notes == ["No changes to write."]
+
+
+def test_changes_refused_while_loading(monkeypatch) -> None:
+    app = BibTuiApp("tests/bib_examples/MyCollection.bib")
+    app._loading = True
+    notes: list[str] = []
+    pushed: list[object] = []
+    monkeypatch.setattr(app, "notify", lambda message, **kwargs: notes.append(message))
+    monkeypatch.setattr(app, "push_screen", lambda screen, *args: pushed.append(screen))
+
+    app.action_paste_import()
+    app.action_doi_import()
+    app.action_save()
+
+    assert pushed == []
+    assert notes == ["Still loading the bibliography…"] * 3
@@ -0,0 +1,77 @@
+import os
+
+from bibtui.bib.models import BibEntry
+from bibtui.utils import bibcache
+
+
+def _bib(tmp_path) -> str:
+    path = tmp_path / "lib.bib"
+    path.write_text("@article{a, title = {A}}\n", encoding="utf-8")
+    return str(path)
+
+
+def test_load_cached_missing_returns_none(tmp_path) -> None:
+    assert bibcache.load_cached(_bib(tmp_path)) is None
+
+
+def test_roundtrip(tmp_path) -> None:
+    path = _bib(tmp_path)
+    entries = [BibEntry(key="a", entry_type="article", title="A", rating=3)]
+
+    bibcache.save_cache(path, entries)
+
+    assert bibcache.load_cached(path) == entries
+
+
+def test_stale_after_file_change(tmp_path) -> None:
+    path = _bib(tmp_path)
+    bibcache.save_cache(path, [BibEntry(key="a", entry_type="article")])
+
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("@article{b, title = {B}}\n")
+
+    assert bibcache.load_cached(path) is None
+
+
+def test_stale_after_mtime_change(tmp_path) -> None:
+    path = _bib(tmp_path)
+    bibcache.save_cache(path, [BibEntry(key="a", entry_type="article")])
+
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert bibcache.load_cached(path) is None
+
+
+def test_corrupt_cache_is_ignored(tmp_path, cache_dir) -> None:
+    path = _bib(tmp_path)
+    bibcache.save_cache(path, [BibEntry(key="a", entry_type="article")])
+    for cached in cache_dir.iterdir():
+        cached.write_bytes(b"not a pickle")
+
+    assert bibcache.load_cached(path) is None
+
+
+def test_save_cache_for_missing_file_is_noop(tmp_path, cache_dir) -> None:
+    bibcache.save_cache(str(tmp_path / "missing.bib"), [])
+
+    assert not cache_dir.exists()
+
+
+def test_truncated_cache_is_ignored(tmp_path, cache_dir) -> None:
+    path = _bib(tmp_path)
+    bibcache.save_cache(path, [BibEntry(key="a", entry_type="article")])
+    for cached in cache_dir.iterdir():
+        cached.write_bytes(cached.read_bytes()[:-10])
+
+    assert bibcache.load_cached(path) is None
+
+
+def test_unwritable_cache_dir_is_ignored(tmp_path, monkeypatch) -> None:
+    blocker = tmp_path / "blocker"
+    blocker.write_text("", encoding="utf-8")
+    monkeypatch.setattr(bibcache, "CACHE_DIR", blocker / "parsed")
+
+    bibcache.save_cache(_bib(tmp_path), [BibEntry(key="a", entry_type="article")])
+
+    assert blocker.is_file()
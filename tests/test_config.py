@@ -3,6 +3,7 @@
 from pathlib import Path
 
 from bibtui.pdf.paths import find_pdf_for_entry, format_jabref_path, parse_jabref_path
+from bibtui.utils import config as config_mod
 from bibtui.utils.config import (
     Config,
     csl_dir,
@@ -41,6 +42,20 @@ def test_parse_jabref_desc_colon_path_colon_type() -> None:
     assert result == "/papers/Smith2023.pdf"
 
 
+def test_parse_jabref_windows_drive_path() -> None:
+    assert parse_jabref_path(r":C:\papers\Smith2023.pdf:PDF") == (
+        r"C:\papers\Smith2023.pdf"
+    )
+    assert parse_jabref_path(r":C\:\papers\Smith2023.pdf:PDF") == (
+        r"C:\papers\Smith2023.pdf"
+    )
+
+
+def test_parse_jabref_uses_first_of_several_links() -> None:
+    result = parse_jabref_path(":a.pdf:PDF;:b.pdf:PDF", base_dir="/papers")
+    assert result == "/papers/a.pdf"
+
+
 # ---------------------------------------------------------------------------
 # format_jabref_path
 # ---------------------------------------------------------------------------
@@ -99,6 +114,33 @@ def test_save_and_load_roundtrip(tmp_path: Path, monkeypatch) -> None:
     assert loaded.check_for_updates is False
 
 
+def test_load_config_parses_only_when_file_changes(tmp_path: Path, monkeypatch) -> None:
+    config_file = tmp_path / "config.toml"
+    monkeypatch.setattr("bibtui.utils.config.CONFIG_PATH", config_file)
+    save_config(Config(pdf_base_dir="/papers"))
+    parses: list[object] = []
+    real_load = config_mod.tomllib.load
+
+    def counting_load(f):
+        parses.append(f)
+        return real_load(f)
+
+    monkeypatch.setattr(config_mod.tomllib, "load", counting_load)
+
+    first = load_config()
+    second = load_config()
+    assert len(parses) == 1
+    assert first == second and first is not second
+
+    second.recent_files.append("x.bib")
+    save_config(Config(pdf_base_dir="/other"))
+    third = load_config()
+    assert len(parses) == 2
+    assert third.pdf_base_dir == "/other"
+    assert third.recent_files == []
+    assert not list(tmp_path.glob("*.tmp"))
+
+
 def test_load_config_returns_defaults_when_missing(tmp_path: Path, monkeypatch) -> None:
     config_file = tmp_path / "nonexistent.toml"
     monkeypatch.setattr("bibtui.utils.config.CONFIG_PATH", config_file)
@@ -198,14 +240,14 @@ def test_save_and_load_roundtrip_special_chars(tmp_path: Path, monkeypatch) -> N
     # Values with backslashes, quotes, and a newline would break a naive
     # string-built TOML writer; a real serializer round-trips them.
     cfg = Config(
-        pdf_base_dir="C:\\Users\\me\\My \"Papers\"",
+        pdf_base_dir='C:\\Users\\me\\My "Papers"',
         unpaywall_email="line1\nline2",
         recent_files=["C:\\a\\b.bib", 'quote"d.bib'],
     )
     save_config(cfg)
 
     loaded = load_config()
-    assert loaded.pdf_base_dir == "C:\\Users\\me\\My \"Papers\""
+    assert loaded.pdf_base_dir == 'C:\\Users\\me\\My "Papers"'
     assert loaded.unpaywall_email == "line1\nline2"
     assert loaded.recent_files == ["C:\\a\\b.bib", 'quote"d.bib']
 
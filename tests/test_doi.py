@@ -36,57 +36,57 @@ def _mock_cr(msg: dict):
 
 
 def test_fetch_title() -> None:
-    with patch("bibtui.bib.doi.Crossref", return_value=_mock_cr(_make_msg())):
+    with patch("habanero.Crossref", return_value=_mock_cr(_make_msg())):
         e = fetch_by_doi("10.1000/test")
     assert e.title == "Glacial Dynamics in the 21st Century"
 
 
 def test_fetch_author_string() -> None:
-    with patch("bibtui.bib.doi.Crossref", return_value=_mock_cr(_make_msg())):
+    with patch("habanero.Crossref", return_value=_mock_cr(_make_msg())):
         e = fetch_by_doi("10.1000/test")
     assert e.author == "Smith, John and Jones, Mary"
 
 
 def test_fetch_year() -> None:
-    with patch("bibtui.bib.doi.Crossref", return_value=_mock_cr(_make_msg())):
+    with patch("habanero.Crossref", return_value=_mock_cr(_make_msg())):
         e = fetch_by_doi("10.1000/test")
     assert e.year == "2023"
 
 
 def test_fetch_journal() -> None:
-    with patch("bibtui.bib.doi.Crossref", return_value=_mock_cr(_make_msg())):
+    with patch("habanero.Crossref", return_value=_mock_cr(_make_msg())):
         e = fetch_by_doi("10.1000/test")
     assert e.journal == "Nature"
 
 
 def test_fetch_doi_stored() -> None:
-    with patch("bibtui.bib.doi.Crossref", return_value=_mock_cr(_make_msg())):
+    with patch("habanero.Crossref", return_value=_mock_cr(_make_msg())):
         e = fetch_by_doi("10.1000/test")
     assert e.doi == "10.1000/test"
 
 
 def test_fetch_entry_type_article() -> None:
-    with patch("bibtui.bib.doi.Crossref", return_value=_mock_cr(_make_msg())):
+    with patch("habanero.Crossref", return_value=_mock_cr(_make_msg())):
         e = fetch_by_doi("10.1000/test")
     assert e.entry_type == "article"
 
 
 def test_citation_key_format() -> None:
-    with patch("bibtui.bib.doi.Crossref", return_value=_mock_cr(_make_msg())):
+    with patch("habanero.Crossref", return_value=_mock_cr(_make_msg())):
         e = fetch_by_doi("10.1000/test")
     assert e.key == "Smith2023"
 
 
 def test_citation_key_normalizes_accents_and_braces() -> None:
     msg = _make_msg(author=[{"family": r"G{\"o}lles", "given": "Thomas"}])
-    with patch("bibtui.bib.doi.Crossref", return_value=_mock_cr(msg)):
+    with patch("habanero.Crossref", return_value=_mock_cr(msg)):
         e = fetch_by_doi("10.1000/test")
     assert e.key == "Goelles2023"
 
 
 def test_citation_key_normalizes_punctuation() -> None:
     msg = _make_msg(author=[{"family": "O'Neil-Smith", "given": "Jane"}])
-    with patch("bibtui.bib.doi.Crossref", return_value=_mock_cr(msg)):
+    with patch("habanero.Crossref", return_value=_mock_cr(msg)):
         e = fetch_by_doi("10.1000/test")
     assert e.key == "ONeilSmith2023"
 
@@ -112,7 +112,7 @@ def test_citation_key_normalizes_punctuation() -> None:
 )
 def test_entry_type_mapping(crossref_type: str, expected: str) -> None:
     msg = _make_msg(type=crossref_type)
-    with patch("bibtui.bib.doi.Crossref", return_value=_mock_cr(msg)):
+    with patch("habanero.Crossref", return_value=_mock_cr(msg)):
         e = fetch_by_doi("10.1000/test")
     assert e.entry_type == expected
 
@@ -124,14 +124,14 @@ def test_entry_type_mapping(crossref_type: str, expected: str) -> None:
 
 def test_author_family_only() -> None:
     msg = _make_msg(author=[{"family": "Plato"}])
-    with patch("bibtui.bib.doi.Crossref", return_value=_mock_cr(msg)):
+    with patch("habanero.Crossref", return_value=_mock_cr(msg)):
         e = fetch_by_doi("10.1000/test")
     assert e.author == "Plato"
 
 
 def test_no_authors_uses_unknown_key() -> None:
     msg = _make_msg(author=[])
-    with patch("bibtui.bib.doi.Crossref", return_value=_mock_cr(msg)):
+    with patch("habanero.Crossref", return_value=_mock_cr(msg)):
         e = fetch_by_doi("10.1000/test")
     assert e.key.startswith("Unknown")
 
@@ -140,7 +140,7 @@ def test_year_from_published_online() -> None:
     msg = _make_msg()
     del msg["published-print"]
     msg["published-online"] = {"date-parts": [[2022]]}
-    with patch("bibtui.bib.doi.Crossref", return_value=_mock_cr(msg)):
+    with patch("habanero.Crossref", return_value=_mock_cr(msg)):
         e = fetch_by_doi("10.1000/test")
     assert e.year == "2022"
 
@@ -148,14 +148,14 @@ def test_year_from_published_online() -> None:
 def test_year_empty_when_no_date() -> None:
     msg = _make_msg()
     del msg["published-print"]
-    with patch("bibtui.bib.doi.Crossref", return_value=_mock_cr(msg)):
+    with patch("habanero.Crossref", return_value=_mock_cr(msg)):
         e = fetch_by_doi("10.1000/test")
     assert e.year == ""
 
 
 def test_volume_and_issue_in_raw_fields() -> None:
     msg = _make_msg(volume="12", issue="3")
-    with patch("bibtui.bib.doi.Crossref", return_value=_mock_cr(msg)):
+    with patch("habanero.Crossref", return_value=_mock_cr(msg)):
         e = fetch_by_doi("10.1000/test")
     assert e.raw_fields.get("volume") == "12"
     assert e.raw_fields.get("number") == "3"
@@ -163,14 +163,14 @@ def test_volume_and_issue_in_raw_fields() -> None:
 
 def test_pages_in_raw_fields() -> None:
     msg = _make_msg(page="100-110")
-    with patch("bibtui.bib.doi.Crossref", return_value=_mock_cr(msg)):
+    with patch("habanero.Crossref", return_value=_mock_cr(msg)):
         e = fetch_by_doi("10.1000/test")
     assert e.raw_fields.get("pages") == "100-110"
 
 
 def test_publisher_in_raw_fields() -> None:
     msg = _make_msg(publisher="Elsevier")
-    with patch("bibtui.bib.doi.Crossref", return_value=_mock_cr(msg)):
+    with patch("habanero.Crossref", return_value=_mock_cr(msg)):
         e = fetch_by_doi("10.1000/test")
     assert e.raw_fields.get("publisher") == "Elsevier"
 
@@ -239,14 +239,14 @@ def _mock_cr_copernicus(preprint_msg: dict):
 
 def test_preprint_entry_type() -> None:
     """posted-content preprints should map to misc."""
-    with patch("bibtui.bib.doi.Crossref", return_value=_mock_cr(_make_preprint_msg())):
+    with patch("habanero.Crossref", return_value=_mock_cr(_make_preprint_msg())):
         e = fetch_by_doi("10.5194/essd-2025-745")
     assert e.entry_type == "misc"
 
 
 def test_preprint_year_from_issued() -> None:
     """Year should be extracted from 'issued' when published-print/online are absent."""
-    with patch("bibtui.bib.doi.Crossref", return_value=_mock_cr(_make_preprint_msg())):
+    with patch("habanero.Crossref", return_value=_mock_cr(_make_preprint_msg())):
         e = fetch_by_doi("10.5194/essd-2025-745")
     assert e.year == "2026"
 
@@ -255,7 +255,7 @@ def test_preprint_year_from_posted_when_issued_absent() -> None:
     """Year should fall back to 'posted' when issued is also absent."""
     msg = _make_preprint_msg()
     del msg["issued"]
-    with patch("bibtui.bib.doi.Crossref", return_value=_mock_cr(msg)):
+    with patch("habanero.Crossref", return_value=_mock_cr(msg)):
         e = fetch_by_doi("10.5194/essd-2025-745")
     assert e.year == "2026"
 
@@ -263,7 +263,7 @@ def test_preprint_year_from_posted_when_issued_absent() -> None:
 def test_preprint_journal_copernicus() -> None:
     """Journal should be resolved to the Discussions journal for Copernicus preprints."""
     cr_mock = _mock_cr_copernicus(_make_preprint_msg())
-    with patch("bibtui.bib.doi.Crossref", return_value=cr_mock):
+    with patch("habanero.Crossref", return_value=cr_mock):
         e = fetch_by_doi("10.5194/essd-2025-745")
     assert e.journal == "Earth System Science Data Discussions"
 
@@ -273,7 +273,7 @@ def test_preprint_journal_biorxiv() -> None:
     msg = _make_preprint_msg(
         institution=[{"name": "bioRxiv"}], **{"container-title": []}
     )
-    with patch("bibtui.bib.doi.Crossref", return_value=_mock_cr(msg)):
+    with patch("habanero.Crossref", return_value=_mock_cr(msg)):
         e = fetch_by_doi("10.1101/2021.09.01.458592")
     assert e.journal == "bioRxiv"
 
@@ -283,25 +283,98 @@ def test_preprint_journal_egusphere() -> None:
     msg = _make_preprint_msg(
         **{"DOI": "10.5194/egusphere-2026-485", "container-title": []}
     )
-    with patch("bibtui.bib.doi.Crossref", return_value=_mock_cr(msg)):
+    with patch("habanero.Crossref", return_value=_mock_cr(msg)):
         e = fetch_by_doi("10.5194/egusphere-2026-485")
     assert e.journal == "EGUsphere"
 
 
 def test_preprint_journal_empty_when_lookup_fails() -> None:
     """Journal stays empty when the lookup API calls return no usable data."""
-    with patch("bibtui.bib.doi.Crossref", return_value=_mock_cr(_make_preprint_msg())):
+    with patch("habanero.Crossref", return_value=_mock_cr(_make_preprint_msg())):
         e = fetch_by_doi("10.5194/essd-2025-745")
     assert e.journal == ""
 
 
 def test_preprint_citation_key() -> None:
-    with patch("bibtui.bib.doi.Crossref", return_value=_mock_cr(_make_preprint_msg())):
+    with patch("habanero.Crossref", return_value=_mock_cr(_make_preprint_msg())):
         e = fetch_by_doi("10.5194/essd-2025-745")
     assert e.key == "Wang2026"
 
 
 def test_preprint_publisher_stored() -> None:
-    with patch("bibtui.bib.doi.Crossref", return_value=_mock_cr(_make_preprint_msg())):
+    with patch("habanero.Crossref", return_value=_mock_cr(_make_preprint_msg())):
         e = fetch_by_doi("10.5194/essd-2025-745")
     assert e.raw_fields.get("publisher") == "Copernicus GmbH"
+
+
+# ---------------------------------------------------------------------------
+# fetch_by_doi_cached
+# ---------------------------------------------------------------------------
+
+
+def test_cached_lookup_reuses_answer_for_same_doi(monkeypatch) -> None:
+    from bibtui.bib import doi as doi_mod
+
+    monkeypatch.setattr(doi_mod, "_lookups", {})
+    with patch("habanero.Crossref", return_value=_mock_cr(_make_msg())) as cr:
+        first = doi_mod.fetch_by_doi_cached(" 10.1000/TEST ")
+        first.key = "Edited"
+        second = doi_mod.fetch_by_doi_cached("10.1000/test")
+    assert cr.call_count == 1
+    assert second is not first
+    assert second.key == "Smith2023"
+    assert second.raw_fields["date-added"]
+
+
+def test_cached_lookup_expires_and_skips_failures(monkeypatch) -> None:
+    from bibtui.bib import doi as doi_mod
+
+    monkeypatch.setattr(doi_mod, "_lookups", {})
+    with (
+        patch("habanero.Crossref", side_effect=ValueError("offline")),
+        pytest.raises(ValueError),
+    ):
+        doi_mod.fetch_by_doi_cached("10.1000/test")
+    assert doi_mod._lookups == {}
+
+    with patch("habanero.Crossref", return_value=_mock_cr(_make_msg())) as cr:
+        doi_mod.fetch_by_doi_cached("10.1000/test")
+        monkeypatch.setattr(doi_mod, "LOOKUP_TTL", -1)
+        doi_mod.fetch_by_doi_cached("10.1000/test")
+    assert cr.call_count == 2
+
+
+async def test_doi_modal_ignores_resubmit_while_fetching(monkeypatch) -> None:
+    import threading
+
+    from textual.app import App
+    from textual.widgets import Button, Input
+
+    from bibtui.bib import doi as doi_mod
+    from bibtui.bib.models import BibEntry
+    from bibtui.widgets.modals import DOIModal
+
+    release = threading.Event()
+    calls: list[str] = []
+
+    def slow_fetch(doi: str) -> BibEntry:
+        calls.append(doi)
+        release.wait(5)
+        raise ValueError("not found")
+
+    monkeypatch.setattr(doi_mod, "fetch_by_doi", slow_fetch)
+    app = App()
+    async with app.run_test() as pilot:
+        modal = DOIModal()
+        await app.push_screen(modal)
+        modal.query_one("#doi-input", Input).value = "10.1/x"
+        modal._do_fetch()
+        modal._do_fetch()
+        assert modal.query_one("#btn-fetch", Button).disabled
+
+        release.set()
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+
+        assert calls == ["10.1/x"]
+        assert not modal.query_one("#btn-fetch", Button).disabled
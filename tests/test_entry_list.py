@@ -0,0 +1,354 @@
+from textual.app import App, ComposeResult
+from textual.widgets import DataTable, Input
+
+from bibtui.bib.models import BibEntry
+from bibtui.widgets.entry_list import EntryList
+
+
+class _ListApp(App):
+    def __init__(self, entries: list[BibEntry]) -> None:
+        super().__init__()
+        self._entries = entries
+
+    def compose(self) -> ComposeResult:
+        yield EntryList(self._entries)
+
+
+async def _settle_search(app: App, pilot) -> None:
+    """Wait out the search debounce and the background filter."""
+    await pilot.pause(0.2)
+    await app.workers.wait_for_complete()
+    await pilot.pause()
+
+
+def _entries() -> list[BibEntry]:
+    return [
+        BibEntry(key="b", entry_type="article", title="Beta", year="2021"),
+        BibEntry(key="a", entry_type="article", title="Alpha", year="2020"),
+    ]
+
+
+async def test_refresh_row_updates_cells_in_place() -> None:
+    entries = _entries()
+    app = _ListApp(entries)
+    async with app.run_test() as pilot:
+        el = app.query_one(EntryList)
+        table = app.query_one(DataTable)
+        edited = BibEntry(key="a", entry_type="book", title="Alpha 2", year="2022")
+
+        el.refresh_row(edited)
+        await pilot.pause()
+
+        assert el.filtered_entries[1] is edited
+        row = table.get_row_at(1)
+        assert row[4] == "book"
+        assert row[5] == "2022"
+        assert row[8] == "Alpha 2"
+
+
+async def test_append_row_does_not_touch_master_list() -> None:
+    entries = _entries()
+    app = _ListApp(entries)
+    async with app.run_test() as pilot:
+        el = app.query_one(EntryList)
+        new = BibEntry(key="c", entry_type="article", title="Gamma")
+        entries.append(new)
+
+        assert el.append_row(new) == 2
+        await pilot.pause()
+
+        assert len(entries) == 3
+        assert [e.key for e in el.filtered_entries] == ["b", "a", "c"]
+        assert app.query_one(DataTable).row_count == 3
+
+
+async def test_append_row_respects_search_and_sort() -> None:
+    entries = _entries()
+    app = _ListApp(entries)
+    async with app.run_test() as pilot:
+        el = app.query_one(EntryList)
+        app.query_one(Input).value = "alpha"
+        await _settle_search(app, pilot)
+
+        hidden = BibEntry(key="c", entry_type="article", title="Gamma")
+        entries.append(hidden)
+        assert el.append_row(hidden) is None
+
+        app.query_one(Input).value = ""
+        await _settle_search(app, pilot)
+        el._sort_key = el._col_keys[8]  # Title
+        el._apply_sort()
+        shown = BibEntry(key="d", entry_type="article", title="Aardvark")
+        entries.append(shown)
+
+        assert el.append_row(shown) == 0
+        assert [e.key for e in el.filtered_entries] == ["d", "a", "b", "c"]
+
+
+async def test_table_columns_keep_their_fixed_widths() -> None:
+    entries = _entries()
+    app = _ListApp(entries)
+    async with app.run_test() as pilot:
+        el = app.query_one(EntryList)
+        table = app.query_one(DataTable)
+        wide = BibEntry(key="c", entry_type="article", title="T" * 500)
+        entries.append(wide)
+        el.append_row(wide)
+        await pilot.pause()
+
+        assert table.virtual_size.height == 3 + table.header_height
+        assert table.columns[el._col_keys[8]].width == el._title_width
+
+
+async def test_search_filters_once_after_typing_pauses() -> None:
+    entries = _entries()
+    app = _ListApp(entries)
+    async with app.run_test() as pilot:
+        el = app.query_one(EntryList)
+        search = app.query_one(Input)
+        for text in ("a", "al", "alp"):
+            search.value = text
+        await pilot.pause()
+        assert len(el.filtered_entries) == 2
+
+        await _settle_search(app, pilot)
+        assert [e.key for e in el.filtered_entries] == ["a"]
+
+
+async def test_append_row_reruns_search_in_flight() -> None:
+    entries = _entries()
+    app = _ListApp(entries)
+    async with app.run_test() as pilot:
+        el = app.query_one(EntryList)
+        app.query_one(Input).value = "al"
+        await pilot.pause(0.2)
+        el._filter_running = True  # as if the worker had not reported back yet
+        new = BibEntry(key="c", entry_type="article", title="Alps")
+        entries.append(new)
+
+        assert el.append_row(new) is None
+        await _settle_search(app, pilot)
+        assert [e.key for e in el.filtered_entries] == ["a", "c"]
+
+
+def test_query_narrows() -> None:
+    from bibtui.widgets.entry_list import _query_narrows
+
+    assert _query_narrows("glac", "glacier")
+    assert _query_narrows("a:smi", "a:smith t:ice")
+    assert _query_narrows("y:20", "y:2021")
+    assert not _query_narrows("glacier", "glac")
+    assert not _query_narrows("a:smith", "t:smith")
+    assert not _query_narrows("y:2010-2020", "y:2010-2021")
+
+
+async def test_narrowing_search_filters_previous_matches(monkeypatch) -> None:
+    entries = _entries()
+    app = _ListApp(entries)
+    async with app.run_test() as pilot:
+        el = app.query_one(EntryList)
+        search = app.query_one(Input)
+        search.value = "al"
+        await _settle_search(app, pilot)
+        scanned: list[list[BibEntry]] = []
+        start = el._filter_entries
+
+        def record(generation, query, base):
+            scanned.append(base)
+            return start(generation, query, base)
+
+        monkeypatch.setattr(el, "_filter_entries", record)
+        search.value = "alp"
+        await _settle_search(app, pilot)
+
+        assert [e.key for e in scanned[0]] == ["a"]
+        assert [e.key for e in el.filtered_entries] == ["a"]
+
+        el.refresh_row(BibEntry(key="a", entry_type="article", title="Alpine"))
+        entries[0].title = "Alpha Beta"
+        search.value = "alph"
+        await _settle_search(app, pilot)
+        assert scanned[-1].entries is entries
+        assert [e.key for e in el.filtered_entries] == ["b", "a"]
+
+
+async def test_duplicate_citekeys_get_their_own_rows() -> None:
+    entries = [
+        BibEntry(key="dup", entry_type="article", title="First"),
+        BibEntry(key="dup", entry_type="article", title="Second"),
+        BibEntry(key="c", entry_type="article", title="Third"),
+    ]
+    app = _ListApp(entries)
+    async with app.run_test() as pilot:
+        el = app.query_one(EntryList)
+        table = app.query_one(DataTable)
+        assert table.row_count == 3
+
+        entries[1].rating = 4
+        el.refresh_row(entries[1])
+        table.move_cursor(row=1)
+        await pilot.pause()
+        assert table.get_row_at(0)[10] == ""
+        assert table.get_row_at(1)[10] == "★★★★"
+        assert el.selected_entry is entries[1]
+
+        el._sort_key = el._col_keys[8]  # Title
+        el._sort_reverse = True
+        el._apply_sort()
+        assert [table.get_row_at(i)[8] for i in range(3)] == [
+            "Third",
+            "Second",
+            "First",
+        ]
+
+        el.remove_row("dup", [entries[2]])
+        assert table.row_count == 1
+        assert el.filtered_entries == [entries[2]]
+
+
+async def test_row_cells_are_cached_until_row_refresh(tmp_path) -> None:
+    pdf = tmp_path / "a.pdf"
+    pdf.write_bytes(b"%PDF-1.4")
+    entries = [BibEntry(key="a", entry_type="article", file=":a.pdf:PDF")]
+    app = _ListApp(entries)
+    async with app.run_test() as pilot:
+        el = app.query_one(EntryList)
+        table = app.query_one(DataTable)
+        el.set_pdf_base_dir(str(tmp_path))
+        el.refresh_entries(entries)
+        await pilot.pause()
+        assert table.get_row_at(0)[2] == "■"
+
+        pdf.unlink()
+        assert el._row_cells(entries[0])[2] == "■"
+
+        el.refresh_row(entries[0])
+        await pilot.pause()
+        assert table.get_row_at(0)[2] == "□"
+
+
+def test_compiled_query_matches_fields_and_ranges() -> None:
+    from bibtui.widgets.entry_list import _compile_query, _parse_query
+
+    entry = BibEntry(
+        key="Smith2019",
+        entry_type="inproceedings",
+        title="Firn Densification",
+        author="Smith, Jane",
+        year="2019",
+        raw_fields={"booktitle": "EGU General Assembly"},
+    )
+
+    def matches(query: str) -> bool:
+        return _compile_query(*_parse_query(query))(entry)
+
+    assert matches("firn a:smith y:2010-2020 j:egu c:smith20")
+    assert matches("FIRN AND y:2019")
+    assert not matches("y:2020-2024")
+    assert not matches("firn ice")
+    assert not matches("j:nature")
+
+
+def test_search_index_finds_each_matching_entry_once() -> None:
+    from bibtui.widgets.entry_list import _SearchIndex
+
+    entries = [
+        BibEntry(key="a", entry_type="article", title="Ice ice baby"),
+        BibEntry(key="b", entry_type="article", title="Firn"),
+        BibEntry(key="c", entry_type="article", author="Iceman, Bob"),
+    ] + [BibEntry(key=f"x{i}", entry_type="misc", title="Snow") for i in range(40)]
+    index = _SearchIndex(entries)
+
+    assert [e.key for e in index.candidates("ice")] == ["a", "c"]
+    assert [e.key for e in index.candidates("firn")] == ["b"]
+    assert index.candidates("baby\nfirn") == []
+    assert index.candidates("missing") == []
+    assert len(index.candidates("snow")) == len(entries)  # too common to index
+
+
+async def test_sorted_search_rebuilds_rows_once(monkeypatch) -> None:
+    entries = _entries()
+    app = _ListApp(entries)
+    async with app.run_test() as pilot:
+        el = app.query_one(EntryList)
+        table = app.query_one(DataTable)
+        el._sort_key = el._col_keys[8]  # Title
+        el._apply_sort()
+        calls: list[int] = []
+        clear = table.clear
+        monkeypatch.setattr(
+            table, "clear", lambda: calls.append(table.row_count) or clear()
+        )
+
+        app.query_one(Input).value = "a"
+        await _settle_search(app, pilot)
+
+        assert calls == [2]
+        assert table.row_count == 2
+        assert [e.key for e in el.filtered_entries] == ["a", "b"]
+
+
+def test_essential_terms_drop_implied_terms() -> None:
+    from bibtui.widgets.entry_list import _essential_terms
+
+    assert _essential_terms(("ice", "iceberg", "firn", "ice")) == ("iceberg", "firn")
+    assert _essential_terms(()) == ()
+
+
+async def test_sort_by_added_uses_formatted_dates() -> None:
+    entries = [
+        BibEntry(key="new", entry_type="misc", raw_fields={"date-added": "2024/05/01"}),
+        BibEntry(key="none", entry_type="misc"),
+        BibEntry(key="old", entry_type="misc", raw_fields={"dateadded": "2019-01-02"}),
+    ]
+    app = _ListApp(entries)
+    async with app.run_test():
+        el = app.query_one(EntryList)
+        el._sort_key = el._col_keys[9]  # Added
+        el._apply_sort()
+
+        assert [e.key for e in el.filtered_entries] == ["none", "old", "new"]
+
+
+async def test_remove_row_keeps_search_and_cursor() -> None:
+    entries = _entries() + [
+        BibEntry(key="c", entry_type="article", title="Alpine", year="2022")
+    ]
+    app = _ListApp(entries)
+    async with app.run_test() as pilot:
+        el = app.query_one(EntryList)
+        table = app.query_one(DataTable)
+        app.query_one(Input).value = "alp"
+        await _settle_search(app, pilot)
+        table.move_cursor(row=1)
+
+        remaining = [e for e in entries if e.key != "a"]
+        el.remove_row("a", remaining)
+        await pilot.pause()
+
+        assert [e.key for e in el.filtered_entries] == ["c"]
+        assert table.row_count == 1
+        assert el.selected_entry is remaining[1]
+
+        app.query_one(Input).value = "alpi"
+        await _settle_search(app, pilot)
+        assert [e.key for e in el.filtered_entries] == ["c"]
+
+
+async def test_refresh_row_keeps_index_for_unsearched_fields() -> None:
+    entries = _entries()
+    app = _ListApp(entries)
+    async with app.run_test() as pilot:
+        el = app.query_one(EntryList)
+        app.query_one(Input).value = "alpha"
+        await _settle_search(app, pilot)
+        index = el._search_index
+        assert index is not None
+
+        entries[1].rating = 3
+        el.refresh_row(entries[1])
+        assert el._search_index is index
+
+        entries[1].title = "Gamma"
+        el.refresh_row(entries[1])
+        assert el._search_index is None
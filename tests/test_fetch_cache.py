@@ -0,0 +1,147 @@
+import json
+import time
+
+import httpx
+
+from bibtui.bib.models import BibEntry
+from bibtui.pdf import fetcher as pdf_fetcher
+from bibtui.utils import fetch_cache
+
+
+def test_unknown_doi_returns_none() -> None:
+    assert fetch_cache.get_unpaywall_urls("10.1/a") is None
+
+
+def test_roundtrip_normalises_doi(cache_file, monkeypatch) -> None:
+    fetch_cache.store_unpaywall_urls(" 10.1/ABC ", ["https://x.org/a.pdf"])
+    fetch_cache.flush()
+    monkeypatch.setattr(fetch_cache, "_memory", None)
+
+    assert fetch_cache.get_unpaywall_urls("10.1/abc") == ["https://x.org/a.pdf"]
+    assert cache_file.exists()
+
+
+def test_negative_answer_is_cached() -> None:
+    fetch_cache.store_unpaywall_urls("10.1/a", [])
+    assert fetch_cache.get_unpaywall_urls("10.1/a") == []
+
+
+def test_expired_entry_returns_none(cache_file) -> None:
+    old = time.time() - fetch_cache.MAX_AGE - 1
+    cache_file.write_text(
+        json.dumps({"10.1/a": {"urls": ["u"], "fetched": old}}), encoding="utf-8"
+    )
+    assert fetch_cache.get_unpaywall_urls("10.1/a") is None
+
+
+def test_store_writes_only_on_flush(cache_file) -> None:
+    fetch_cache.store_unpaywall_urls("10.1/a", ["u"])
+    fetch_cache.store_unpaywall_urls("10.1/b", ["v"])
+    assert not cache_file.exists()
+
+    fetch_cache.flush()
+
+    assert set(json.loads(cache_file.read_text(encoding="utf-8"))) == {
+        "10.1/a",
+        "10.1/b",
+    }
+
+
+def test_expired_records_are_dropped_on_flush(cache_file) -> None:
+    old = time.time() - fetch_cache.MAX_AGE - 1
+    records = {
+        "10.1/old": {"urls": ["u"], "fetched": old},
+        "10.1/new": {"urls": ["v"], "fetched": time.time()},
+    }
+    cache_file.write_text(json.dumps(records), encoding="utf-8")
+
+    assert fetch_cache.get_unpaywall_urls("10.1/new") == ["v"]
+    fetch_cache.flush()
+
+    assert list(json.loads(cache_file.read_text(encoding="utf-8"))) == ["10.1/new"]
+
+
+def test_least_recently_used_entry_is_evicted(monkeypatch) -> None:
+    monkeypatch.setattr(fetch_cache, "MAX_ENTRIES", 2)
+    fetch_cache.store_unpaywall_urls("10.1/a", ["a"])
+    fetch_cache.store_unpaywall_urls("10.1/b", ["b"])
+    assert fetch_cache.get_unpaywall_urls("10.1/a") == ["a"]
+
+    fetch_cache.store_unpaywall_urls("10.1/c", ["c"])
+
+    assert fetch_cache.get_unpaywall_urls("10.1/b") is None
+    assert fetch_cache.get_unpaywall_urls("10.1/a") == ["a"]
+    assert fetch_cache.get_unpaywall_urls("10.1/c") == ["c"]
+
+
+def test_corrupt_file_is_ignored(cache_file) -> None:
+    cache_file.write_text("not json", encoding="utf-8")
+    assert fetch_cache.get_unpaywall_urls("10.1/a") is None
+
+
+def test_unwritable_cache_dir_is_ignored(tmp_path, monkeypatch) -> None:
+    blocker = tmp_path / "blocker"
+    blocker.write_text("", encoding="utf-8")
+    monkeypatch.setattr(fetch_cache, "CACHE_FILE", blocker / "unpaywall.json")
+
+    fetch_cache.store_unpaywall_urls("10.1/a", ["u"])
+    fetch_cache.flush()
+
+    assert fetch_cache.get_unpaywall_urls("10.1/a") == ["u"]
+    assert blocker.is_file()
+
+
+def _serve(monkeypatch, handler) -> None:
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(pdf_fetcher, "_client", client)
+
+
+def test_try_unpaywall_reuses_cached_lookup(monkeypatch, tmp_path) -> None:
+    entry = BibEntry(key="x", entry_type="article", doi="10.1/x")
+    body = {"best_oa_location": {"url_for_pdf": "https://x.org/x.pdf"}}
+    lookups: list[str] = []
+    downloads: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        lookups.append(str(request.url))
+        return httpx.Response(200, json=body)
+
+    _serve(monkeypatch, handler)
+    monkeypatch.setattr(
+        pdf_fetcher, "_download", lambda url, dest: downloads.append(url)
+    )
+
+    dest = str(tmp_path / "x.pdf")
+    assert pdf_fetcher._try_unpaywall(entry, dest, "me@example.com") is None
+    assert pdf_fetcher._try_unpaywall(entry, dest, "me@example.com") is None
+
+    assert len(lookups) == 1
+    assert downloads == ["https://x.org/x.pdf", "https://x.org/x.pdf"]
+
+
+def test_failed_lookup_is_not_cached(monkeypatch, tmp_path) -> None:
+    entry = BibEntry(key="x", entry_type="article", doi="10.1/x")
+    _serve(monkeypatch, lambda request: httpx.Response(503))
+
+    reason = pdf_fetcher._try_unpaywall(entry, str(tmp_path / "x.pdf"), "me@x.org")
+
+    assert reason == "Unpaywall lookup failed"
+    assert fetch_cache.get_unpaywall_urls("10.1/x") is None
+
+
+def test_unpaywall_urls_are_deduplicated_best_first(monkeypatch) -> None:
+    payload = {
+        "best_oa_location": {"url_for_pdf": "https://b.org/x.pdf"},
+        "oa_locations": [
+            {"url_for_pdf": "https://a.org/x.pdf"},
+            {"url_for_pdf": "https://b.org/x.pdf"},
+            {"url_for_pdf": None},
+            {"url_for_pdf": "https://a.org/x.pdf"},
+        ],
+    }
+    _serve(monkeypatch, lambda request: httpx.Response(200, json=payload))
+
+    assert pdf_fetcher._unpaywall_pdf_urls("10.1/x", "me@example.org") == [
+        "https://b.org/x.pdf",
+        "https://a.org/x.pdf",
+    ]
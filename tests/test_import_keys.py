@@ -88,3 +88,110 @@ def test_resolve_import_key_errors_when_suffixes_exhausted() -> None:
     assert key is None
     assert error is not None
     assert "a-z" in error
+
+
+def test_finalize_imported_entry_indexes_new_key(monkeypatch) -> None:
+    from bibtui.widgets.entry_list import EntryList
+
+    app = BibTuiApp("tests/bib_examples/MyCollection.bib")
+    app._entries = [BibEntry(key="Goelles2025", entry_type="article", title="A")]
+
+    class DummyList:
+        def append_row(self, entry: BibEntry) -> int | None:
+            return None
+
+    monkeypatch.setattr(
+        app,
+        "query_one",
+        lambda selector: DummyList() if selector is EntryList else None,
+    )
+    monkeypatch.setattr(app, "call_after_refresh", lambda *args, **kwargs: None)
+    monkeypatch.setattr(app, "notify", lambda message, **kwargs: None)
+    monkeypatch.setattr(app, "_maybe_auto_fetch", lambda entry: None)
+
+    app._finalize_imported_entry(
+        BibEntry(key="Goelles2025", entry_type="article", title="B")
+    )
+    key, error = app._resolve_import_key(
+        BibEntry(key="Goelles2025", entry_type="article", title="C")
+    )
+
+    assert app._index == {"Goelles2025": 0, "Goelles2025a": 1}
+    assert error is None
+    assert key == "Goelles2025b"
+
+
+def test_finalize_imported_entry_jumps_to_appended_row(monkeypatch) -> None:
+    from bibtui.widgets.entry_list import EntryList
+
+    app = BibTuiApp("tests/bib_examples/MyCollection.bib")
+    app._entries = [BibEntry(key="Goelles2025", entry_type="article", title="A")]
+    scheduled: list[tuple] = []
+
+    class DummyList:
+        def append_row(self, entry: BibEntry) -> int | None:
+            return 7
+
+    monkeypatch.setattr(
+        app,
+        "query_one",
+        lambda selector: DummyList() if selector is EntryList else None,
+    )
+    monkeypatch.setattr(
+        app, "call_after_refresh", lambda *args, **kwargs: scheduled.append(args)
+    )
+    monkeypatch.setattr(app, "notify", lambda message, **kwargs: None)
+    monkeypatch.setattr(app, "_maybe_auto_fetch", lambda entry: None)
+
+    entry = BibEntry(key="Smith2024", entry_type="article", title="B")
+    app._finalize_imported_entry(entry)
+
+    assert scheduled == [(app._jump_to_entry, entry, 7)]
+
+
+async def test_paste_modal_parses_in_worker() -> None:
+    from textual.app import App
+    from textual.widgets import Static
+
+    from bibtui.widgets.modals import PasteModal
+
+    results: list = []
+    modal = PasteModal("not bibtex")
+    app = App()
+    async with app.run_test() as pilot:
+        await app.push_screen(modal, results.append)
+        modal.action_do_import()
+        assert modal._btn_submit.disabled
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+        assert "Parse error" in str(modal.query_one("#paste-error", Static).content)
+        assert not modal._btn_submit.disabled
+
+        modal._area.text = "@article{Doe2024, title = {Ice}}"
+        modal.action_do_import()
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+
+    assert [e.key for e in results] == ["Doe2024"]
+
+
+async def test_raw_edit_modal_unchanged_text_skips_parse(monkeypatch) -> None:
+    from textual.app import App
+
+    from bibtui.widgets import modals
+
+    def fail(text: str) -> BibEntry:
+        raise AssertionError("parsed unchanged text")
+
+    monkeypatch.setattr(modals, "bibtex_str_to_entry", fail)
+    entry = BibEntry(key="Doe2024", entry_type="article", title="Ice")
+    results: list = []
+    modal = modals.RawEditModal(entry)
+    app = App()
+    async with app.run_test() as pilot:
+        await app.push_screen(modal, results.append)
+        modal.action_save()
+        await pilot.pause()
+
+    assert results == [entry]
+    assert results[0] is entry
@@ -1,5 +1,7 @@
 """Unit tests for bib_tui.bib.models.BibEntry."""
 
+import os
+
 import pytest
 
 from bibtui.bib.models import (
@@ -68,6 +70,22 @@ def test_title_short_truncates_long_title() -> None:
     assert len(e.title_short) == 60
 
 
+def test_short_forms_follow_field_writes(entry: BibEntry) -> None:
+    assert entry.authors_short == "Smith"
+    assert entry.title_short == "Glacial Dynamics in the 21st Century"
+    entry.author = "Jane Doe"
+    entry.set_field("title", "Ice Sheets")
+    assert entry.authors_short == "Doe"
+    assert entry.title_short == "Ice Sheets"
+
+
+def test_short_form_cache_ignored_by_equality() -> None:
+    a = BibEntry(key="k", entry_type="article", author="Smith, John")
+    b = BibEntry(key="k", entry_type="article", author="Smith, John")
+    assert a.authors_short == "Smith"
+    assert a == b
+
+
 # ---------------------------------------------------------------------------
 # url_icon
 # ---------------------------------------------------------------------------
@@ -154,6 +172,14 @@ def test_keywords_list_strips_whitespace() -> None:
     assert e.keywords_list == ["ice", "snow", "water"]
 
 
+def test_keywords_list_follows_keyword_writes(entry: BibEntry) -> None:
+    assert entry.keywords_list is entry.keywords_list
+    entry.keywords = "firn"
+    assert entry.keywords_list == ["firn"]
+    entry.set_field("keywords", "ice, snow")
+    assert entry.keywords_list == ["ice", "snow"]
+
+
 # ---------------------------------------------------------------------------
 # rating_stars
 # ---------------------------------------------------------------------------
@@ -225,3 +251,59 @@ def test_set_field_unknown_goes_to_raw() -> None:
     e = BibEntry(key="k", entry_type="article")
     e.set_field("volume", "7")
     assert e.raw_fields["volume"] == "7"
+
+
+def test_entry_has_no_instance_dict(entry: BibEntry) -> None:
+    assert not hasattr(entry, "__dict__")
+    with pytest.raises(AttributeError):
+        entry.not_a_field = "x"  # type: ignore[attr-defined]
+
+
+def test_resolved_file_follows_file_and_base_dir() -> None:
+    e = BibEntry(key="k", entry_type="article", file=":Smith2023.pdf:PDF")
+    assert e.resolved_file() == "Smith2023.pdf"
+    assert e.resolved_file("/papers") == os.path.join("/papers", "Smith2023.pdf")
+    e.file = ":Other.pdf:PDF"
+    assert e.resolved_file("/papers") == os.path.join("/papers", "Other.pdf")
+    e.file = ""
+    assert e.resolved_file("/papers") == ""
+
+
+# ---------------------------------------------------------------------------
+# search_blob
+# ---------------------------------------------------------------------------
+
+
+def test_search_blob_covers_free_text_fields(entry: BibEntry) -> None:
+    blob = entry.search_blob
+    assert "glacial dynamics" in blob
+    assert "jones, mary" in blob
+    assert "climate" in blob
+    assert "smith2023" in blob
+    assert "nature" not in blob
+
+
+def test_search_blob_follows_field_writes(entry: BibEntry) -> None:
+    assert "firn" not in entry.search_blob
+    entry.keywords = "firn"
+    assert "firn" in entry.search_blob
+    entry.key = "Doe2024"
+    assert "doe2024" in entry.search_blob
+
+
+def test_lowered_follows_field_writes(entry: BibEntry) -> None:
+    assert entry.lowered("title") == "glacial dynamics in the 21st century"
+    assert entry.lowered("title") is entry.lowered("title")
+    entry.title = "Firn AIR"
+    assert entry.lowered("title") == "firn air"
+    entry.set_field("author", "DOE, Jane")
+    assert entry.lowered("author") == "doe, jane"
+
+
+def test_year_number() -> None:
+    e = BibEntry(key="k", entry_type="article", year="2019")
+    assert e.year_number == 2019
+    e.year = "in press"
+    assert e.year_number == 0
+    e.set_field("year", "2021")
+    assert e.year_number == 2021
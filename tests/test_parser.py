@@ -1,5 +1,6 @@
 """Unit tests for bib_tui.bib.parser."""
 
+import os
 from pathlib import Path
 
 import pytest
@@ -44,6 +45,78 @@ def test_load_mycollection() -> None:
     assert len(entries) >= 1
 
 
+def test_load_in_batches_matches_whole_file_parse(monkeypatch) -> None:
+    whole = [
+        parser_mod._to_bib_entry(e)
+        for e in bibtexparser_lib.parse_file(str(MY_COLLECTION)).entries
+    ]
+    monkeypatch.setattr(parser_mod, "_LOAD_BATCH_CHARS", 20_000)
+    assert load(str(MY_COLLECTION)) == whole
+
+
+def test_load_parses_batches_in_worker_processes(monkeypatch) -> None:
+    sequential = load(str(MY_COLLECTION))
+    monkeypatch.setattr(parser_mod.os, "cpu_count", lambda: 2)
+    monkeypatch.setattr(parser_mod, "_LOAD_BATCH_CHARS", 600_000)
+    monkeypatch.setattr(parser_mod, "_PARALLEL_MIN_BATCHES", 2)
+    pools: list[object] = []
+    real_pool = parser_mod.ProcessPoolExecutor
+
+    def recording_pool(*args, **kwargs):
+        pools.append(kwargs)
+        return real_pool(*args, **kwargs)
+
+    monkeypatch.setattr(parser_mod, "ProcessPoolExecutor", recording_pool)
+
+    assert load(str(MY_COLLECTION)) == sequential
+    assert len(pools) == 1
+
+
+def test_load_in_batches_resolves_strings_and_keeps_first_duplicate(
+    tmp_path, monkeypatch
+) -> None:
+    bib = tmp_path / "lib.bib"
+    bib.write_text(
+        "@string{nat = {Nature}}\n"
+        "@article{a, title = {First}, journal = nat}\n"
+        "@article{b, title = {Second}, journal = nat}\n"
+        "@article{a, title = {Duplicate}}\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(parser_mod, "_LOAD_BATCH_CHARS", 1)
+
+    entries = list(parser_mod.iload(str(bib)))
+
+    assert [(e.key, e.title, e.journal) for e in entries] == [
+        ("a", "First", "Nature"),
+        ("b", "Second", "Nature"),
+    ]
+
+
+def test_load_in_batches_passes_each_string_once(tmp_path, monkeypatch) -> None:
+    text = "".join(
+        f"@string{{j{i} = {{Journal {i}}}}}\n"
+        f"@article{{k{i}, title = {{T{i}}}, journal = j{i}, publisher = j0}}\n"
+        for i in range(40)
+    )
+    bib = tmp_path / "lib.bib"
+    bib.write_text(text, encoding="utf-8")
+    whole = [
+        parser_mod._to_bib_entry(e) for e in bibtexparser_lib.parse_string(text).entries
+    ]
+    monkeypatch.setattr(parser_mod, "_LOAD_BATCH_CHARS", 300)
+
+    batches = list(parser_mod._iter_load_batches(text))
+
+    assert len(batches) > 1
+    for batch, strings in batches:
+        assert not set(strings.splitlines()) & set(batch.splitlines())
+    assert "".join(batch for batch, _ in batches) == text
+    assert load(str(bib)) == whole
+    assert whole[-1].journal == "Journal 39"
+    assert whole[-1].raw_fields["publisher"] == "Journal 0"
+
+
 # ---------------------------------------------------------------------------
 # entry_to_bibtex_str / bibtex_str_to_entry round-trip
 # ---------------------------------------------------------------------------
@@ -71,6 +144,15 @@ def test_parse_simple_bibtex() -> None:
     assert e.doi == "10.1000/test"
 
 
+def test_parse_field_names_case_insensitively() -> None:
+    e = bibtex_str_to_entry(
+        "@article{k, TITLE = {{Upper}}, Ranking = {rank3}, Volume = {7}}\n"
+    )
+    assert e.title == "Upper"
+    assert e.rating == 3
+    assert e.raw_fields == {"volume": "7"}
+
+
 def test_round_trip_basic_fields() -> None:
     original = BibEntry(
         key="Jones2020",
@@ -140,6 +222,16 @@ def test_round_trip_url_and_file() -> None:
     assert recovered.file == ":paper.pdf:PDF"
 
 
+def test_entry_to_bibtex_str_follows_field_writes() -> None:
+    entry = BibEntry(key="k", entry_type="article", title="T", rating=2)
+    first = entry_to_bibtex_str(entry)
+    assert entry_to_bibtex_str(entry) is first
+    entry.title = "Other"
+    assert "Other" in entry_to_bibtex_str(entry)
+    entry.raw_fields["volume"] = "7"
+    assert "volume = {7}" in entry_to_bibtex_str(entry)
+
+
 def test_invalid_bibtex_raises() -> None:
     with pytest.raises(Exception):
         bibtex_str_to_entry("this is not bibtex at all")
@@ -221,6 +313,48 @@ def test_save_noop_preserves_ex1_bytes(tmp_path) -> None:
     assert dst.read_text(encoding="utf-8") == original_text
 
 
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permissions and symlinks")
+def test_save_replaces_symlink_target_and_keeps_mode(tmp_path) -> None:
+    real = tmp_path / "real.bib"
+    real.write_text(EX1_BIB.read_text(encoding="utf-8"), encoding="utf-8")
+    real.chmod(0o640)
+    link = tmp_path / "link.bib"
+    link.symlink_to(real)
+
+    entries = load(str(link))
+    entries[0].title = "Changed"
+    save(entries, str(link))
+
+    assert link.is_symlink()
+    assert real.stat().st_mode & 0o777 == 0o640
+    assert load(str(real))[0].title == "Changed"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["link.bib", "real.bib"]
+
+    new = tmp_path / "new.bib"
+    save(entries, str(new))
+    reference = tmp_path / "reference.bib"
+    reference.touch()
+    assert new.stat().st_mode & 0o777 == reference.stat().st_mode & 0o777
+
+
+def test_save_failure_leaves_original_and_no_temp_file(tmp_path, monkeypatch) -> None:
+    dst = tmp_path / "lib.bib"
+    original_text = EX1_BIB.read_text(encoding="utf-8")
+    dst.write_text(original_text, encoding="utf-8")
+    entries = load(str(dst))
+    entries[0].title = "Changed"
+
+    def fail(src, target):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(parser_mod.os, "replace", fail)
+    with pytest.raises(OSError):
+        save(entries, str(dst))
+
+    assert dst.read_text(encoding="utf-8") == original_text
+    assert [p.name for p in tmp_path.iterdir()] == ["lib.bib"]
+
+
 def test_save_rewrites_only_changed_entry_block(tmp_path) -> None:
     source = """% keep this header exactly
 @ARTICLE{KeyA,
@@ -551,3 +685,19 @@ def test_bibtexparser_field_start_line_is_absolute() -> None:
     # Confirm relative offset calculation used by _patch_entry_block is correct.
     assert b_year.start_line - b.start_line == 1  # first field line in block
     assert b_author.start_line - b.start_line == 2  # second field line in block
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("{Ice Sheets}", "Ice Sheets"),
+        ("  {Ice} ", "Ice"),
+        ("{}", ""),
+        ("{", "{"),
+        ("", ""),
+        ("plain", "plain"),
+    ],
+)
+def test_field_value_strips_outer_braces(raw: str, expected: str) -> None:
+    field = bibtexparser_lib.model.Field("title", raw)
+    assert parser_mod._field_value(field) == expected
@@ -11,6 +11,12 @@ Run all including network tests:
     uv run pytest tests/test_pdf_fetcher.py
 """
 
+import os
+import threading
+import time
+
+import httpx
+import pyalex  # type: ignore[import-untyped]
 import pytest
 
 from bibtui.bib.models import BibEntry
@@ -25,6 +31,7 @@ from bibtui.pdf.fetcher import (
     _try_openalex,
     _try_unpaywall,
     fetch_pdf,
+    fetch_pdfs_bulk,
     pdf_filename,
 )
 from bibtui.utils.config import load_config
@@ -104,6 +111,20 @@ def test_arxiv_id_from_url_pdf():
     assert _arxiv_id(e) == "2301.12345"
 
 
+def test_arxiv_id_from_url_ignores_query_and_fragment():
+    e = BibEntry(
+        key="x",
+        entry_type="article",
+        url="https://arxiv.org/abs/2301.12345v3?context=physics#section",
+    )
+    assert _arxiv_id(e) == "2301.12345"
+
+
+def test_arxiv_id_from_lowercase_doi():
+    e = BibEntry(key="x", entry_type="article", doi="10.48550/ARXIV.2301.12345")
+    assert _arxiv_id(e) == "2301.12345"
+
+
 def test_arxiv_id_none_for_regular_doi():
     e = BibEntry(key="x", entry_type="article", doi="10.1007/s10584-020-02936-7")
     assert _arxiv_id(e) is None
@@ -114,6 +135,44 @@ def test_arxiv_id_none_when_no_doi_or_url():
     assert _arxiv_id(e) is None
 
 
+def test_resolve_ids_synthesises_arxiv_doi_from_url():
+    e = BibEntry(key="x", entry_type="article", url="https://arxiv.org/abs/2301.12345")
+    assert pdf_fetcher._resolve_ids(e) == ("2301.12345", "10.48550/arXiv.2301.12345")
+
+
+def test_resolve_ids_keeps_existing_doi():
+    e = BibEntry(
+        key="x",
+        entry_type="article",
+        doi="https://doi.org/10.1000/xyz",
+        url="https://arxiv.org/abs/2301.12345",
+    )
+    assert pdf_fetcher._resolve_ids(e) == ("2301.12345", "10.1000/xyz")
+
+
+def test_fetch_pdf_passes_resolved_ids_to_strategies(monkeypatch, tmp_path):
+    e = BibEntry(key="x", entry_type="article", url="https://arxiv.org/abs/2301.12345")
+    seen: dict[str, object] = {}
+
+    def fake_arxiv(entry, dest_path, arxiv_id=None):
+        seen["arxiv_id"] = arxiv_id
+        return "miss"
+
+    def fake_openalex(entry, dest_path, api_key, doi=None):
+        seen["doi"] = doi
+        return "miss"
+
+    monkeypatch.setattr(pdf_fetcher, "_try_arxiv", fake_arxiv)
+    monkeypatch.setattr(pdf_fetcher, "_try_openalex", fake_openalex)
+    for name in ("_try_copernicus", "_try_unpaywall", "_try_direct_url"):
+        monkeypatch.setattr(pdf_fetcher, name, lambda *_args, **_kwargs: "miss")
+
+    with pytest.raises(FetchError):
+        fetch_pdf(e, dest_dir=str(tmp_path), openalex_api_key="key")
+
+    assert seen == {"arxiv_id": "2301.12345", "doi": "10.48550/arXiv.2301.12345"}
+
+
 def test_fetch_pdf_raises_when_no_dest_dir():
     e = BibEntry(key="x", entry_type="article", doi="10.5194/tc-18-3807-2024")
     with pytest.raises(FetchError, match="PDF base directory is not set"):
@@ -212,49 +271,236 @@ def test_try_copernicus_non_copernicus_doi(tmp_path) -> None:
     assert "not a recognised Copernicus DOI" in reason
 
 
-def test_try_direct_url_falls_back_to_get_when_head_fails(monkeypatch, tmp_path):
-    entry = BibEntry(key="x", entry_type="article", url="https://example.org/paper.pdf")
-    dest = str(tmp_path / "x.pdf")
-    called: list[tuple[str, str]] = []
+def _serve(monkeypatch, handler) -> None:
+    """Route the fetcher's HTTP client through *handler*."""
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(pdf_fetcher, "_client", client)
 
-    def fake_urlopen(req, timeout=0):
-        if req.get_method() == "HEAD":
-            raise OSError("HEAD blocked")
-        raise AssertionError("GET should be handled by _download, not urlopen here")
 
-    def fake_download(url: str, dest_path: str, timeout: int = 30) -> None:
-        called.append((url, dest_path))
+def _pdf_response(body: bytes, content_type: str = "application/pdf"):
+    return lambda request: httpx.Response(
+        200, headers={"Content-Type": content_type}, content=body
+    )
 
-    monkeypatch.setattr(pdf_fetcher.urllib.request, "urlopen", fake_urlopen)
-    monkeypatch.setattr(pdf_fetcher, "_download", fake_download)
 
-    reason = _try_direct_url(entry, dest)
-    assert reason is None
-    assert called == [(entry.url, dest)]
+def test_try_direct_url_downloads_without_head_request(monkeypatch, tmp_path):
+    entry = BibEntry(key="x", entry_type="article", url="https://example.org/paper")
+    dest = tmp_path / "x.pdf"
+    methods: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        methods.append(request.method)
+        return _pdf_response(b"%PDF-1.4 fake", "application/octet-stream")(request)
+
+    _serve(monkeypatch, handler)
+
+    assert _try_direct_url(entry, str(dest)) is None
+    assert methods == ["GET"]
+    assert dest.read_bytes() == b"%PDF-1.4 fake"
+
+
+def test_try_direct_url_rejects_html_labelled_as_pdf(monkeypatch, tmp_path):
+    entry = BibEntry(key="x", entry_type="article", url="https://example.org/paper")
+    dest = tmp_path / "x.pdf"
+    _serve(monkeypatch, _pdf_response(b"<html>Access denied</html>"))
+
+    reason = _try_direct_url(entry, str(dest))
+    assert reason is not None
+    assert "did not return a PDF" in reason
+    assert not dest.exists()
+
+
+def test_download_reports_http_errors(monkeypatch, tmp_path):
+    _serve(monkeypatch, lambda request: httpx.Response(404))
+
+    with pytest.raises(FetchError, match="HTTP 404"):
+        pdf_fetcher._download("https://example.org/x.pdf", str(tmp_path / "x.pdf"))
+
+
+def test_download_copies_large_body_intact(monkeypatch, tmp_path):
+    dest = tmp_path / "x.pdf"
+    body = b"%PDF-1.4" + bytes(range(256)) * 12_000
+    _serve(monkeypatch, _pdf_response(body))
+
+    pdf_fetcher._download("https://example.org/x.pdf", str(dest))
+    assert dest.read_bytes() == body
+
+
+def test_download_rejects_oversized_pdf(monkeypatch, tmp_path):
+    dest = tmp_path / "x.pdf"
+    body = b"%PDF-1.4" + b"0" * 2_000_000
+    _serve(monkeypatch, _pdf_response(body))
+
+    with pytest.raises(FetchError, match="exceeds"):
+        pdf_fetcher._download(
+            "https://example.org/x.pdf", str(dest), max_bytes=1_500_000
+        )
+    assert not dest.exists()
+    assert list(tmp_path.iterdir()) == []
+
+
+class _DroppedStream(httpx.SyncByteStream):
+    """A response body that breaks off after *head* bytes."""
+
+    def __init__(self, head: bytes) -> None:
+        self._head = head
+
+    def __iter__(self):
+        yield self._head
+        raise httpx.ReadError("connection reset")
+
+
+def test_download_resumes_interrupted_transfer(monkeypatch, tmp_path):
+    dest = tmp_path / "x.pdf"
+    body = b"%PDF-1.4" + bytes(range(256)) * 8_000  # ~2 MiB
+    cut = 1024 * 1024 + 100
+    ranges: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        spec = request.headers.get("Range")
+        ranges.append(spec)
+        if spec is None:
+            return httpx.Response(200, stream=_DroppedStream(body[:cut]))
+        start = int(spec.removeprefix("bytes=").rstrip("-"))
+        return httpx.Response(206, content=body[start:])
+
+    _serve(monkeypatch, handler)
+    url = "https://example.org/x.pdf"
 
+    with pytest.raises(FetchError, match="connection reset"):
+        pdf_fetcher._download(url, str(dest))
+    assert not dest.exists()
+    part = pdf_fetcher._partial_path(url, str(dest))
+    kept = os.path.getsize(part)
+    assert 0 < kept <= cut
 
-def test_try_direct_url_rejects_non_pdf_content_type(monkeypatch, tmp_path):
-    entry = BibEntry(key="x", entry_type="article", url="https://example.org/page")
+    pdf_fetcher._download(url, str(dest))
+
+    assert ranges == [None, f"bytes={kept}-"]
+    assert dest.read_bytes() == body
+    assert not os.path.exists(part)
+
+
+def test_fetch_pdf_removes_resume_files_after_later_strategy_wins(
+    monkeypatch, tmp_path
+):
+    entry = BibEntry(
+        key="x",
+        entry_type="article",
+        doi="10.5194/tc-17-1585-2023",
+        url="https://example.org/x.pdf",
+    )
+    body = b"%PDF-1.4" + bytes(range(256)) * 8_000  # ~2 MiB
+    cut = 1024 * 1024 + 100  # past the first copy chunk, so it is kept
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "tc.copernicus.org":
+            return httpx.Response(200, stream=_DroppedStream(body[:cut]))
+        return httpx.Response(200, content=body)
+
+    _serve(monkeypatch, handler)
+
+    result = fetch_pdf(entry, dest_dir=str(tmp_path))
+
+    assert result.provider == "Direct URL"
+    assert [p.name for p in tmp_path.iterdir()] == [pdf_filename(entry)]
+
+
+def test_download_restarts_when_range_is_ignored(monkeypatch, tmp_path):
+    dest = tmp_path / "x.pdf"
+    body = b"%PDF-1.4 complete"
+    url = "https://example.org/x.pdf"
+    part = pdf_fetcher._partial_path(url, str(dest))
+    with open(part, "wb") as f:
+        f.write(b"%PDF-1.4 stale bytes")
+    _serve(monkeypatch, _pdf_response(body))
+
+    pdf_fetcher._download(url, str(dest))
+
+    assert dest.read_bytes() == body
+    assert not os.path.exists(part)
+
+
+def test_partial_path_is_per_url(tmp_path):
     dest = str(tmp_path / "x.pdf")
+    a = pdf_fetcher._partial_path("https://a.org/x.pdf", dest)
+    b = pdf_fetcher._partial_path("https://b.org/x.pdf", dest)
+    assert a != b
+    assert os.path.dirname(a) == str(tmp_path)
+
+
+def _ranged_server(body: bytes, requests: list[str], accept_ranges: str = "bytes"):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "HEAD":
+            requests.append("HEAD")
+            return httpx.Response(
+                200,
+                headers={
+                    "Accept-Ranges": accept_ranges,
+                    "Content-Length": str(len(body)),
+                },
+            )
+        spec = request.headers.get("Range")
+        requests.append(spec or "GET")
+        if not spec:
+            return httpx.Response(200, content=body)
+        start, end = (int(x) for x in spec.removeprefix("bytes=").split("-"))
+        return httpx.Response(206, content=body[start : end + 1])
+
+    return handler
+
+
+def test_download_ranged_assembles_parts(monkeypatch, tmp_path):
+    dest = tmp_path / "x.pdf"
+    body = b"%PDF-1.4" + bytes(range(256)) * 20_000  # ~5 MiB
+    requests: list[str] = []
+    _serve(monkeypatch, _ranged_server(body, requests))
+
+    pdf_fetcher._download_ranged("https://arxiv.org/pdf/x", str(dest), n_parts=4)
+
+    assert dest.read_bytes() == body
+    assert requests[0] == "HEAD"
+    assert sorted(requests[1:]) == sorted(
+        [
+            "bytes=0-1280001",
+            "bytes=1280002-2560003",
+            "bytes=2560004-3840005",
+            "bytes=3840006-5120007",
+        ]
+    )
+    assert list(tmp_path.iterdir()) == [dest]
 
-    class FakeHeadResponse:
-        headers = {"Content-Type": "text/html"}
 
-        def __enter__(self):
-            return self
+def test_download_ranged_falls_back_without_range_support(monkeypatch, tmp_path):
+    dest = tmp_path / "x.pdf"
+    body = b"%PDF-1.4" + b"0" * (5 * 1024 * 1024)
+    requests: list[str] = []
+    _serve(monkeypatch, _ranged_server(body, requests, accept_ranges="none"))
 
-        def __exit__(self, exc_type, exc, tb):
-            return False
+    pdf_fetcher._download_ranged("https://arxiv.org/pdf/x", str(dest))
 
-    def fake_urlopen(req, timeout=0):
-        assert req.get_method() == "HEAD"
-        return FakeHeadResponse()
+    assert dest.read_bytes() == body
+    assert requests == ["HEAD", "GET"]
 
-    monkeypatch.setattr(pdf_fetcher.urllib.request, "urlopen", fake_urlopen)
 
-    reason = _try_direct_url(entry, dest)
-    assert reason is not None
-    assert "does not serve a PDF" in reason
+def test_download_ranged_rejects_non_pdf(monkeypatch, tmp_path):
+    dest = tmp_path / "x.pdf"
+    body = b"<html>" + b"0" * (5 * 1024 * 1024)
+    _serve(monkeypatch, _ranged_server(body, []))
+
+    with pytest.raises(FetchError, match="did not return a PDF"):
+        pdf_fetcher._download_ranged("https://arxiv.org/pdf/x", str(dest))
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_http_client_is_shared(monkeypatch) -> None:
+    monkeypatch.setattr(pdf_fetcher, "_client", None)
+    client = pdf_fetcher._http()
+    try:
+        assert pdf_fetcher._http() is client
+        assert client.follow_redirects
+    finally:
+        client.close()
 
 
 def test_try_openalex_requires_doi(tmp_path) -> None:
@@ -305,7 +551,7 @@ def test_try_openalex_uses_best_pdf_url(monkeypatch, tmp_path) -> None:
     def fake_write_pdf_bytes(pdf_bytes: bytes, dest_path: str) -> None:
         called.append((pdf_bytes, dest_path))
 
-    monkeypatch.setattr(pdf_fetcher.pyalex, "Works", lambda: fake_works)
+    monkeypatch.setattr(pyalex, "Works", lambda: fake_works)
     monkeypatch.setattr(pdf_fetcher, "_write_pdf_bytes", fake_write_pdf_bytes)
 
     reason = _try_openalex(e, dest, api_key="test-key")
@@ -346,7 +592,7 @@ def test_try_openalex_uses_title_search_when_no_doi(monkeypatch, tmp_path) -> No
             assert work_id == "W2046172844"
             return type("FakeWork", (), {"pdf": FakePDF()})()
 
-    monkeypatch.setattr(pdf_fetcher.pyalex, "Works", lambda: FakeWorks())
+    monkeypatch.setattr(pyalex, "Works", lambda: FakeWorks())
 
     reason = _try_openalex(e, dest, api_key="test-key")
     assert reason is None
@@ -384,7 +630,7 @@ def test_try_openalex_prefers_doi_before_title(monkeypatch, tmp_path) -> None:
             assert work_id == "W123"
             return type("FakeWork", (), {"pdf": FakePDF()})()
 
-    monkeypatch.setattr(pdf_fetcher.pyalex, "Works", lambda: FakeWorks())
+    monkeypatch.setattr(pyalex, "Works", lambda: FakeWorks())
 
     reason = _try_openalex(e, dest, api_key="test-key")
     assert reason is None
@@ -420,7 +666,7 @@ def test_try_openalex_does_not_fallback_to_title_when_doi_misses(
         def get(self, per_page=None):
             return []
 
-    monkeypatch.setattr(pdf_fetcher.pyalex, "Works", lambda: FakeWorks())
+    monkeypatch.setattr(pyalex, "Works", lambda: FakeWorks())
 
     reason = _try_openalex(e, dest, api_key="test-key")
     assert reason == "no OpenAlex work found for DOI"
@@ -477,7 +723,7 @@ def test_try_openalex_uses_content_pdf_for_joughin2008(monkeypatch, tmp_path) ->
     def fake_write_pdf_bytes(pdf_bytes: bytes, dest_path: str) -> None:
         called.append((pdf_bytes, dest_path))
 
-    monkeypatch.setattr(pdf_fetcher.pyalex, "Works", lambda: FakeWorks())
+    monkeypatch.setattr(pyalex, "Works", lambda: FakeWorks())
     monkeypatch.setattr(pdf_fetcher, "_write_pdf_bytes", fake_write_pdf_bytes)
 
     reason = _try_openalex(e, dest, api_key="test-key")
@@ -518,7 +764,7 @@ def test_try_openalex_falls_back_from_blocked_publisher_pdf_to_content_pdf(
         if "wiley.com" in url:
             raise FetchError("URL did not return a PDF")
 
-    monkeypatch.setattr(pdf_fetcher.pyalex, "Works", lambda: FakeWorks())
+    monkeypatch.setattr(pyalex, "Works", lambda: FakeWorks())
     monkeypatch.setattr(pdf_fetcher, "_download", fake_download)
 
     reason = _try_openalex(e, dest, api_key="test-key")
@@ -589,6 +835,127 @@ def test_fetch_pdf_skips_openalex_without_api_key(monkeypatch, tmp_path) -> None
     assert "OpenAlex" not in str(exc_info.value)
 
 
+def test_fetch_pdfs_bulk_overlaps_entries(monkeypatch, tmp_path) -> None:
+    entries = [
+        BibEntry(key="a", entry_type="article", doi="10.1/a"),
+        BibEntry(key="b", entry_type="article", doi="10.1/b"),
+    ]
+    # Each arXiv attempt waits for the other: only succeeds if both run at once.
+    both_running = threading.Barrier(2, timeout=5)
+
+    def fake_arxiv(entry, dest_path, arxiv_id=None):
+        both_running.wait()
+        return None if entry.key == "a" else "miss"
+
+    monkeypatch.setattr(pdf_fetcher, "_try_arxiv", fake_arxiv)
+    for name in ("_try_copernicus", "_try_unpaywall", "_try_direct_url"):
+        monkeypatch.setattr(pdf_fetcher, name, lambda *_args, **_kwargs: "miss")
+
+    results = {
+        entry.key: result
+        for entry, result in fetch_pdfs_bulk(entries, str(tmp_path), max_workers=2)
+    }
+
+    assert isinstance(results["a"], FetchResult)
+    assert results["a"].provider == "arXiv"
+    assert isinstance(results["b"], FetchError)
+
+
+def test_fetch_pdf_race_keeps_cascade_priority(monkeypatch, tmp_path) -> None:
+    e = BibEntry(key="x", entry_type="article", doi="10.1/x")
+    unpaywall_done = threading.Event()
+
+    def slow_arxiv(entry, dest_path, arxiv_id=None):
+        # Succeeds only after a lower-priority strategy has already succeeded.
+        assert unpaywall_done.wait(5)
+        with open(dest_path, "wb") as f:
+            f.write(b"%PDF-1.4 arxiv")
+
+    def fast_unpaywall(entry, dest_path, email):
+        with open(dest_path, "wb") as f:
+            f.write(b"%PDF-1.4 unpaywall")
+        unpaywall_done.set()
+
+    monkeypatch.setattr(pdf_fetcher, "_try_arxiv", slow_arxiv)
+    monkeypatch.setattr(pdf_fetcher, "_try_unpaywall", fast_unpaywall)
+    for name in ("_try_copernicus", "_try_direct_url"):
+        monkeypatch.setattr(pdf_fetcher, name, lambda *_args, **_kwargs: "miss")
+
+    result = fetch_pdf(e, dest_dir=str(tmp_path), race=True)
+
+    assert result.provider == "arXiv"
+    with open(result.path, "rb") as f:
+        assert f.read() == b"%PDF-1.4 arxiv"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["x.pdf"]
+
+
+class _EndlessStream(httpx.SyncByteStream):
+    """A PDF body that keeps coming until the reader stops."""
+
+    def __init__(self) -> None:
+        self.closed = threading.Event()
+
+    def __iter__(self):
+        yield b"%PDF-1.4"
+        while True:
+            time.sleep(0.001)
+            yield bytes(64 * 1024)
+
+    def close(self) -> None:
+        self.closed.set()
+
+
+def test_fetch_pdf_race_cancels_losing_downloads(monkeypatch, tmp_path) -> None:
+    e = BibEntry(key="x", entry_type="article", url="https://example.org/x.pdf")
+    stream = _EndlessStream()
+    started = threading.Event()
+
+    def handler(request):
+        started.set()
+        return httpx.Response(
+            200, headers={"Content-Type": "application/pdf"}, stream=stream
+        )
+
+    def arxiv(entry, dest_path, arxiv_id=None):
+        # Wins only once the Direct URL download is under way.
+        assert started.wait(5)
+        with open(dest_path, "wb") as f:
+            f.write(b"%PDF-1.4 arxiv")
+
+    _serve(monkeypatch, handler)
+    monkeypatch.setattr(pdf_fetcher, "_try_arxiv", arxiv)
+    for name in ("_try_copernicus", "_try_unpaywall"):
+        monkeypatch.setattr(pdf_fetcher, name, lambda *_args, **_kwargs: "miss")
+
+    result = fetch_pdf(e, dest_dir=str(tmp_path), race=True)
+
+    assert result.provider == "arXiv"
+    assert stream.closed.wait(5)
+    deadline = time.monotonic() + 5
+    while len(list(tmp_path.iterdir())) > 1 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["x.pdf"]
+    assert not pdf_fetcher._race_cancels
+
+
+def test_fetch_pdf_race_runs_strategies_together(monkeypatch, tmp_path) -> None:
+    e = BibEntry(key="x", entry_type="article")
+    # Every strategy waits for all the others: only passes if they overlap.
+    all_running = threading.Barrier(4, timeout=5)
+
+    def miss(*_args, **_kwargs):
+        all_running.wait()
+        return "miss"
+
+    for name in ("_try_arxiv", "_try_copernicus", "_try_unpaywall", "_try_direct_url"):
+        monkeypatch.setattr(pdf_fetcher, name, miss)
+
+    with pytest.raises(FetchError) as exc_info:
+        fetch_pdf(e, dest_dir=str(tmp_path), race=True)
+
+    assert str(exc_info.value).count("miss") == 4
+
+
 # ---------------------------------------------------------------------------
 # pdf_filename unit tests
 # ---------------------------------------------------------------------------
@@ -0,0 +1,50 @@
+import pytest
+
+from bibtui.utils import theme
+
+
+@pytest.fixture(autouse=True)
+def omarchy_dir(tmp_path, monkeypatch):
+    current = tmp_path / "current"
+    theme_dir = current / "theme"
+    theme_dir.mkdir(parents=True)
+    monkeypatch.setattr(theme, "_OMARCHY_THEME_NAME", current / "theme.name")
+    monkeypatch.setattr(theme, "_OMARCHY_THEME_DIR", theme_dir)
+    monkeypatch.setattr(theme, "_OMARCHY_COLORS_TOML", theme_dir / "colors.toml")
+    theme._omarchy_theme_for.cache_clear()
+    yield current
+    theme._omarchy_theme_for.cache_clear()
+
+
+def test_no_omarchy_falls_back_to_dark() -> None:
+    assert theme.get_omarchy_theme() == ("textual-dark", None)
+
+
+def test_unchanged_files_are_not_reread(omarchy_dir, monkeypatch) -> None:
+    (omarchy_dir / "theme.name").write_text("nord\n", encoding="utf-8")
+    assert theme.get_omarchy_theme() == ("nord", None)
+
+    def fail() -> str:
+        raise AssertionError("theme.name re-read although unchanged")
+
+    monkeypatch.setattr(theme, "_omarchy_theme_name", fail)
+    assert theme.get_omarchy_theme() == ("nord", None)
+
+
+def test_theme_switch_is_picked_up(omarchy_dir) -> None:
+    (omarchy_dir / "theme.name").write_text("nord\n", encoding="utf-8")
+    assert theme.get_omarchy_theme() == ("nord", None)
+
+    (omarchy_dir / "theme.name").write_text("dracula\n", encoding="utf-8")
+    assert theme.get_omarchy_theme() == ("dracula", None)
+
+
+def test_custom_theme_built_from_colors(omarchy_dir) -> None:
+    (omarchy_dir / "theme.name").write_text("mytheme\n", encoding="utf-8")
+    (omarchy_dir / "theme" / "colors.toml").write_text(
+        'background = "#ffffff"\naccent = "#123456"\n', encoding="utf-8"
+    )
+    name, custom = theme.get_omarchy_theme()
+    assert name == "omarchy-mytheme"
+    assert custom is not None
+    assert custom.dark is False